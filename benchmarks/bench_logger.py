@@ -0,0 +1,75 @@
+"""Microbenchmark for the Logger call path.
+
+Run from the repository root::
+
+    python benchmarks/bench_logger.py [--calls N] [--repeat R]
+
+Prints the best per-call time of each case.  Messages differ between calls
+(except in the coalesced case) so every call records a new entry.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+from itertools import count
+
+from pytest_reporter._logger import LogFilter, Logger
+
+
+def _error() -> ValueError:
+    try:
+        raise ValueError("bad reading")
+    except ValueError as err:
+        return err
+
+
+def _cases() -> dict[str, Callable[[], Callable[[], None]]]:
+    def case(
+        make_logger: Callable[[], Logger], call: Callable[[Logger, int], None]
+    ) -> Callable[[], Callable[[], None]]:
+        def setup() -> Callable[[], None]:
+            log, n = make_logger(), count()
+            return lambda: call(log, next(n))
+
+        return setup
+
+    err = _error()
+    quiet = LogFilter("INFO")
+    return {
+        "root.debug(msg)": case(Logger, lambda log, i: log.debug(f"sample {i}")),
+        "child.debug(msg)": case(
+            lambda: Logger().child("dmm").child("ch1"), lambda log, i: log.debug(f"sample {i}")
+        ),
+        "debug(msg, data)": case(Logger, lambda log, i: log.debug(f"sample {i}", {"v": i})),
+        "error(msg, exc_info)": case(Logger, lambda log, i: log.error(f"boom {i}", exc_info=err)),
+        "debug below the level": case(
+            lambda: Logger(log_filter=quiet), lambda log, i: log.debug(f"sample {i}")
+        ),
+        "info, coalesced repeat": case(Logger, lambda log, i: log.info("waiting for lock")),
+        "debug, capped at 1000": case(
+            lambda: Logger(max_entries=1000), lambda log, i: log.debug(f"sample {i}")
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for label, setup in _cases().items():
+        best = min(timeit.timeit(setup(), number=args.calls) for _ in range(args.repeat))
+        print(f"{label:26s} {best / args.calls * 1e9:8.0f} ns/call")
+
+    log = Logger()
+    for i in range(args.calls):
+        log.debug(f"sample {i}")
+    best = min(timeit.timeit(log.serialize, number=1) for _ in range(args.repeat))
+    print(f"{'serialize()':26s} {best / args.calls * 1e9:8.0f} ns/entry")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""``python -m pytest_reporter`` — see :mod:`pytest_reporter._cli`."""
+
+from ._cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,158 @@
+"""Artifact references for the HTML report: lazy embedding and content dedup."""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import mmap
+import os
+import warnings
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+EMBED_CHUNK_BYTES = 3 * 64 * 1024
+"""Raw bytes read per base64 chunk (a multiple of 3, so chunks concatenate cleanly)."""
+
+
+@dataclass(frozen=True)
+class EmbeddedFile:
+    """A ``data:`` URI whose payload is read and base64-encoded only when written.
+
+    ``collect_artifacts`` places these in the report data instead of encoded
+    strings, so assembling the data costs one small object per artifact; the
+    HTML writer streams the file into the output in fixed-size chunks.
+    """
+
+    path: Path
+    mime: str
+
+    def write_json(self, write: Callable[[str], object]) -> None:
+        """Write the data URI as a JSON string literal via *write*.
+
+        An artifact that can no longer be opened is written as ``null`` (the
+        renderer then shows it as metadata only) and warned about.  A read
+        failure part-way through closes the string early so the surrounding
+        JSON stays valid.
+
+        Args:
+            write: Text sink, called once per encoded chunk.
+        """
+        try:
+            fh = self.path.open("rb")
+        except (OSError, ValueError) as err:
+            warnings.warn(
+                f"pytest-reporter: artifact skipped (read failed): {self.path}: {err}",
+                stacklevel=2,
+            )
+            write("null")
+            return
+
+        write(f'"data:{self.mime};base64,')
+        with fh:
+            pending = b""
+            try:
+                while chunk := fh.read(EMBED_CHUNK_BYTES):
+                    pending += chunk
+                    cut = len(pending) - len(pending) % 3
+                    write(base64.b64encode(pending[:cut]).decode("ascii"))
+                    pending = pending[cut:]
+            except (OSError, ValueError) as err:
+                warnings.warn(
+                    f"pytest-reporter: artifact truncated (read failed): {self.path}: {err}",
+                    stacklevel=2,
+                )
+            write(base64.b64encode(pending).decode("ascii"))
+        write('"')
+
+
+def content_digest(path: Path) -> str:
+    """Return the hex BLAKE2b digest of *path*'s content.
+
+    The file is memory-mapped so hashing streams through the page cache
+    without a Python-side copy; files that cannot be mapped (empty files,
+    pipes, some network filesystems) are read in ``EMBED_CHUNK_BYTES`` chunks.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as fh:
+        try:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+        except (OSError, ValueError):
+            while chunk := fh.read(EMBED_CHUNK_BYTES):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+class ArtifactStore:
+    """Per-run content-addressed store for artifacts.
+
+    ``build_html_data`` passes every run's and retry attempt's artifact list
+    through :meth:`intern`.  Embeddable artifacts are replaced by a ``blob``
+    id into :attr:`blobs`, so content saved by many parametrized runs or retry
+    attempts is embedded in ``report.html`` once.  With *link_duplicates*
+    (the live session), duplicate files on disk are replaced by hard links
+    to the first copy seen; ``rebuild`` and ``merge`` read run directories
+    they do not own and leave them untouched.
+    """
+
+    def __init__(self, *, link_duplicates: bool = True) -> None:
+        self.blobs: dict[str, EmbeddedFile] = {}
+        """Unique embedded payloads keyed by blob id (rendered as ``DATA.blobs``)."""
+        self._blob_ids: dict[tuple[str, str], str] = {}
+        self._link_duplicates = link_duplicates
+        self._first_copy: dict[str, Path] = {}
+
+    def intern(self, artifacts_dir: Path, artifacts: list[dict[str, object]]) -> None:
+        """Deduplicate the entries of one ``collect_artifacts`` result in place.
+
+        An entry whose ``data_uri`` is an :class:`EmbeddedFile` has it replaced
+        by ``blob``.  Entries that cannot be hashed are left untouched; the
+        HTML writer reports unreadable files when it streams them.
+
+        Args:
+            artifacts_dir: Directory the entries were collected from.
+            artifacts: Artifact dicts as returned by ``collect_artifacts``.
+        """
+        for entry in artifacts:
+            ref = entry.get("data_uri")
+            path = ref.path if isinstance(ref, EmbeddedFile) else artifacts_dir / str(entry["name"])
+            try:
+                digest = content_digest(path)
+            except (OSError, ValueError):
+                continue
+            if self._link_duplicates:
+                self._dedupe_on_disk(digest, path)
+            if isinstance(ref, EmbeddedFile):
+                del entry["data_uri"]
+                entry["blob"] = self._blob_id(digest, ref)
+
+    def _blob_id(self, digest: str, ref: EmbeddedFile) -> str:
+        key = (digest, ref.mime)
+        blob_id = self._blob_ids.get(key)
+        if blob_id is None:
+            # The same bytes saved under a different extension need their own
+            # data URI (the MIME type is part of it).
+            blob_id = digest if digest not in self.blobs else f"{digest}-{len(self._blob_ids)}"
+            self._blob_ids[key] = blob_id
+            self.blobs[blob_id] = ref
+        return blob_id
+
+    def _dedupe_on_disk(self, digest: str, path: Path) -> None:
+        first = self._first_copy.setdefault(digest, path)
+        if first == path:
+            return
+        tmp = path.with_name(f".{path.name}.pytest-reporter-link")
+        try:
+            if os.path.samefile(first, path):
+                return
+            os.link(first, tmp)
+            os.replace(tmp, path)
+        except OSError:
+            # Best effort: cross-device or link-less filesystems keep the copy.
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
@@ -0,0 +1,133 @@
+"""Command-line entry point: ``python -m pytest_reporter <command>``.
+
+Commands work on run directories (``<report-dir>/runs/<timestamp>``) after
+the pytest session that wrote them has ended:
+
+- ``serve``: browse a run in the dashboard through a local HTTP server.
+- ``rebuild``: rewrite a run's ``report.html`` and ``junit.xml`` from its files.
+- ``merge``: combine the runs of a sharded suite into one report.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from ._merge import merge
+from ._rebuild import rebuild
+from ._server import DEFAULT_CACHE_SIZE, make_server
+
+
+def _run_dir(value: str) -> Path:
+    path = Path(value)
+    if not path.is_dir():
+        raise argparse.ArgumentTypeError(f"not a directory: {value}")
+    return path
+
+
+def _serve(args: argparse.Namespace) -> int:
+    server = make_server(args.run_dir, args.host, args.port, args.cache_size)
+    host, port = str(server.server_address[0]), server.server_address[1]
+    print(f"pytest-reporter: serving {args.run_dir} at http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def _rebuild(args: argparse.Namespace) -> int:
+    count = rebuild(
+        args.run_dir, artifact_mode=args.artifacts, compress=args.compress, jobs=args.jobs
+    )
+    print(f"pytest-reporter: rebuilt {args.run_dir / 'report.html'} ({count} tests)")
+    return 0
+
+
+def _merge(args: argparse.Namespace) -> int:
+    count = merge(
+        args.run_dirs,
+        args.output,
+        artifact_mode=args.artifacts,
+        compress=args.compress,
+        jobs=args.jobs,
+    )
+    print(
+        f"pytest-reporter: merged {len(args.run_dirs)} runs into "
+        f"{args.output / 'report.html'} ({count} tests)"
+    )
+    return 0
+
+
+def _add_report_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="reader threads (default: executor default)"
+    )
+    parser.add_argument(
+        "--report-artifacts",
+        dest="artifacts",
+        choices=("embed", "link"),
+        default="embed",
+        help="embed artifacts as data URIs or link them (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--report-compress",
+        dest="compress",
+        action="store_true",
+        help="deflate the data embedded in report.html",
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m pytest_reporter")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser(
+        "serve",
+        help="browse a run directory in the dashboard via a local HTTP server",
+        description="Serve the dashboard for RUN_DIR; test details are read on demand.",
+    )
+    serve.add_argument("run_dir", type=_run_dir, help="a runs/<timestamp> directory")
+    serve.add_argument("--host", default="127.0.0.1", help="bind address (default: %(default)s)")
+    serve.add_argument("--port", type=int, default=8000, help="port (default: %(default)s)")
+    serve.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="tests whose details are kept in memory (default: %(default)s)",
+    )
+    serve.set_defaults(func=_serve)
+
+    rebuild_cmd = commands.add_parser(
+        "rebuild",
+        help="regenerate report.html and junit.xml for a run directory",
+        description="Rewrite RUN_DIR/report.html and RUN_DIR/junit.xml from the files on disk.",
+    )
+    rebuild_cmd.add_argument("run_dir", type=_run_dir, help="a runs/<timestamp> directory")
+    _add_report_options(rebuild_cmd)
+    rebuild_cmd.set_defaults(func=_rebuild)
+
+    merge_cmd = commands.add_parser(
+        "merge",
+        help="merge the run directories of a sharded suite into one report",
+        description="Write one report.html and junit.xml for the union of RUN_DIRS. "
+        "A run present in several shards is taken from the latest one.",
+    )
+    merge_cmd.add_argument(
+        "run_dirs", nargs="+", type=_run_dir, metavar="run_dir", help="runs/<timestamp> dirs"
+    )
+    merge_cmd.add_argument(
+        "-o", "--output", type=Path, required=True, help="directory for the merged report"
+    )
+    _add_report_options(merge_cmd)
+    merge_cmd.set_defaults(func=_merge)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse *argv* (default: ``sys.argv[1:]``), run the command, return its exit code."""
+    args = _parser().parse_args(sys.argv[1:] if argv is None else argv)
+    return int(args.func(args))
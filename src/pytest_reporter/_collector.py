@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
@@ -11,8 +12,36 @@ if TYPE_CHECKING:
     import pytest
 
 
+@dataclass
+class _FunctionTally:
+    """Running outcome counters for one test function (all of its runs)."""
+
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    errors: int = 0
+    total_duration: float = 0.0
+
+    def add(self, outcome: str, delta: int) -> None:
+        """Adjust the counter for *outcome* by *delta* (+1 / -1)."""
+        if outcome == "passed":
+            self.passed += delta
+        elif outcome == "failed":
+            self.failed += delta
+        elif outcome == "skipped":
+            self.skipped += delta
+        else:
+            self.errors += delta
+
+
 class DataCollector:
-    """Collects and indexes test data during the pytest run."""
+    """Collects and indexes test data during the pytest run.
+
+    Per-run outcome/duration and per-function counters are maintained
+    incrementally by ``record_phase()`` and ``set_retry_data()``, so the
+    session-end consumers (test.log.json, JUnit, HTML) read cached values
+    instead of re-deriving them from ``_phases`` on every call.
+    """
 
     def __init__(self) -> None:
         # nodeid -> RunInfo
@@ -23,6 +52,13 @@ class DataCollector:
         self._phases: dict[tuple[str, str], PhaseData] = {}
         # nodeid -> RetryData (only for tests that were retried)
         self._retries: dict[str, RetryData] = {}
+        # nodeid -> cached final outcome / total duration (kept current by _refresh_run)
+        self._outcomes: dict[str, str] = {}
+        self._durations: dict[str, float] = {}
+        # base_nodeid -> running counters across all runs of the function
+        self._tallies: dict[str, _FunctionTally] = {}
+        # base_nodeid -> built test.log.json aggregate; dropped whenever a run changes
+        self._aggregates: dict[str, TestLogJson] = {}
 
     def register_items(self, items: list[pytest.Item]) -> None:
         """Index all collected items and assign run IDs."""
@@ -81,11 +117,19 @@ class DataCollector:
                 class_name=class_name_val,
                 display_name=display_name_val,
             )
-            self._run_map[item.nodeid] = run_info
+            self.add_run(item.nodeid, run_info)
+
+    def add_run(self, nodeid: str, run_info: RunInfo) -> None:
+        """Index one run (``register_items`` does this for every collected item)."""
+        base = run_info.base_nodeid
+        self._run_map[nodeid] = run_info
+        self._function_runs.setdefault(base, []).append(nodeid)
 
-            if base not in self._function_runs:
-                self._function_runs[base] = []
-            self._function_runs[base].append(item.nodeid)
+        # A run with no recorded phases derives to "skipped" with zero duration.
+        self._outcomes[nodeid] = "skipped"
+        self._durations[nodeid] = 0.0
+        self._tallies.setdefault(base, _FunctionTally()).add("skipped", 1)
+        self._aggregates.pop(base, None)
 
     def get_run_info(self, nodeid: str) -> RunInfo:
         """Look up run info for a nodeid."""
@@ -113,7 +157,34 @@ class DataCollector:
             end_time=end_time,
             entries=entries or [],
         )
-        self._phases[(report.nodeid, report.when)] = phase
+        self.set_phase(report.nodeid, phase)
+
+    def set_phase(self, nodeid: str, phase: PhaseData) -> None:
+        """Store already-built phase data (e.g. received from an xdist worker)."""
+        self._phases[(nodeid, phase.when)] = phase
+        self._refresh_run(nodeid)
+
+    def _refresh_run(self, nodeid: str) -> None:
+        """Re-derive the cached outcome/duration of one run and update its tally."""
+        run_info = self._run_map.get(nodeid)
+        if run_info is None:
+            return
+        outcome = self._derive_outcome(nodeid)
+        duration = self._derive_duration(nodeid)
+        old_outcome = self._outcomes.get(nodeid)
+        old_duration = self._durations.get(nodeid, 0.0)
+        if outcome == old_outcome and duration == old_duration:
+            return
+
+        tally = self._tallies.setdefault(run_info.base_nodeid, _FunctionTally())
+        if old_outcome is not None:
+            tally.add(old_outcome, -1)
+        tally.add(outcome, 1)
+        tally.total_duration += duration - old_duration
+
+        self._outcomes[nodeid] = outcome
+        self._durations[nodeid] = duration
+        self._aggregates.pop(run_info.base_nodeid, None)
 
     def get_phase(self, nodeid: str, when: str) -> PhaseData | None:
         """Get phase data for a specific nodeid and phase."""
@@ -129,6 +200,20 @@ class DataCollector:
         return result
 
     def get_outcome(self, nodeid: str) -> str:
+        """Return the final outcome for a test run (cached)."""
+        outcome = self._outcomes.get(nodeid)
+        if outcome is None:
+            return self._derive_outcome(nodeid)
+        return outcome
+
+    def get_duration(self, nodeid: str) -> float:
+        """Return the total duration for a test run across all phases (cached)."""
+        duration = self._durations.get(nodeid)
+        if duration is None:
+            return self._derive_duration(nodeid)
+        return duration
+
+    def _derive_outcome(self, nodeid: str) -> str:
         """Derive final outcome for a test run from its phases."""
         # If retried, use final outcome from retry data
         retry = self._retries.get(nodeid)
@@ -146,8 +231,8 @@ class DataCollector:
             return "skipped"
         return call.outcome
 
-    def get_duration(self, nodeid: str) -> float:
-        """Get total duration for a test run across all phases."""
+    def _derive_duration(self, nodeid: str) -> float:
+        """Sum the recorded phase durations for a test run."""
         total = 0.0
         for when in ("setup", "call", "teardown"):
             phase = self.get_phase(nodeid, when)
@@ -161,6 +246,7 @@ class DataCollector:
     def set_retry_data(self, nodeid: str, retry_data: RetryData) -> None:
         """Store retry metadata for a test run."""
         self._retries[nodeid] = retry_data
+        self._refresh_run(nodeid)
 
     def get_retry_data(self, nodeid: str) -> RetryData | None:
         """Get retry data for a test run, if any."""
@@ -175,32 +261,25 @@ class DataCollector:
         return self._function_runs.get(base_nodeid, [])
 
     def get_function_aggregate(self, base_nodeid: str) -> TestLogJson:
-        """Build the test.log.json aggregate for a test function."""
+        """Return the test.log.json aggregate for a test function.
+
+        The aggregate is built from the cached per-run values and memoized until
+        one of the function's runs changes.  Callers must treat the returned
+        dict as read-only (copy it before mutating).
+        """
+        cached = self._aggregates.get(base_nodeid)
+        if cached is not None:
+            return cached
+
         nodeids = self._function_runs.get(base_nodeid, [])
+        tally = self._tallies.get(base_nodeid, _FunctionTally())
         runs: list[RunEntry] = []
-        passed = failed = skipped = errors = 0
-        total_duration = 0.0
 
         for nid in nodeids:
-            run_info = self._run_map[nid]
-            outcome = self.get_outcome(nid)
-            duration = self.get_duration(nid)
-
-            if outcome == "passed":
-                passed += 1
-            elif outcome == "failed":
-                failed += 1
-            elif outcome == "skipped":
-                skipped += 1
-            else:
-                errors += 1
-
-            total_duration += duration
-
             entry = RunEntry(
-                run_id=run_info.run_id,
-                outcome=outcome,
-                duration_seconds=round(duration, 4),
+                run_id=self._run_map[nid].run_id,
+                outcome=self.get_outcome(nid),
+                duration_seconds=round(self.get_duration(nid), 4),
             )
 
             # Add retries info if present
@@ -222,16 +301,17 @@ class DataCollector:
             function_name=first.function_name,
             file=first.file_path,
             total_runs=len(nodeids),
-            passed=passed,
-            failed=failed,
-            skipped=skipped,
-            errors=errors,
-            total_duration_seconds=round(total_duration, 4),
+            passed=tally.passed,
+            failed=tally.failed,
+            skipped=tally.skipped,
+            errors=tally.errors,
+            total_duration_seconds=round(tally.total_duration, 4),
             runs=runs,
         )
         # Populate presentation-only fields (class_name is None for plain functions).
         aggregate["class_name"] = first.class_name
         aggregate["display_name"] = first.display_name
+        self._aggregates[base_nodeid] = aggregate
         return aggregate
 
     def all_nodeids(self) -> list[str]:
@@ -30,9 +30,10 @@ def sanitize_path_component(name: str) -> str:
 class RunContext:
     """Encapsulates all path calculations for a single test run."""
 
-    def __init__(self, base_dir: Path) -> None:
+    def __init__(self, base_dir: Path, timestamp: str | None = None) -> None:
         self._base_dir = base_dir.resolve()
-        self._timestamp = datetime.now(UTC).strftime("%Y_%m_%d_%H_%M_%S")
+        # xdist workers join the controller's run by passing its timestamp.
+        self._timestamp = timestamp or datetime.now(UTC).strftime("%Y_%m_%d_%H_%M_%S")
 
     @property
     def reports_dir(self) -> Path:
@@ -2,57 +2,23 @@
 
 from __future__ import annotations
 
+import base64
+import io
 import json
 import re
 import warnings
-from typing import Any
+import zlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TextIO
 
 from ._css import CSS
 from ._degraded import build_degraded_report as build_degraded_report
-from ._js import JS
+from ._js import INFLATE_JS, JS
+from ._payload import DeflateBase64Sink, PayloadWriter, _script_escape
 from ._template import build_skeleton
 
-
-def _safe_default(o: object) -> str:
-    """JSON encoder default: convert non-serializable values to a string fallback.
-
-    Called by ``json.dumps`` when a value cannot be serialized natively.
-    If ``str(o)`` itself raises (e.g. a ``__str__`` that throws), falls back to
-    ``<unserializable TypeName>`` and emits a ``UserWarning``.
-
-    Args:
-        o: The non-serializable object.
-
-    Returns:
-        A string representation of ``o``.
-    """
-    try:
-        return str(o)
-    except Exception as exc:  # noqa: BLE001
-        type_name = type(o).__name__
-        warnings.warn(
-            f"pytest-reporter: non-serializable value of type {type_name!r} "
-            f"could not be converted to string: {exc}",
-            stacklevel=4,
-        )
-        return f"<unserializable {type_name}>"
-
-
-def _script_escape(s: str) -> str:
-    """Escape ``</`` to prevent script-tag breakout in an inline ``<script>`` block.
-
-    Replaces every occurrence of ``</`` with ``<\\/`` so that a user-controlled
-    string such as ``</script><script>alert(1)</script>`` cannot terminate the
-    enclosing ``<script>`` element.  Applied to the final JSON string BEFORE
-    template injection (REQ-4, H2).
-
-    Args:
-        s: The JSON string to escape.
-
-    Returns:
-        The escaped string with all ``</`` replaced by ``<\\/``.
-    """
-    return s.replace("</", "<\\/")
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def _build_system_metadata_html(system_metadata: dict[str, dict[str, str]]) -> str:
@@ -101,59 +67,169 @@ def _esc(text: str) -> str:
     )
 
 
-def build_html_report(data: dict[str, Any]) -> str:
-    """Build a complete self-contained HTML report from collected data.
+# Payload blocks: template marker -> the PayloadWriter method that fills it.
+_BLOCKS: dict[str, Callable[[PayloadWriter, dict[str, Any]], None]] = {
+    "/*__REPORT_DATA__*/": PayloadWriter.report_index,
+    "/*__REPORT_SHARDS__*/": PayloadWriter.report_shards,
+    "/*__REPORT_LOG_SEARCH__*/": PayloadWriter.report_log_search,
+}
+_MARKERS = (*_BLOCKS, "/*__SYSTEM_METADATA_JSON__*/")
+_MARKER_RE = re.compile("(" + "|".join(re.escape(m) for m in _MARKERS) + ")")
+
+_FALLBACK_DATA: dict[str, Any] = {"error": "report data not serializable", "tests": []}
+
+
+def _write_payload(out: TextIO, marker: str, data: dict[str, Any], *, compress: bool) -> None:
+    """Write one payload block as is, or as a JSON string of its deflated base64."""
+    write_block = _BLOCKS[marker]
+    if not compress:
+        write_block(PayloadWriter(out.write), data)
+        return
+    sink = DeflateBase64Sink(out.write)
+    out.write('"')
+    write_block(PayloadWriter(sink.write), data)
+    sink.close()
+    out.write('"')
+
+
+def _write_report(
+    out: TextIO, data: dict[str, Any], *, compress: bool = False, shard_url: str | None = None
+) -> None:
+    """Stream the complete report document into *out*.
 
     Robustness guarantees applied here:
-    - H1: ``json.dumps`` uses ``skipkeys=True`` + ``_safe_default`` to handle
-      non-serializable keys/values.  An outer ``try/except`` falls back to a
-      minimal safe dict if ``dumps`` still fails (e.g. circular reference).
-    - H2: ``_script_escape`` is applied to BOTH ``safe_json`` (REPORT_DATA) AND
-      ``sys_json`` (SYSTEM_METADATA) before template injection.
-    - M1: single-pass ``re.sub`` replaces both markers in one scan so user data
-      containing a marker literal is never double-substituted.
+    - H1: every fragment is dumped with ``skipkeys=True`` + ``_safe_default``
+      (see :class:`~._payload.PayloadWriter`).
+      If serialisation still fails part-way (e.g. a circular reference), the
+      partially written payload is truncated and replaced with a minimal
+      safe dict.  *out* must therefore be seekable.
+    - H2: ``_script_escape`` is applied to every REPORT_DATA fragment AND to
+      ``sys_json`` (SYSTEM_METADATA) as it is written.  REPORT_DATA is plain
+      JSON inside a ``<script type="application/json">`` block, decoded by the
+      report with ``JSON.parse``.
+    - M1: the template is split on all markers in one scan and user payloads
+      are written verbatim after it, so a marker literal inside user data is
+      never substituted.
+
+    REPORT_DATA is written as three blocks (see :mod:`._payload`): the index,
+    parsed when the report opens, the per-test shards, parsed when a test is
+    opened, and the log search index, parsed when the log search is first
+    used.  If the index falls back, the other blocks are left empty; so is
+    the log search block of data without a log index.
+
+    With *compress*, each block holds a JSON string: the base64 of its
+    zlib-deflated text.  The app script is then inert and a small loader
+    inflates the index in the browser before starting it; the app inflates
+    the other blocks when it first reads them.
+
+    With *shard_url*, the shards block is left empty and the report fetches
+    each test's details from ``<shard_url><shard>`` instead (report server).
     """
-    # H1: robust serialisation with skipkeys + fallback default
-    try:
-        data_json = json.dumps(
-            data, indent=None, ensure_ascii=True, skipkeys=True, default=_safe_default
-        )
-    except Exception as exc:  # noqa: BLE001
-        warnings.warn(
-            f"pytest-reporter: REPORT_DATA serialisation failed, using minimal fallback: {exc}",
-            stacklevel=2,
-        )
-        data_json = json.dumps({"error": "report data not serializable", "tests": []})
-
-    # H2: escape </  to prevent script-tag breakout in REPORT_DATA
-    safe_json = _script_escape(data_json)
-
     system_metadata: dict[str, dict[str, str]] = data.get("system_metadata", {})
     sys_html = _build_system_metadata_html(system_metadata)
     # JSON-encode the HTML fragment so it embeds safely as a JS string literal.
     # When empty the JS variable is "" (falsy) and nothing is inserted.
-    # H2: escape </  in SYSTEM_METADATA payload for defence in depth.
     sys_json = _script_escape(json.dumps(sys_html))
 
-    template = build_skeleton(CSS, JS)
-
-    # M1: single-pass substitution — re.sub processes each marker exactly once
-    # and never re-scans injected payloads.  Chained str.replace would allow
-    # a marker literal inside user data to be substituted a second time,
-    # corrupting the REPORT_DATA JSON.
-    _payloads: dict[str, str] = {
-        "/*__REPORT_DATA__*/": f"const DATA = {safe_json};",
-        "/*__SYSTEM_METADATA_JSON__*/": sys_json,
-    }
-    # Warn if either marker is missing from the template (unexpected template change)
-    for marker in _payloads:
+    template = build_skeleton(CSS, JS, loader=INFLATE_JS if compress else None)
+    for marker in _MARKERS:
         count = template.count(marker)
         if count != 1:
             warnings.warn(
                 f"pytest-reporter: template marker {marker!r} appears {count} times "
                 f"(expected exactly 1); substitution may be incorrect",
-                stacklevel=2,
+                stacklevel=3,
             )
 
-    pattern = re.compile(r"/\*__REPORT_DATA__\*/|/\*__SYSTEM_METADATA_JSON__\*/")
-    return pattern.sub(lambda m: _payloads[m.group(0)], template)
+    payload = data if shard_url is None else {**data, "shard_url": shard_url}
+    for i, part in enumerate(_MARKER_RE.split(template)):
+        if i % 2 == 0:
+            out.write(part)
+        elif part == "/*__SYSTEM_METADATA_JSON__*/":
+            out.write(sys_json)
+        elif part == "/*__REPORT_SHARDS__*/" and shard_url is not None:
+            continue
+        elif part == "/*__REPORT_LOG_SEARCH__*/" and payload.get("log_search") is None:
+            continue
+        else:
+            start = out.tell()
+            try:
+                _write_payload(out, part, payload, compress=compress)
+            except Exception as exc:  # noqa: BLE001
+                warnings.warn(
+                    "pytest-reporter: REPORT_DATA serialisation failed, "
+                    f"using minimal fallback: {exc}",
+                    stacklevel=3,
+                )
+                out.seek(start)
+                out.truncate()
+                payload = _FALLBACK_DATA
+                _write_payload(out, part, payload, compress=compress)
+
+
+def write_html_report(path: Path, data: dict[str, Any], *, compress: bool = False) -> None:
+    """Stream a complete self-contained HTML report from collected data to *path*.
+
+    REPORT_DATA is serialised test by test and run by run straight into the
+    open file handle, so peak memory is bounded by the largest single run
+    rather than by the whole payload.  With *compress* the payload is
+    deflated on the fly and inflated by the browser when the report opens.
+    """
+    with path.open("w", encoding="utf-8") as fh:
+        _write_report(fh, data, compress=compress)
+
+
+def build_html_report(
+    data: dict[str, Any], *, compress: bool = False, shard_url: str | None = None
+) -> str:
+    """Build a complete self-contained HTML report from collected data.
+
+    In-memory counterpart of :func:`write_html_report`; both share the same
+    streaming serialiser so their output is byte-identical.  *shard_url*
+    builds the page of the report server: only the index is embedded and test
+    details are fetched from ``<shard_url><shard>`` when a test is opened.
+    """
+    buf = io.StringIO()
+    _write_report(buf, data, compress=compress, shard_url=shard_url)
+    return buf.getvalue()
+
+
+def _read_block(html: str, block_id: str) -> str:
+    """Return the text of one payload block of a report, inflated if compressed."""
+    m = re.search(f'<script type="application/json" id="{block_id}">(.*?)</script>', html, re.S)
+    if m is None:
+        raise ValueError(f"no {block_id} block in report")
+    text = m.group(1)
+    if text.startswith('"'):
+        text = zlib.decompress(base64.b64decode(json.loads(text))).decode("utf-8")
+    return text
+
+
+def read_html_report(html: str) -> dict[str, Any]:
+    """Parse REPORT_DATA back out of a report built by :func:`build_html_report`.
+
+    The Python counterpart of the report's own loader: the index block is
+    parsed, compressed blocks are inflated, and every test's shard is merged
+    back into its runs, so the result equals the data the report was built
+    from (up to JSON round-tripping).  Interned phases are left as written;
+    the string table is returned as ``strings`` and the log search index, if
+    any, as ``log_search``.
+
+    Raises:
+        ValueError: If *html* has no payload blocks or they are not valid JSON.
+    """
+    data: dict[str, Any] = json.loads(_read_block(html, "report-data"))
+    lines = _read_block(html, "report-shards").split("\n")
+    tests = data.get("tests", [])
+    if len(lines) > len(tests) and lines[len(tests)]:
+        data["strings"] = json.loads(lines[len(tests)])["strings"]
+    log_search = _read_block(html, "report-log-search")
+    if log_search:
+        data["log_search"] = json.loads(log_search)
+    for test in tests:
+        if not isinstance(test, dict) or "shard" not in test:
+            continue
+        detail = json.loads(lines[test.pop("shard")])
+        for run, fields in zip(test["runs"], detail):
+            run.update(fields)
+    return data
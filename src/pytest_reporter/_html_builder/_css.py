@@ -590,6 +590,68 @@ button { font-family: inherit; }
   border-color: var(--c-accent);
   box-shadow: 0 0 0 3px var(--c-accent-dim);
 }
+/* Global log search in the header */
+.log-search {
+  margin-left: auto;
+  width: min(420px, 40vw);
+}
+.log-search + .meta { margin-left: 0; }
+.log-search-results {
+  display: none;
+  position: absolute;
+  top: calc(100% + 6px);
+  left: 0;
+  right: 0;
+  max-height: 60vh;
+  overflow-y: auto;
+  background: var(--c-surface);
+  border: 1px solid var(--c-border2);
+  border-radius: var(--radius-md);
+  box-shadow: var(--shadow-lg);
+  padding: 4px;
+}
+.log-search-results.open { display: block; }
+.log-search-count {
+  padding: 6px 10px;
+  color: var(--c-text3);
+  font-size: 11px;
+}
+.log-search-hit {
+  display: flex;
+  flex-direction: column;
+  gap: 2px;
+  width: 100%;
+  padding: 6px 10px;
+  background: none;
+  border: none;
+  border-radius: var(--radius-sm);
+  color: var(--c-text);
+  text-align: left;
+  cursor: pointer;
+}
+.log-search-hit:hover, .log-search-hit:focus-visible { background: var(--c-surface3); outline: none; }
+.log-search-hit-head {
+  display: flex;
+  align-items: center;
+  gap: 6px;
+  font-size: 12px;
+  font-weight: 600;
+}
+.log-search-hit-where {
+  margin-left: auto;
+  color: var(--c-text3);
+  font-size: 11px;
+  font-weight: 500;
+}
+.log-search-hit-text {
+  color: var(--c-text2);
+  font-family: var(--font-mono);
+  font-size: 11px;
+  overflow: hidden;
+  text-overflow: ellipsis;
+  white-space: nowrap;
+}
+.search-hit { box-shadow: inset 3px 0 0 var(--c-accent); background: var(--c-accent-dim); }
 .tree-controls-row {
   display: flex;
   align-items: center;
@@ -634,11 +696,17 @@ button { font-family: inherit; }
   overflow-y: auto;
   padding: 6px 0;
 }
+/* Virtualized tree: the spacer has the full list height, the window holds
+   only the rendered rows and is translated to the first one. */
+.tree-spacer { position: relative; }
+.tree-window { position: absolute; top: 0; left: 0; right: 0; will-change: transform; }
 .tree-node { user-select: none; }
 .tree-row {
   display: flex;
   align-items: center;
-  padding: 5px 16px;
+  height: 28px; /* fixed: TREE_ROW_H in the JS */
+  box-sizing: border-box;
+  padding: 0 16px;
   cursor: pointer;
   font-size: 13px;
   gap: 8px;
@@ -695,8 +763,6 @@ button { font-family: inherit; }
   background: var(--c-skipped-dim);
   color: var(--c-skipped);
 }
-.tree-children { display: none; }
-.tree-node.expanded > .tree-children { display: block; }
 /* Breadcrumb separator for collapsed chain nodes (tests-tree-cleanup) */
 .crumb-sep {
   color: var(--c-text3);
@@ -1117,6 +1183,16 @@ button { font-family: inherit; }
 .log-entry-level.CRITICAL { background: rgba(239,68,68,0.25); color: #FF6B6B; }
 .log-entry-source { color: var(--c-text2); font-size: 11px; }
 .log-entry-msg { color: var(--c-text); word-break: break-word; }
+.log-entry-repeat {
+  margin-left: 8px;
+  padding: 0 6px;
+  border-radius: 8px;
+  font-size: 10px;
+  font-weight: 700;
+  background: var(--c-accent-dim);
+  color: var(--c-accent);
+  white-space: nowrap;
+}
 .log-entry-data {
   grid-column: 1 / -1;
   margin-left: 24px;
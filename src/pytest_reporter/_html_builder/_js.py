@@ -1,12 +1,141 @@
 """Inline JavaScript for the HTML report template.
 
-The /*__REPORT_DATA__*/ and /*__SYSTEM_METADATA_JSON__*/ markers
-must remain intact — they are substituted at report-build time.
+The /*__SYSTEM_METADATA_JSON__*/ marker must remain intact — it is
+substituted at report-build time.  The report data itself is read from the
+``<script type="application/json" id="report-data">`` block.
+
+``INFLATE_JS`` is the loader used for compressed reports: it inflates the
+deflated index, then starts the (inert) app script, which inflates the other
+blocks when it first needs them.
 """
 
 from __future__ import annotations
 
-JS: str = r"""/*__REPORT_DATA__*/
+JS: str = r"""// ─── Report data ─────────────────────────────────────────────────────
+// DATA is embedded as a JSON block rather than a JS literal: JSON.parse of one
+// string is much faster and lighter than compiling a huge object literal.
+// Compressed reports hand over the inflated JSON in REPORT_JSON (INFLATE_JS).
+// DATA is only the index: each run's phases, procedure, artifacts, retry
+// attempts and check results sit in the test's shard (see Shards below).
+const LOAD_STATS = {parseStart: performance.now(), parseMs: 0, payloadChars: 0, readyMs: 0,
+                    inflateMs: window.REPORT_INFLATE_MS};
+const DATA = (function() {
+  const block = document.getElementById('report-data');
+  const text = window.REPORT_JSON !== undefined ? window.REPORT_JSON : (block ? block.textContent : '');
+  LOAD_STATS.payloadChars = text.length;
+  try {
+    return JSON.parse(text);
+  } catch (e) {
+    console.error('pytest-reporter: report data could not be parsed', e);
+    return {error: 'report data could not be parsed', tests: []};
+  } finally {
+    LOAD_STATS.parseMs = performance.now() - LOAD_STATS.parseStart;
+  }
+})();
+
+// ─── Payload blocks ──────────────────────────────────────────────────
+// Payload blocks other than report-data are read the first time they are
+// needed.  In a compressed report they are inflated then, by REPORT_INFLATE
+// (INFLATE_JS), so their volume does not delay the first paint either.
+const _blocks = {};
+
+// Return the text of payload block id, or null while it is being inflated;
+// onLoaded is then called once the text is ready.
+function loadBlock(id, onLoaded) {
+  let b = _blocks[id];
+  if (!b) {
+    b = _blocks[id] = {text: null, ready: null};
+    if (window.REPORT_INFLATE) {
+      b.ready = window.REPORT_INFLATE(id).then(text => { b.text = text; });
+    } else {
+      const block = document.getElementById(id);
+      b.text = block ? block.textContent : '';
+    }
+  }
+  if (b.text === null && onLoaded) b.ready.then(onLoaded);
+  return b.text;
+}
+
+// ─── Shards ──────────────────────────────────────────────────────────
+// The report-shards block holds one JSON line per test.  A test's line is
+// parsed, and merged into its runs, the first time the test is opened, so
+// load time depends on the number of tests rather than on the volume of their
+// logs.  A served report (`python -m pytest_reporter serve`) has no shards
+// block: DATA.shard_url names the endpoint to fetch from.
+let _shardLines = null;
+
+function mergeShard(test, detail) {
+  test.runs.forEach((run, i) => Object.assign(run, (detail && detail[i]) || {}));
+  test._shardLoaded = true;
+}
+
+// Split the shards block into lines on first use.  Returns false while a
+// compressed block is being inflated; onLoaded is called when it is ready.
+function loadShardLines(onLoaded) {
+  if (_shardLines) return true;
+  const text = loadBlock('report-shards', onLoaded);
+  if (text === null) return false;
+  _shardLines = text.split('\n');
+  // Lines past the tests' hold the string table (see String table below).
+  if (_shardLines[DATA.tests.length]) {
+    try {
+      STRINGS = JSON.parse(_shardLines[DATA.tests.length]).strings || [];
+    } catch (e) {
+      console.error('pytest-reporter: string table could not be parsed', e);
+    }
+  }
+  return true;
+}
+
+// Returns true once the test's details are merged.  Returns false while they
+// are being fetched or inflated; onLoaded is called once they are merged.
+function loadShard(test, onLoaded) {
+  if (!test || test.shard === undefined || test._shardLoaded) return true;
+  if (DATA.shard_url) {
+    if (!test._shardPending) {
+      test._shardPending = fetch(DATA.shard_url + test.shard)
+        .then(r => { if (!r.ok) throw new Error('HTTP ' + r.status); return r.json(); })
+        .then(detail => mergeShard(test, detail), e => {
+          console.error('pytest-reporter: details of ' + test.base_nodeid + ' could not be fetched', e);
+          mergeShard(test, []);
+        });
+    }
+    if (onLoaded) test._shardPending.then(onLoaded);
+    return false;
+  }
+  if (!loadShardLines(() => { loadShard(test); if (onLoaded) onLoaded(); })) return false;
+  let detail = [];
+  try {
+    detail = JSON.parse(_shardLines[test.shard]);
+  } catch (e) {
+    console.error('pytest-reporter: details of ' + test.base_nodeid + ' could not be parsed', e);
+  }
+  mergeShard(test, detail);
+  return true;
+}
+
+// ─── String table ────────────────────────────────────────────────────
+// Repeated log levels, source paths, timestamp prefixes and tracebacks in the
+// shards are stored once and referenced by index (see _string_table.py).  The
+// table is the shards block's last line, read with the shards on first use.
+// References are resolved in place per phase, the first time it is shown.
+let STRINGS = [];
+
+function resolveEntry(e) {
+  if (typeof e.level === 'number') e.level = STRINGS[e.level];
+  if (typeof e.source === 'number') e.source = STRINGS[e.source];
+  if (Array.isArray(e.t)) e.t = STRINGS[e.t[0]] + e.t[1];
+  if (Array.isArray(e.last_t)) e.last_t = STRINGS[e.last_t[0]] + e.last_t[1];
+  return e;
+}
+
+function resolvePhase(phase) {
+  if (!phase || phase._resolved) return phase;
+  if (typeof phase.longrepr === 'number') phase.longrepr = STRINGS[phase.longrepr];
+  (phase.entries || []).forEach(resolveEntry);
+  phase._resolved = true;
+  return phase;
+}
 
 // ─── Utilities ───────────────────────────────────────────────────────
 function el(tag, attrs, ...children) {
@@ -79,19 +208,36 @@ function buildTree(tests) {
   return root;
 }
 
+// Tree aggregates are computed once per node, bottom-up: a node's totals are
+// its own tests' precomputed aggregates plus its children's memoized totals,
+// so rendering every node of both tabs costs O(n) overall.  Trees are never
+// mutated after construction (compactTree builds new nodes), so the cache
+// cannot go stale.
+const _nodeAggCache = new WeakMap();
 function nodeAgg(node) {
+  let a = _nodeAggCache.get(node);
+  if (a) return a;
   let p=0,f=0,s=0,e=0,dur=0,retr=0;
   node.tests.forEach(t => {
     p+=t.aggregate.passed; f+=t.aggregate.failed;
     s+=t.aggregate.skipped; e+=t.aggregate.errors;
     dur += t.aggregate.total_duration_seconds || 0;
-    retr += t.runs.filter(r => r.retries && r.retries.attempts > 0).length;
+    retr += t.aggregate.retried_runs || 0;
   });
   Object.values(node.children).forEach(c => {
-    const a = nodeAgg(c);
-    p+=a.passed; f+=a.failed; s+=a.skipped; e+=a.error; dur+=a.duration; retr+=a.retried;
+    const ca = nodeAgg(c);
+    p+=ca.passed; f+=ca.failed; s+=ca.skipped; e+=ca.error; dur+=ca.duration; retr+=ca.retried;
   });
-  return {passed:p,failed:f,skipped:s,error:e,total:p+f+s+e,duration:dur,retried:retr};
+  a = {passed:p,failed:f,skipped:s,error:e,total:p+f+s+e,duration:dur,retried:retr};
+  _nodeAggCache.set(node, a);
+  return a;
+}
+
+// The raw test tree, built once and shared by the Summary and Tests tabs.
+let _testTree = null;
+function testTree() {
+  if (!_testTree) _testTree = buildTree(DATA.tests);
+  return _testTree;
 }
 
 // ─── Tree compaction transform (pure — never mutates input) ──────────────
@@ -412,8 +558,8 @@ function renderSummary() {
   const passRate = Math.round((agg.passed / total) * 100);
 
   // Count retried tests
-  let retriedCount = 0;
-  DATA.tests.forEach(t => t.runs.forEach(r => { if (r.retries && r.retries.attempts > 0) retriedCount++; }));
+  const tree = testTree();
+  const retriedCount = nodeAgg(tree).retried;
 
   // ── Hero: pass rate + duration + ratio bar ──
   const suiteDuration = DATA.tests.reduce((a, t) => a + (t.aggregate.total_duration_seconds || 0), 0);
@@ -483,7 +629,6 @@ function renderSummary() {
   // ── Config-driven dashboard groups (donuts or pass-rate bars per group) ──
   // NOTE: "All Tests" whole-suite donut REMOVED (configurable-dashboard change).
   // Top counter cards already convey suite-level totals. Groups are config-driven.
-  const tree = buildTree(DATA.tests);
   renderDashboardGroups(DATA.dashboard, container, tree);
 
   panel.appendChild(container);
@@ -492,22 +637,30 @@ function renderSummary() {
 function navigateToGroup(path) {
   switchTab('tests');
   const parts = path.split('/');
-  let node = document.querySelector('.tree-content');
+  let node = treeView.root;
+  let target = null;
   parts.forEach(part => {
     if (!node) return;
-    const rows = node.querySelectorAll(':scope > .tree-node > .tree-row');
-    rows.forEach(row => {
-      // D4 fix: match via data-seg attribute membership instead of textContent,
-      // so breadcrumb-collapsed rows (e.g. "ctec / FOX") still match on "ctec".
-      const segs = row.querySelectorAll('[data-seg]');
-      const matched = Array.from(segs).some(s => s.getAttribute('data-seg') === part);
-      if (matched) {
-        const parent = row.parentElement;
-        if (parent) parent.classList.add('expanded');
-        node = parent?.querySelector('.tree-children');
-      }
-    });
+    // A breadcrumb-collapsed node (e.g. "ctec / FOX") already covers this part.
+    if (target && (target._segments || []).includes(part)) return;
+    // D4 fix: match via segment membership (the rows' data-seg attributes)
+    // instead of the label text, so breadcrumb-collapsed nodes still match.
+    const hit = Object.entries(node.children)
+      .find(([name, child]) => (child._segments || [name]).includes(part));
+    if (hit) {
+      target = hit[1];
+      target._expanded = true;
+      node = target;
+    } else {
+      node = null;
+    }
   });
+  refreshTree();
+  const idx = target ? treeView.rows.findIndex(r => r.node === target) : -1;
+  if (idx >= 0) {
+    treeView.content.scrollTop = idx * TREE_ROW_H;
+    renderTreeWindow();
+  }
 }
 
 // ─── Tests Tab ───────────────────────────────────────────────────────
@@ -515,6 +668,60 @@ let activeFilters = new Set(STATUSES);
 let selectedTest = null;
 let selectedRun = null;
 
+// The tree is virtualized: the compacted tree is flattened into the list of
+// currently visible rows (expanded state lives on the nodes as _expanded,
+// search and status filters are applied while flattening), and only the rows
+// inside the scroll viewport exist in the DOM.  All rows share one fixed
+// height, so row i always sits at i * TREE_ROW_H.
+const TREE_ROW_H = 28;      // must match .tree-row height in the CSS
+const TREE_OVERSCAN = 12;   // extra rows rendered above/below the viewport
+const treeView = {root: null, rows: [], query: '', content: null, spacer: null, win: null, frame: 0,
+                  parents: null, matches: null, matchNodes: null};
+
+// ─── Test search ─────────────────────────────────────────────────────
+// DATA.search is built in Python (_search_index.py): the lowercased
+// searchable fields of every test, and for every trigram the ascending list
+// of test indices containing it.  A query intersects the posting lists of its
+// trigrams and confirms the survivors with a substring check, so a keystroke
+// costs time proportional to the candidates, not the suite.  Typing more
+// characters only narrows the previous result.
+const SEARCH = DATA.search || {gram: 3, grams: null,
+  text: DATA.tests.map(t => [t.base_nodeid, t.aggregate.file, t.aggregate.function_name,
+                             t.aggregate.class_name].filter(Boolean).join('\n').toLowerCase())};
+let _lastSearch = null;
+
+function intersectSorted(a, b) {
+  const out = [];
+  let i = 0, j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] < b[j]) i++;
+    else if (a[i] > b[j]) j++;
+    else { out.push(a[i]); i++; j++; }
+  }
+  return out;
+}
+
+function searchCandidates(q) {
+  if (_lastSearch && q.includes(_lastSearch.q)) return _lastSearch.ids;
+  const n = SEARCH.gram;
+  if (!SEARCH.grams || q.length < n) return SEARCH.text.map((_, i) => i);
+  const lists = [];
+  for (let i = 0; i + n <= q.length; i++) {
+    const gram = q.slice(i, i + n);
+    if (!Object.prototype.hasOwnProperty.call(SEARCH.grams, gram)) return [];
+    lists.push(SEARCH.grams[gram]);
+  }
+  lists.sort((a, b) => a.length - b.length);
+  return lists.reduce(intersectSorted);
+}
+
+// Return the indices (into DATA.tests) of the tests matching query q.
+function searchTests(q) {
+  const ids = searchCandidates(q).filter(i => SEARCH.text[i].includes(q));
+  _lastSearch = {q, ids};
+  return ids;
+}
+
 function renderTests() {
   const panel = document.getElementById('tab-tests');
   const layout = el('div', {className:'tests-layout'});
@@ -550,7 +757,8 @@ function renderTests() {
   const expandBtn = el('button', {className:'tree-expand-btn', title:'Expand all'});
   expandBtn.innerHTML = '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"><polyline points="7 13 12 18 17 13"/><polyline points="7 6 12 11 17 6"/></svg>';
   expandBtn.addEventListener('click', () => {
-    treeContent.querySelectorAll('.tree-node').forEach(n => n.classList.add('expanded'));
+    setTreeExpanded(treeView.root, true);
+    refreshTree();
   });
   controlsRow.appendChild(expandBtn);
 
@@ -558,7 +766,8 @@ function renderTests() {
   const collapseBtn = el('button', {className:'tree-expand-btn', title:'Collapse all'});
   collapseBtn.innerHTML = '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"><polyline points="17 11 12 6 7 11"/><polyline points="17 18 12 13 7 18"/></svg>';
   collapseBtn.addEventListener('click', () => {
-    treeContent.querySelectorAll('.tree-node').forEach(n => n.classList.remove('expanded'));
+    setTreeExpanded(treeView.root, false);
+    refreshTree();
   });
   controlsRow.appendChild(collapseBtn);
 
@@ -566,11 +775,15 @@ function renderTests() {
   treePanel.appendChild(controls);
 
   const treeContent = el('div', {className:'tree-content'});
-  const rawTree = buildTree(DATA.tests);
-  const compacted = compactTree(rawTree);
-  Object.entries(compacted.children).forEach(([name, node]) => {
-    treeContent.appendChild(renderTreeNode(name, node, 0));
-  });
+  treeView.spacer = el('div', {className:'tree-spacer'});
+  treeView.win = el('div', {className:'tree-window'});
+  treeView.spacer.appendChild(treeView.win);
+  treeContent.appendChild(treeView.spacer);
+  treeContent.addEventListener('scroll', scheduleTreeWindow, {passive:true});
+  window.addEventListener('resize', scheduleTreeWindow);
+  treeView.content = treeContent;
+  treeView.root = compactTree(testTree());
+  indexTreeParents(treeView.root);
   treePanel.appendChild(treeContent);
 
   // Right panel
@@ -583,8 +796,106 @@ function renderTests() {
   layout.appendChild(treePanel);
   layout.appendChild(detailPanel);
   panel.appendChild(layout);
+  refreshTree();
+}
+
+function setTreeExpanded(node, expanded) {
+  Object.values(node.children).forEach(child => {
+    child._expanded = expanded;
+    setTreeExpanded(child, expanded);
+  });
+}
+
+function treeFilterActive() {
+  return !!treeView.query || (activeFilters.size > 0 && activeFilters.size < STATUSES.length);
+}
+
+function testMatches(test) {
+  return !treeView.matches || treeView.matches.has(test);
+}
+
+// Map every test and node of the compacted tree to its parent node, so the
+// groups containing a match are found by walking up from the match.
+function indexTreeParents(root) {
+  const parents = new Map();
+  (function walk(node) {
+    node.tests.forEach(t => parents.set(t, node));
+    Object.values(node.children).forEach(child => { parents.set(child, node); walk(child); });
+  })(root);
+  treeView.parents = parents;
+}
+
+// Recompute the tests passing the search and status filters, and the set of
+// groups containing at least one of them.  Runs once per query or filter
+// change; flattening then only does set lookups.
+function updateTreeMatches() {
+  if (!treeFilterActive()) {
+    treeView.matches = treeView.matchNodes = null;
+    return;
+  }
+  const candidates = treeView.query ? searchTests(treeView.query).map(i => DATA.tests[i]) : DATA.tests;
+  const statusOk = t => activeFilters.size === 0 || activeFilters.has(getOverallOutcome(t));
+  const matches = new Set(candidates.filter(statusOk));
+  const matchNodes = new Set();
+  matches.forEach(t => {
+    for (let node = treeView.parents.get(t); node && !matchNodes.has(node); node = treeView.parents.get(node)) {
+      matchNodes.add(node);
+    }
+  });
+  treeView.matches = matches;
+  treeView.matchNodes = matchNodes;
+}
+
+// Flatten the visible part of the tree into treeView.rows.  Without an active
+// filter only expanded nodes are visited, so a collapsed 50k-test tree costs
+// as much as its top level; with a filter, groups without a matching test are
+// hidden.
+function flattenTree() {
+  const rows = [];
+  const filtering = !!treeView.matches;
+  function visit(name, node, depth) {
+    if (filtering && !treeView.matchNodes.has(node)) return;
+    rows.push({name, node, depth});
+    if (node._mergedTest || !node._expanded) return;
+    Object.entries(node.children).forEach(([cname, cnode]) => visit(cname, cnode, depth + 1));
+    node.tests.forEach(test => {
+      if (!filtering || testMatches(test)) rows.push({test, depth: depth + 1});
+    });
+  }
+  const root = treeView.root;
+  Object.entries(root.children).forEach(([name, node]) => visit(name, node, 0));
+  root.tests.forEach(test => {
+    if (!filtering || testMatches(test)) rows.push({test, depth: 0});
+  });
+  treeView.rows = rows;
+}
+
+function refreshTree() {
+  flattenTree();
+  treeView.spacer.style.height = (treeView.rows.length * TREE_ROW_H) + 'px';
+  renderTreeWindow();
 }
 
+function scheduleTreeWindow() {
+  if (!treeView.frame) treeView.frame = requestAnimationFrame(renderTreeWindow);
+}
+
+// Render only the rows intersecting the viewport (plus overscan).
+function renderTreeWindow() {
+  if (treeView.frame) cancelAnimationFrame(treeView.frame);
+  treeView.frame = 0;
+  const content = treeView.content;
+  const rows = treeView.rows;
+  const first = Math.max(0, Math.floor(content.scrollTop / TREE_ROW_H) - TREE_OVERSCAN);
+  const last = Math.min(rows.length,
+    Math.ceil((content.scrollTop + content.clientHeight) / TREE_ROW_H) + TREE_OVERSCAN);
+  treeView.win.style.transform = `translateY(${first * TREE_ROW_H}px)`;
+  treeView.win.replaceChildren(...rows.slice(first, last).map(r =>
+    r.test ? renderTestLeaf(r.test, r.depth) : renderTreeNode(r.name, r.node, r.depth)));
+}
+
+// Render one group row.  Children are not rendered here: expanding a node
+// only changes the flattened row list.
 function renderTreeNode(name, node, depth) {
   // Merged single-function file: delegate entirely to renderTestLeaf.
   if (node._mergedTest) {
@@ -594,7 +905,7 @@ function renderTreeNode(name, node, depth) {
   const hasChildren = Object.keys(node.children).length > 0 || node.tests.length > 0;
   const agg = nodeAgg(node);
   const isClass = !!node._isClass;
-  const container = el('div', {className:'tree-node'});
+  const container = el('div', {className:'tree-node' + (node._expanded ? ' expanded' : '')});
 
   const row = el('div', {
     className: 'tree-row' + (isClass ? ' tree-class-row' : ''),
@@ -641,21 +952,10 @@ function renderTreeNode(name, node, depth) {
   row.appendChild(badges);
   row.addEventListener('click', (e) => {
     e.stopPropagation();
-    container.classList.toggle('expanded');
+    node._expanded = !node._expanded;
+    refreshTree();
   });
   container.appendChild(row);
-
-  if (hasChildren) {
-    const children = el('div', {className:'tree-children'});
-    Object.entries(node.children).forEach(([cname, cnode]) => {
-      children.appendChild(renderTreeNode(cname, cnode, depth + 1));
-    });
-    node.tests.forEach(test => {
-      children.appendChild(renderTestLeaf(test, depth + 1));
-    });
-    container.appendChild(children);
-  }
-  container._agg = agg;
   return container;
 }
 
@@ -670,7 +970,10 @@ function renderTestLeaf(test, depth) {
   const outcome = getOverallOutcome(test);
   const displayName = testDisplayName(agg);
 
-  const row = el('div', {className:'tree-row', style:`padding-left:${16 + depth * 16}px`});
+  const row = el('div', {
+    className: 'tree-row' + (test === selectedTest ? ' selected' : ''),
+    style: `padding-left:${16 + depth * 16}px`,
+  });
   const dot = el('span', {className:`status-dot ${outcome}`});
 
   // Class context comes from the parent class node (file -> class -> method),
@@ -680,9 +983,9 @@ function renderTestLeaf(test, depth) {
   const badges = el('span', {className:'tree-badges'});
   // Flaky marker: any run that needed retries gets a ↻ pill so passed-on-retry
   // tests are visible at a glance in the tree (final outcome alone hides them).
-  const anyRetried = test.runs.some(r => r.retries && r.retries.attempts > 0);
+  const anyRetried = agg.retried_runs > 0;
   if (anyRetried) {
-    const n = test.runs.reduce((a, r) => a + ((r.retries && r.retries.attempts) || 0), 0);
+    const n = agg.retry_attempts;
     badges.appendChild(el('span', {
       className: 'tree-badge retried',
       title: 'Retried (' + n + ' attempt' + (n === 1 ? '' : 's') + ')',
@@ -701,7 +1004,6 @@ function renderTestLeaf(test, depth) {
     showTestDetail(test);
   });
   container.appendChild(row);
-  container._test = test;
   return container;
 }
 
@@ -715,6 +1017,10 @@ function showTestDetail(test) {
   selectedTest = test;
   const panel = document.querySelector('.detail-panel');
   panel.innerHTML = '';
+  if (!loadShard(test, () => { if (selectedTest === test) showTestDetail(test); })) {
+    panel.appendChild(el('div', {className:'detail-empty'}, el('span', null, 'Loading…')));
+    return;
+  }
 
   const outcome = getOverallOutcome(test);
   const header = el('div', {className:'detail-header'});
@@ -916,14 +1222,14 @@ function showSubTab(tab, run) {
       const phasePanels = [];
 
       availablePhases.forEach((when, idx) => {
-        const phase = run.phases[when];
-        const btn = el('button', {className:`phase-tab-btn${idx===0?' active':''}`},
+        const phase = resolvePhase(run.phases[when]);
+        const btn = el('button', {className:`phase-tab-btn${idx===0?' active':''}`, 'data-phase':when},
           el('span', {className:`status-dot ${phase.outcome}`}),
           when.charAt(0).toUpperCase() + when.slice(1),
           el('span', {className:'phase-meta'}, phase.duration.toFixed(4) + 's')
         );
 
-        const panel = el('div', {className:`phase-tab-panel${idx===0?' active':''}`});
+        const panel = el('div', {className:`phase-tab-panel${idx===0?' active':''}`, 'data-phase':when});
         const hasEntries = phase.entries && phase.entries.length > 0;
         if (hasEntries || phase.longrepr) {
           if (hasEntries) {
@@ -990,8 +1296,9 @@ function showSubTab(tab, run) {
         htmlFiles.forEach(a => {
           const label = el('div', {style:'font-size:12px;font-weight:600;color:var(--c-text2);margin-bottom:8px;text-transform:uppercase;letter-spacing:0.04em'}, a.name);
           content.appendChild(label);
-          if (a.data_uri) {
-            const iframe = el('iframe', {className:'artifact-html-frame', src:a.data_uri, sandbox:'allow-same-origin', style:'pointer-events:auto'});
+          const src = artifactSrc(a);
+          if (src) {
+            const iframe = el('iframe', {className:'artifact-html-frame', src:src, sandbox:'allow-same-origin', style:'pointer-events:auto'});
             // Auto-resize iframe to content
             iframe.addEventListener('load', () => {
               try {
@@ -1009,10 +1316,11 @@ function showSubTab(tab, run) {
         const grid = el('div', {className:'artifact-grid'});
         images.forEach(a => {
           const card = el('div', {className:'artifact-card'});
-          if (a.data_uri) {
-            const img = el('img', {className:'artifact-thumb', src:a.data_uri, alt:a.name, loading:'lazy'});
+          const src = artifactSrc(a);
+          if (src) {
+            const img = el('img', {className:'artifact-thumb', src:src, alt:a.name, loading:'lazy'});
             card.appendChild(img);
-            card.addEventListener('click', () => openLightbox(a.data_uri, a.name));
+            card.addEventListener('click', () => openLightbox(src, a.name));
           }
           card.appendChild(el('div', {className:'artifact-info'},
             el('div', {className:'artifact-name'}, a.name),
@@ -1032,7 +1340,9 @@ function showSubTab(tab, run) {
           icon.innerHTML = '<svg width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"><path d="M14 2H6a2 2 0 00-2 2v16a2 2 0 002 2h12a2 2 0 002-2V8z"/><polyline points="14 2 14 8 20 8"/></svg>';
           card.appendChild(icon);
           card.appendChild(el('div', null,
-            el('div', {className:'artifact-name'}, a.name),
+            a.href
+              ? el('a', {className:'artifact-name', href:a.href, target:'_blank', rel:'noopener'}, a.name)
+              : el('div', {className:'artifact-name'}, a.name),
             el('div', {className:'artifact-size'}, formatSize(a.size))
           ));
           list.appendChild(card);
@@ -1054,7 +1364,7 @@ function showSubTab(tab, run) {
         'Original Failure'
       );
       origCard.appendChild(origHeader);
-      if (run.phases && run.phases.call && run.phases.call.longrepr) {
+      if (run.phases && resolvePhase(run.phases.call) && run.phases.call.longrepr) {
         const body = el('div', {className:'phase-tab-body'});
         body.textContent = run.phases.call.longrepr;
         origCard.appendChild(body);
@@ -1088,7 +1398,7 @@ function showSubTab(tab, run) {
           const pBar = el('div', {className:'phase-tabs-bar'});
           const pPanels = [];
           availP.forEach((w, pi) => {
-            const ph = attempt.phases[w];
+            const ph = resolvePhase(attempt.phases[w]);
             const pbtn = el('button', {className:`phase-tab-btn${pi===0?' active':''}`},
               el('span', {className:`status-dot ${ph.outcome}`}),
               w.charAt(0).toUpperCase() + w.slice(1),
@@ -1124,14 +1434,25 @@ function showSubTab(tab, run) {
 }
 
 // ─── Render helpers ─────────────────────────────────────────────────
+function logTime(t) {
+  return t ? t.split('T')[1]?.replace('Z','') || '' : '';
+}
+
 function renderLogEntries(entries) {
   const container = el('div', {className:'log-entries'});
   entries.forEach(e => {
     const row = el('div', {className:'log-entry', 'data-level': e.level || ''});
-    row.appendChild(el('span', {className:'log-entry-time'}, e.t ? e.t.split('T')[1]?.replace('Z','') || '' : ''));
+    row.appendChild(el('span', {className:'log-entry-time'}, logTime(e.t)));
     const lvl = el('span', {className:`log-entry-level ${e.level || ''}`}); lvl.textContent = e.level || ''; row.appendChild(lvl);
     row.appendChild(el('span', {className:'log-entry-source'}, (e.source || []).join('.')));
-    row.appendChild(el('span', {className:'log-entry-msg'}, e.msg || ''));
+    const msg = el('span', {className:'log-entry-msg'}, e.msg || '');
+    if (e.repeat > 1) {
+      // Consecutive identical entries coalesced by the logger
+      msg.appendChild(el('span', {className:'log-entry-repeat',
+        title:`Repeated ${e.repeat} times, ${logTime(e.t)} to ${logTime(e.last_t)}`},
+        `×${e.repeat}`));
+    }
+    row.appendChild(msg);
     if (e.data && e.data._type === 'table') {
       row.appendChild(renderInlineTable(e.data));
     } else if (e.data) {
@@ -1511,6 +1832,15 @@ function renderAllSatisfyBody(check) {
   return wrap;
 }
 
+// Embedded artifacts are content-addressed: identical files share one
+// DATA.blobs entry and reference it by id.  In --report-artifacts=link mode
+// entries carry an href relative to report.html instead.
+function artifactSrc(a) {
+  if (a.data_uri) return a.data_uri;
+  if (a.blob) return (DATA.blobs && DATA.blobs[a.blob]) || null;
+  return a.href || null;
+}
+
 function formatSize(bytes) {
   if (bytes == null) return '';
   if (bytes < 1024) return bytes + ' B';
@@ -1566,46 +1896,27 @@ function openLightbox(src, alt) {
 }
 
 function filterTree(query) {
-  const q = query.toLowerCase();
-  document.querySelectorAll('.tree-node').forEach(node => {
-    const test = node._test;
-    if (test) {
-      const match = !q || test.aggregate.function_name.toLowerCase().includes(q)
-        || test.aggregate.file.toLowerCase().includes(q)
-        || test.base_nodeid?.toLowerCase().includes(q)
-        || test.aggregate.class_name?.toLowerCase().includes(q);
-      node.style.display = match ? '' : 'none';
-      // Auto-expand parents if match
-      if (match && q) {
-        let parent = node.parentElement;
-        while (parent) {
-          if (parent.classList?.contains('tree-node')) parent.classList.add('expanded');
-          parent = parent.parentElement;
-        }
-      }
-    }
-  });
+  treeView.query = query.toLowerCase();
+  updateTreeMatches();
+  // Auto-expand the groups leading to every match.
+  if (treeView.query) treeView.matchNodes.forEach(node => { node._expanded = true; });
+  treeView.content.scrollTop = 0;
+  refreshTree();
 }
 
 function toggleFilter(status, btn) {
   btn.classList.toggle('active');
   if (activeFilters.has(status)) activeFilters.delete(status);
   else activeFilters.add(status);
-  document.querySelectorAll('.tree-node').forEach(node => {
-    const test = node._test;
-    if (test) {
-      const outcome = getOverallOutcome(test);
-      const show = activeFilters.size === 0 || activeFilters.has(outcome);
-      node.style.display = show ? '' : 'none';
-    }
-  });
+  updateTreeMatches();
+  refreshTree();
 }
 
 // ─── Session Logs Tab ────────────────────────────────────────────────
 function renderSessionLogs() {
   const panel = document.getElementById('tab-session-logs');
   const container = el('div', {className:'session-log-container'});
-  const entries = (DATA.session_log && DATA.session_log.entries) || [];
+  const entries = ((DATA.session_log && DATA.session_log.entries) || []).map(resolveEntry);
   if (entries.length === 0) {
     container.appendChild(el('div', {className:'session-log-empty'}, 'No session logs recorded'));
     panel.appendChild(container);
@@ -1787,7 +2098,7 @@ function renderReport() {
   const metaRows = [
     ['Timestamp', formatTimestamp(DATA.timestamp)],
     ['Duration', formatDuration(DATA.duration)],
-    ['Exit Code', String(DATA.exit_code)],
+    ['Exit Code', DATA.exit_code == null ? null : String(DATA.exit_code)],
     ['Python', DATA.python_version],
     ['Pytest', DATA.pytest_version],
     ['Platform', DATA.platform],
@@ -1795,7 +2106,7 @@ function renderReport() {
   metaRows.forEach(([label, value]) => {
     metaBody.appendChild(el('div', {className:'report-info-row'},
       el('span', {className:'report-info-label'}, label),
-      el('span', {className:'report-info-value'}, value)
+      el('span', {className:'report-info-value'}, value == null ? '—' : value)
     ));
   });
   // Seed row (rendered separately to support conditional mono / not-provided styling)
@@ -1805,6 +2116,11 @@ function renderReport() {
       ? el('span', {className:'report-info-value mono'}, DATA.seed)
       : el('span', {className:'report-info-not-provided'}, 'Not Provided')
   ));
+  // Filled in once the initial render has finished (see Init).
+  metaBody.appendChild(el('div', {className:'report-info-row'},
+    el('span', {className:'report-info-label'}, 'Report Load'),
+    el('span', {className:'report-info-value', id:'report-load-time'}, '')
+  ));
   metaSection.appendChild(metaBody);
   container.appendChild(metaSection);
 
@@ -1889,6 +2205,8 @@ function switchTab(name) {
     b.setAttribute('aria-selected', isActive);
   });
   document.querySelectorAll('.tab-panel').forEach(p => p.classList.toggle('active', p.id === 'tab-' + name));
+  // The virtual tree measures its viewport, which is 0px tall while hidden.
+  if (name === 'tests' && treeView.content) renderTreeWindow();
 }
 document.querySelectorAll('.tab-btn').forEach(btn => {
   btn.addEventListener('click', () => switchTab(btn.dataset.tab));
@@ -1919,8 +2237,226 @@ document.querySelector('.tabs').addEventListener('keydown', (e) => {
   metaEl.appendChild(badge);
 })();
 
+// ─── Log search ──────────────────────────────────────────────────────
+// The report-log-search block is built in Python (_search_index.py): sorted
+// word tokens of every log message, exception and traceback, each with the
+// ascending list of [test, run, phase, entry] locations containing it (entry
+// -1 is the phase's traceback).  All query words must occur in the same entry;
+// the last word matches as a prefix so results follow the typing.  It grows
+// with the log volume, so it is parsed when the log search is first used.
+let LOG_SEARCH = null;
+const LOG_SEARCH_LIMIT = 50;
+
+// Parse the log index on first use.  Returns null while a compressed block
+// is being inflated; onLoaded is called when it is ready.
+function loadLogSearch(onLoaded) {
+  if (LOG_SEARCH) return LOG_SEARCH;
+  const text = loadBlock('report-log-search', onLoaded);
+  if (text === null) return null;
+  try {
+    LOG_SEARCH = JSON.parse(text);
+  } catch (e) {
+    console.error('pytest-reporter: log search index could not be parsed', e);
+    LOG_SEARCH = {locs: [], terms: [], postings: []};
+  }
+  return LOG_SEARCH;
+}
+
+function logTermPostings(word, prefix) {
+  const terms = LOG_SEARCH.terms;
+  let lo = 0, hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (terms[mid] < word) lo = mid + 1; else hi = mid;
+  }
+  if (!prefix) return terms[lo] === word ? LOG_SEARCH.postings[lo] : [];
+  const locs = new Set();
+  for (let i = lo; i < terms.length && terms[i].startsWith(word); i++) {
+    LOG_SEARCH.postings[i].forEach(l => locs.add(l));
+  }
+  return Array.from(locs).sort((a, b) => a - b);
+}
+
+// Return the location indices (into LOG_SEARCH.locs) matching query; none
+// while the index is not loaded yet.
+function searchLogs(query) {
+  if (!loadLogSearch()) return [];
+  const q = query.toLowerCase();
+  const words = (q.match(/[\p{L}\p{N}\p{M}_]+/gu) || []).map(w => w.slice(0, 40));
+  const prefixLast = !/[^\p{L}\p{N}\p{M}_]$/u.test(q);
+  const lists = [];
+  words.forEach((w, i) => {
+    if (w.length < 2) return;   // single characters are not indexed
+    lists.push(logTermPostings(w, prefixLast && i === words.length - 1));
+  });
+  if (!lists.length) return [];
+  lists.sort((a, b) => a.length - b.length);
+  return lists.reduce(intersectSorted);
+}
+
+function logHitText(test, run, when, entry) {
+  if (!loadShard(test)) return '';
+  const phase = resolvePhase(run.phases[when]);
+  if (entry < 0) return phase.longrepr || '';
+  const e = phase.entries[entry];
+  return [e.msg, e.exc && `${e.exc.type}: ${e.exc.msg}`].filter(Boolean).join(' — ');
+}
+
+function logHitSnippet(text, q) {
+  const words = q.toLowerCase().match(/[\p{L}\p{N}\p{M}_]{2,}/gu) || [];
+  const lower = text.toLowerCase();
+  const at = Math.max(0, ...words.map(w => lower.indexOf(w)));
+  const start = Math.max(0, at - 40);
+  return (start > 0 ? '…' : '') + text.slice(start, start + 140).replace(/\s+/g, ' ');
+}
+
+// Open the run holding a log hit and scroll the matching entry into view.
+function revealLogHit(loc) {
+  const [t, r, when, entry] = LOG_SEARCH.locs[loc];
+  const test = DATA.tests[t];
+  const run = test.runs[r];
+  switchTab('tests');
+  if (!loadShard(test, () => revealLogHit(loc))) return;
+  showTestDetail(test);
+  showRunDetail(run);
+  revealTreeTest(test);
+  const content = document.getElementById('sub-tab-content');
+  const btn = content && content.querySelector(`.phase-tab-btn[data-phase="${when}"]`);
+  if (!btn) return;
+  btn.click();
+  const panel = content.querySelector(`.phase-tab-panel[data-phase="${when}"]`);
+  const list = panel.querySelector('.log-entries');
+  const target = entry < 0 ? panel.querySelector('.phase-tab-body') : list && list.children[entry];
+  if (!target) return;
+  target.classList.add('search-hit');
+  target.scrollIntoView({block: 'center'});
+}
+
+// Expand the groups above a test and scroll its tree row into view.
+function revealTreeTest(test) {
+  if (!treeView.parents) return;
+  for (let node = treeView.parents.get(test); node; node = treeView.parents.get(node)) {
+    node._expanded = true;
+  }
+  refreshTree();
+  const idx = treeView.rows.findIndex(r => r.test === test || (r.node && r.node._mergedTest === test));
+  if (idx >= 0) {
+    treeView.content.scrollTop = Math.max(0, (idx - 3) * TREE_ROW_H);
+    renderTreeWindow();
+  }
+}
+
+function renderLogSearch() {
+  const box = el('div', {className:'search-box log-search'});
+  const icon = el('span', {className:'search-icon'});
+  icon.innerHTML = '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round"><circle cx="11" cy="11" r="8"/><line x1="21" y1="21" x2="16.65" y2="16.65"/></svg>';
+  const input = el('input', {className:'search-input', placeholder:'Search logs and tracebacks...',
+                             type:'text', 'aria-label':'Search logs and tracebacks'});
+  const results = el('div', {className:'log-search-results', role:'listbox'});
+  let hits = [];
+  let timer;
+
+  function close() { results.classList.remove('open'); }
+  function update() {
+    const q = input.value.trim();
+    results.replaceChildren();
+    hits = [];
+    if (!q) { close(); return; }
+    if (!loadLogSearch(update)) return;
+    hits = searchLogs(q);
+    // Hit snippets are read from the shards: wait for a compressed block to inflate.
+    if (hits.length && !loadShardLines(update)) return;
+    const tests = new Set(hits.map(l => LOG_SEARCH.locs[l][0]));
+    results.appendChild(el('div', {className:'log-search-count'},
+      hits.length ? `${hits.length} match${hits.length === 1 ? '' : 'es'} in ${tests.size} test${tests.size === 1 ? '' : 's'}`
+                  : 'No matches'));
+    hits.slice(0, LOG_SEARCH_LIMIT).forEach(loc => {
+      const [t, r, when, entry] = LOG_SEARCH.locs[loc];
+      const test = DATA.tests[t];
+      const run = test.runs[r];
+      const name = testDisplayName(test.aggregate) + (run.parametrize_id ? ` [${run.parametrize_id}]` : '');
+      const item = el('button', {className:'log-search-hit', role:'option'},
+        el('span', {className:'log-search-hit-head'},
+          el('span', {className:`status-dot ${run.outcome}`}),
+          el('span', {className:'log-search-hit-name'}, name),
+          el('span', {className:'log-search-hit-where'}, when + (entry < 0 ? ' · traceback' : ''))),
+        el('span', {className:'log-search-hit-text'}, logHitSnippet(logHitText(test, run, when, entry), q)));
+      item.addEventListener('click', () => { close(); revealLogHit(loc); });
+      results.appendChild(item);
+    });
+    if (hits.length > LOG_SEARCH_LIMIT) {
+      results.appendChild(el('div', {className:'log-search-count'},
+        `Showing the first ${LOG_SEARCH_LIMIT}; refine the query to narrow down`));
+    }
+    results.classList.add('open');
+  }
+
+  input.addEventListener('input', () => {
+    clearTimeout(timer);
+    timer = setTimeout(update, 80);
+  });
+  input.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape') { close(); input.blur(); }
+    if (e.key === 'Enter') {
+      clearTimeout(timer);
+      update();
+      if (hits.length) { close(); revealLogHit(hits[0]); }
+    }
+  });
+  input.addEventListener('focus', () => { if (input.value.trim()) results.classList.add('open'); });
+  // Keep focus in the box while a result is clicked, so blur does not hide it first.
+  results.addEventListener('mousedown', (e) => e.preventDefault());
+  input.addEventListener('blur', close);
+
+  box.appendChild(icon);
+  box.appendChild(input);
+  box.appendChild(results);
+  document.querySelector('.header').insertBefore(box, document.getElementById('header-meta'));
+}
+
 // ─── Init ────────────────────────────────────────────────────────────
+// A served report has no log index (its data is built without log_search, so
+// its block is empty): it gets no log search box rather than one that never
+// matches.
+const logSearchBlock = document.getElementById('report-log-search');
+if (logSearchBlock && logSearchBlock.textContent) renderLogSearch();
 renderSummary();
 renderTests();
 renderSessionLogs();
-renderReport();"""
+renderReport();
+
+// Load timing: data parse time and time from navigation start until the
+// report finished its initial render (which includes reading the HTML).
+LOAD_STATS.readyMs = performance.now();
+document.getElementById('report-load-time').textContent =
+  (LOAD_STATS.inflateMs !== undefined ? `inflated in ${Math.round(LOAD_STATS.inflateMs)} ms \u00b7 ` : '') +
+  `${formatSize(LOAD_STATS.payloadChars)} data parsed in ${Math.round(LOAD_STATS.parseMs)} ms` +
+  ` \u00b7 interactive after ${Math.round(LOAD_STATS.readyMs)} ms`;"""
+
+
+INFLATE_JS: str = r"""// Compressed report loader: each payload block holds a JSON string with the
+// base64 of its zlib-deflated text.  Inflate report-data with the browser's
+// DecompressionStream, hand its text to the app via REPORT_JSON and start the
+// app script (emitted as inert text/plain).  The other blocks are inflated by
+// the app on first use, through REPORT_INFLATE.
+(async function() {
+  const start = performance.now();
+  async function inflate(id) {
+    try {
+      const bin = atob(JSON.parse(document.getElementById(id).textContent));
+      const bytes = new Uint8Array(bin.length);
+      for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+      const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+      return await new Response(stream).text();
+    } catch (e) {
+      console.error('pytest-reporter: compressed report data could not be inflated', e);
+      return '';
+    }
+  }
+  window.REPORT_JSON = await inflate('report-data');
+  window.REPORT_INFLATE_MS = performance.now() - start;
+  window.REPORT_INFLATE = inflate;
+  const app = document.createElement('script');
+  app.textContent = document.getElementById('report-app').textContent;
+  document.body.appendChild(app);
+})();"""
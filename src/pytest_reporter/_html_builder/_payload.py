@@ -0,0 +1,282 @@
+"""Streaming REPORT_DATA serialiser.
+
+Writes the report payload fragment by fragment (test by test, run by run)
+into a text sink, byte-identical to a one-shot ``json.dumps`` of the same
+data, with ``</`` escaping applied on the fly.  Lazy
+:class:`~pytest_reporter._artifacts.EmbeddedFile` values are expanded into
+chunked base64 straight into the sink as they are reached.
+
+The payload is split in two blocks: the *index* (REPORT_DATA with every run
+reduced to its summary fields, parsed when the report opens) and the
+*shards* (one JSON line per test holding its runs' :data:`SHARD_KEYS`,
+parsed only when that test is opened).  When REPORT_DATA carries a
+:class:`~pytest_reporter._string_table.StringTable` under ``strings``, each
+test's phases are interned as its line is written and the table follows the
+last test as a ``{"strings": [...]}`` trailer line.  REPORT_DATA built from
+disk (``rebuild``, ``merge``) holds index-form tests and, under ``shards``,
+an iterator of their run details, read from disk as the lines are written.
+
+The log search index (``log_search``) is a third block, parsed when the log
+search is first used: it grows with the log volume, like the shards.
+
+:class:`DeflateBase64Sink` sits between the serialiser and the file for
+compressed reports (``--report-compress``).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import secrets
+import warnings
+import zlib
+from collections.abc import Callable
+from typing import Any
+
+from .._artifacts import EmbeddedFile
+from .._string_table import StringTable
+
+Write = Callable[[str], object]
+
+# Run fields moved out of the index into the test's shard: everything only
+# the test detail panel (and the log search results) needs.
+SHARD_KEYS = ("phases", "procedure", "artifacts", "retry_attempts", "check_results")
+
+# REPORT_DATA members written to (or driving) their own blocks, not the index.
+_BLOCK_SOURCES = ("strings", "shards", "log_search")
+
+
+def index_test(test: Any, shard: int) -> Any:  # noqa: ANN401
+    """Return the index form of one DATA.tests item: runs without shard fields.
+
+    The copy records its line in the shards block as ``shard``.  Values of
+    unexpected shape are returned unchanged (and keep their details inline).
+    """
+    if not isinstance(test, dict) or not isinstance(test.get("runs"), list):
+        return test
+    runs = [
+        {k: v for k, v in run.items() if k not in SHARD_KEYS} if isinstance(run, dict) else run
+        for run in test["runs"]
+    ]
+    return {**test, "runs": runs, "shard": shard}
+
+
+def shard_runs(test: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    """Return the shard of one DATA.tests item: per run, its shard fields."""
+    if not isinstance(test, dict) or not isinstance(test.get("runs"), list):
+        return []
+    return shard_fields(test["runs"])
+
+
+def shard_fields(runs: list[Any]) -> list[dict[str, Any]]:
+    """Return, per run dict of *runs*, its :data:`SHARD_KEYS` fields."""
+    return [
+        {k: run[k] for k in SHARD_KEYS if k in run} if isinstance(run, dict) else {} for run in runs
+    ]
+
+
+def _safe_default(o: object) -> str:
+    """JSON encoder default: convert non-serializable values to a string fallback.
+
+    Called by ``json.dumps`` when a value cannot be serialized natively.
+    If ``str(o)`` itself raises (e.g. a ``__str__`` that throws), falls back to
+    ``<unserializable TypeName>`` and emits a ``UserWarning``.
+
+    Args:
+        o: The non-serializable object.
+
+    Returns:
+        A string representation of ``o``.
+    """
+    try:
+        return str(o)
+    except Exception as exc:  # noqa: BLE001
+        type_name = type(o).__name__
+        warnings.warn(
+            f"pytest-reporter: non-serializable value of type {type_name!r} "
+            f"could not be converted to string: {exc}",
+            stacklevel=4,
+        )
+        return f"<unserializable {type_name}>"
+
+
+def _script_escape(s: str) -> str:
+    """Escape ``</`` to prevent script-tag breakout in an inline ``<script>`` block.
+
+    Replaces every occurrence of ``</`` with ``<\\/`` so that a user-controlled
+    string such as ``</script><script>alert(1)</script>`` cannot terminate the
+    enclosing ``<script>`` element.  Applied to every JSON fragment BEFORE it
+    is written into the template (REQ-4, H2).
+
+    Args:
+        s: The JSON string to escape.
+
+    Returns:
+        The escaped string with all ``</`` replaced by ``<\\/``.
+    """
+    return s.replace("</", "<\\/")
+
+
+class DeflateBase64Sink:
+    """Text sink that zlib-deflates everything written and emits it as base64.
+
+    The output is one continuous base64 string of the zlib stream (what the
+    browser's ``DecompressionStream('deflate')`` expects), written in pieces
+    as the compressor produces them; call :meth:`close` to flush the tail.
+    """
+
+    def __init__(self, write: Write, level: int = 6) -> None:
+        self._write = write
+        self._compressor = zlib.compressobj(level)
+        self._pending = b""  # compressed bytes not yet aligned to 3 for base64
+
+    def write(self, text: str) -> None:
+        """Compress *text* and write whatever base64 output is complete."""
+        self._emit(self._compressor.compress(text.encode("utf-8")))
+
+    def _emit(self, data: bytes) -> None:
+        data = self._pending + data
+        cut = len(data) - len(data) % 3
+        if cut:
+            self._write(base64.b64encode(data[:cut]).decode("ascii"))
+        self._pending = data[cut:]
+
+    def close(self) -> None:
+        """Flush the compressor and write the final (padded) base64 group."""
+        self._emit(self._compressor.flush())
+        self._write(base64.b64encode(self._pending).decode("ascii"))
+        self._pending = b""
+
+
+class PayloadWriter:
+    """Serialise REPORT_DATA into a text sink one fragment at a time.
+
+    Fragments always start and end on a JSON token boundary, so escaping each
+    one independently never misses a ``</`` pair split across two writes.
+    """
+
+    def __init__(self, write: Write) -> None:
+        self._write = write
+        # Embedded files met while dumping the current fragment; each is
+        # replaced by a per-writer token that cannot collide with user data.
+        self._files: list[EmbeddedFile] = []
+        self._token = f"@@pytest-reporter-embed:{secrets.token_hex(8)}:"
+        self._token_re = re.compile('"' + re.escape(self._token) + r'(\d+)@@"')
+
+    def _default(self, o: object) -> object:
+        if isinstance(o, EmbeddedFile):
+            self._files.append(o)
+            return f"{self._token}{len(self._files) - 1}@@"
+        return _safe_default(o)
+
+    def dumps(self, value: object) -> str:
+        """Serialise one fragment with the H1 robustness settings."""
+        return json.dumps(
+            value, indent=None, ensure_ascii=True, skipkeys=True, default=self._default
+        )
+
+    def emit(self, fragment: str) -> None:
+        """Escape and write *fragment*, streaming any embedded files it references."""
+        if not self._files:
+            self._write(_script_escape(fragment))
+            return
+        pos = 0
+        for m in self._token_re.finditer(fragment):
+            self._write(_script_escape(fragment[pos : m.start()]))
+            self._files[int(m.group(1))].write_json(self._write)
+            pos = m.end()
+        self._write(_script_escape(fragment[pos:]))
+        self._files.clear()
+
+    def value(self, value: object) -> None:
+        """Write one fully serialised JSON value."""
+        self.emit(self.dumps(value))
+
+    def members(self, obj: dict[str, Any], expand: dict[str, Callable[[Any], None]]) -> None:
+        """Stream a JSON object member by member, byte-identical to ``json.dumps``.
+
+        Members named in *expand* are written by their streaming callback; every
+        other member is serialised on its own (``{k: v}`` with the braces
+        stripped, so ``skipkeys`` drops a bad key exactly as the one-shot dump
+        would).
+        """
+        self._write("{")
+        first = True
+        for key, value in obj.items():
+            stream = expand.get(key) if isinstance(key, str) else None
+            if stream is not None:
+                member = self.dumps(key) + ": "
+            else:
+                member = self.dumps({key: value})[1:-1]
+                if not member:
+                    continue
+            if not first:
+                self._write(", ")
+            first = False
+            self.emit(member)
+            if stream is not None:
+                stream(value)
+        self._write("}")
+
+    def array(self, items: Any, item_writer: Callable[[Any], None]) -> None:  # noqa: ANN401
+        """Stream a JSON array, delegating each element to *item_writer*."""
+        self._write("[")
+        for i, item in enumerate(items):
+            if i:
+                self._write(", ")
+            item_writer(item)
+        self._write("]")
+
+    def test(self, test: Any) -> None:  # noqa: ANN401
+        """Stream one DATA.tests item run by run."""
+        if not isinstance(test, dict):
+            self.value(test)
+            return
+        self.members(test, {"runs": lambda runs: self.array(runs, self.value)})
+
+    def report_data(self, data: dict[str, Any]) -> None:
+        """Stream the REPORT_DATA object test by test."""
+        self.members(data, {"tests": lambda tests: self.array(tests, self.test)})
+
+    def report_index(self, data: dict[str, Any]) -> None:
+        """Stream the index block: REPORT_DATA with every test in index form.
+
+        ``strings`` and ``shards`` are left out: they feed :meth:`report_shards`
+        (the string table is only complete once the shards are written).
+        ``log_search`` is left out for :meth:`report_log_search`.
+        """
+        data = {k: v for k, v in data.items() if k not in _BLOCK_SOURCES}
+        tests = data.get("tests")
+        if isinstance(tests, list):
+            data["tests"] = (index_test(t, i) for i, t in enumerate(tests))
+        self.report_data(data)
+
+    def report_shards(self, data: dict[str, Any]) -> None:
+        """Stream the shards block: one line per test, in DATA.tests order.
+
+        A test's runs are taken from the next item of ``shards`` when given,
+        else from the test itself.  With a string table under ``strings``,
+        they are interned just before their line is written, and the table is
+        written last as a ``{"strings": [...]}`` line.
+        """
+        tests = data.get("tests")
+        if not isinstance(tests, list):
+            return
+        strings = data.get("strings")
+        table = strings if isinstance(strings, StringTable) else None
+        shards = iter(data["shards"]) if data.get("shards") is not None else None
+        for i, test in enumerate(tests):
+            if i:
+                self._write("\n")
+            runs = shard_runs(test) if shards is None else shard_fields(next(shards, []))
+            self.array(table.runs(runs) if table else runs, self.value)
+        if table is not None:
+            if tests:
+                self._write("\n")
+            self.value({"strings": table.values})
+
+    def report_log_search(self, data: dict[str, Any]) -> None:
+        """Write the log search block: the ``log_search`` index, if any."""
+        if data.get("log_search") is not None:
+            self.value(data["log_search"])
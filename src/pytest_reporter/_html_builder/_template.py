@@ -30,29 +30,43 @@ _SKELETON = r"""<!DOCTYPE html>
 <div id="tab-tests" class="tab-panel" role="tabpanel"></div>
 <div id="tab-session-logs" class="tab-panel" role="tabpanel"></div>
 <div id="tab-report" class="tab-panel" role="tabpanel"></div>
-<script>
+<script type="application/json" id="report-data">/*__REPORT_DATA__*/</script>
+<script type="application/json" id="report-shards">/*__REPORT_SHARDS__*/</script>
+<script type="application/json" id="report-log-search">/*__REPORT_LOG_SEARCH__*/</script>
+<script/*__APP_ATTRS__*/>
 /*__JS__*/
-</script>
+</script>/*__LOADER__*/
 </body>
 </html>
 """
 
 
-def build_skeleton(css: str, js: str) -> str:
+def build_skeleton(css: str, js: str, loader: str | None = None) -> str:
     """Assemble the full HTML document skeleton with CSS and JS substituted in.
 
     The ``/*__CSS__*/`` and ``/*__JS__*/`` markers in ``_SKELETON`` are replaced
-    with the provided ``css`` and ``js`` strings respectively.  The two data
-    markers (``/*__REPORT_DATA__*/`` and ``/*__SYSTEM_METADATA_JSON__*/``) are
-    kept intact inside ``js`` for the assembler to substitute at report-build
-    time.
+    with the provided ``css`` and ``js`` strings respectively.  The data
+    markers are kept intact for the assembler to substitute at report-build
+    time: ``/*__REPORT_DATA__*/``, ``/*__REPORT_SHARDS__*/`` and
+    ``/*__REPORT_LOG_SEARCH__*/`` sit in the skeleton's JSON data blocks,
+    ``/*__SYSTEM_METADATA_JSON__*/`` inside ``js``.
 
     Args:
         css: The raw CSS body to embed between ``<style>`` tags.
         js: The raw JavaScript body to embed between ``<script>`` tags.
-            Must contain the two report-data markers.
+            Must contain the ``/*__SYSTEM_METADATA_JSON__*/`` marker.
+        loader: Optional script that prepares the report data and then starts
+            the app itself.  When given, the app script is emitted as inert
+            ``text/plain`` (``id="report-app"``) and *loader* runs after it.
 
     Returns:
         A complete HTML document string ready for data injection.
     """
-    return _SKELETON.replace("/*__CSS__*/", css).replace("/*__JS__*/", js)
+    app_attrs = ' type="text/plain" id="report-app"' if loader else ""
+    loader_html = f"\n<script>\n{loader}\n</script>" if loader else ""
+    # Placeholders are filled before the CSS/JS bodies are inserted, so the
+    # bodies themselves are never scanned for them.
+    skeleton = _SKELETON.replace("/*__APP_ATTRS__*/", app_attrs).replace(
+        "/*__LOADER__*/", loader_html
+    )
+    return skeleton.replace("/*__CSS__*/", css).replace("/*__JS__*/", js)
@@ -0,0 +1,140 @@
+"""Append-only run journal — the ``--report-layout=journal`` storage backend.
+
+Instead of one small JSON file per phase, procedure, parameter set and
+aggregate under ``tests/<module>/<file>/<function>/<run_id>/``, every record
+is appended as one line to ``run.jsonl`` in the run directory::
+
+    {"type": "phase", "path": "tests/m/test_a.py/test_x/01/call.log.json", "data": {...}}
+
+``path`` is the file the record would have been written to in the default
+tree layout (relative to the run directory), so readers address records the
+same way in both layouts.  When the journal is closed, ``run.index.json``
+maps each path to the byte ``[offset, length]`` of its latest record, so a
+reader can seek straight to one record without scanning the journal.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import warnings
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+JOURNAL_NAME = "run.jsonl"
+INDEX_NAME = "run.index.json"
+
+
+def _relative_path(run_dir: Path, path: Path) -> str | None:
+    try:
+        return path.relative_to(run_dir).as_posix()
+    except ValueError:
+        return None
+
+
+class RunJournal:
+    """Writer for ``run.jsonl``; installed for the session via ``_json_writer._set_journal``."""
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self._index: dict[str, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        run_dir.mkdir(parents=True, exist_ok=True)
+        self._fh = (run_dir / JOURNAL_NAME).open("ab")
+        self._offset = self._fh.tell()
+
+    def relative_path(self, path: Path) -> str | None:
+        """Return *path* relative to the run directory, or ``None`` if outside it."""
+        return _relative_path(self.run_dir, path)
+
+    def append(self, kind: str, rel_path: str, data: Any) -> None:  # noqa: ANN401
+        """Append one typed record for *rel_path*."""
+        line = (
+            json.dumps({"type": kind, "path": rel_path, "data": data}, default=str) + "\n"
+        ).encode("utf-8")
+        with self._lock:
+            self._fh.write(line)
+            self._index[rel_path] = (self._offset, len(line))
+            self._offset += len(line)
+
+    def close(self) -> None:
+        """Flush the journal and write the offset index next to it."""
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.close()
+            index = {"journal": JOURNAL_NAME, "records": self._index}
+            (self.run_dir / INDEX_NAME).write_text(
+                json.dumps(index, separators=(",", ":")), encoding="utf-8"
+            )
+
+
+class JournalReader:
+    """Random-access reader over a run directory's ``run.jsonl``.
+
+    Uses ``run.index.json`` when present; a journal without an index (e.g. a
+    run that was killed before session end) is indexed by one scan.  Lines
+    that cannot be parsed are skipped with a warning.
+    """
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self._path = run_dir / JOURNAL_NAME
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict[str, tuple[int, int]]:
+        try:
+            raw = json.loads((self.run_dir / INDEX_NAME).read_text(encoding="utf-8"))
+            return {str(k): (int(v[0]), int(v[1])) for k, v in raw["records"].items()}
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            pass
+        index: dict[str, tuple[int, int]] = {}
+        offset = 0
+        try:
+            with self._path.open("rb") as fh:
+                for line in fh:
+                    try:
+                        index[json.loads(line)["path"]] = (offset, len(line))
+                    except (ValueError, KeyError, TypeError):
+                        warnings.warn(
+                            f"pytest-reporter: journal record skipped (unparseable) "
+                            f"at byte {offset}: {self._path}",
+                            stacklevel=3,
+                        )
+                    offset += len(line)
+        except OSError:
+            return {}
+        return index
+
+    def relative_path(self, path: Path) -> str | None:
+        """Return *path* relative to the run directory, or ``None`` if outside it."""
+        return _relative_path(self.run_dir, path)
+
+    def __contains__(self, rel_path: str) -> bool:
+        return rel_path in self._index
+
+    def paths(self) -> list[str]:
+        """Return every record path in the journal, in first-written order."""
+        return list(self._index)
+
+    def children(self, rel_dir: str) -> list[str]:
+        """Return the sorted names directly under *rel_dir*, like ``iterdir`` on the tree."""
+        prefix = rel_dir.rstrip("/") + "/"
+        return sorted(
+            {p[len(prefix) :].split("/", 1)[0] for p in self._index if p.startswith(prefix)}
+        )
+
+    def get(self, rel_path: str) -> Any:  # noqa: ANN401
+        """Return the latest record data for *rel_path*.
+
+        Raises:
+            KeyError: If the journal holds no record for *rel_path*.
+            OSError: If the journal cannot be read.
+            ValueError: If the record is not valid JSON.
+        """
+        offset, length = self._index[rel_path]
+        with self._path.open("rb") as fh:
+            fh.seek(offset)
+            return json.loads(fh.read(length))["data"]
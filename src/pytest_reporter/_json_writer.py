@@ -1,15 +1,31 @@
-"""JSON file writers for all per-test output files."""
+"""JSON file writers for all per-test output files.
+
+Every write funnels through :func:`write_text_file`.  By default files are
+written synchronously; while a :class:`BackgroundWriter` is installed via
+:func:`_set_writer` (``--report-async-writes``), content is still rendered on
+the calling thread but the directory creation and file write happen on the
+writer's worker thread.
+
+While a :class:`~pytest_reporter._journal.RunJournal` is installed via
+:func:`_set_journal` (``--report-layout=journal``), the writers below append
+typed records to ``run.jsonl`` instead of creating files.
+"""
 
 from __future__ import annotations
 
 import json
+import queue
+import threading
+import warnings
 from pathlib import Path
 from typing import Any, cast
 
+from ._journal import RunJournal
 from ._types import (
     LogEntryDict,
     ParamEntry,
     ParametersJson,
+    ParamValue,
     PhaseData,
     PhaseLog,
     RunInfo,
@@ -18,10 +34,94 @@ from ._types import (
 )
 
 
-def _write_json(path: Path, data: Any) -> None:  # noqa: ANN401
-    """Write a JSON file, creating parent directories as needed."""
+def _write_now(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+    path.write_text(text, encoding="utf-8")
+
+
+class BackgroundWriter:
+    """Worker thread that performs report file writes off the test thread.
+
+    Pending writes sit in a bounded queue: when the disk falls behind,
+    :meth:`submit` blocks until there is room, so memory stays bounded.
+    Writes are applied in submission order.  Failures are collected and
+    reported as warnings by :meth:`close`, mirroring the warning a
+    synchronous write failure produces through the hook guard.
+    """
+
+    def __init__(self, max_pending: int = 256) -> None:
+        self._queue: queue.Queue[tuple[Path, str] | None] = queue.Queue(maxsize=max_pending)
+        self._errors: list[str] = []
+        self._thread = threading.Thread(
+            target=self._run, name="pytest-reporter-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, path: Path, text: str) -> None:
+        """Queue *text* to be written to *path*, blocking while the queue is full."""
+        self._queue.put((path, text))
+
+    def close(self) -> None:
+        """Drain all pending writes, stop the worker and warn about any failures."""
+        self._queue.put(None)
+        self._thread.join()
+        for error in self._errors:
+            warnings.warn(f"pytest-reporter: background write failed: {error}", stacklevel=2)
+        self._errors.clear()
+
+    def _run(self) -> None:
+        while (job := self._queue.get()) is not None:
+            path, text = job
+            try:
+                _write_now(path, text)
+            except Exception as exc:  # noqa: BLE001
+                self._errors.append(f"{path}: {exc}")
+
+
+_writer: BackgroundWriter | None = None
+
+
+def _set_writer(writer: BackgroundWriter | None) -> None:
+    """Install (or with ``None`` remove) the background writer for all report writes."""
+    global _writer
+    _writer = writer
+
+
+def write_text_file(path: Path, text: str) -> None:
+    """Write a UTF-8 text file, creating parent directories as needed.
+
+    Goes through the active :class:`BackgroundWriter` when one is installed.
+    """
+    if _writer is not None:
+        _writer.submit(path, text)
+    else:
+        _write_now(path, text)
+
+
+_journal: RunJournal | None = None
+
+
+def _set_journal(journal: RunJournal | None) -> None:
+    """Install (or with ``None`` remove) the run journal that replaces per-file writes."""
+    global _journal
+    _journal = journal
+
+
+def _journaled(path: Path, kind: str, data: Any) -> bool:  # noqa: ANN401
+    """Append *data* to the active journal; return ``False`` if it must be a file."""
+    if _journal is None:
+        return False
+    rel_path = _journal.relative_path(path)
+    if rel_path is None:
+        return False
+    _journal.append(kind, rel_path, data)
+    return True
+
+
+def _write_json(path: Path, data: Any, kind: str) -> None:  # noqa: ANN401
+    """Write a JSON file (or a journal record of type *kind*)."""
+    if not _journaled(path, kind, data):
+        write_text_file(path, json.dumps(data, indent=2, default=str))
 
 
 def write_phase_log(path: Path, phase: PhaseData) -> None:
@@ -35,32 +135,34 @@ def write_phase_log(path: Path, phase: PhaseData) -> None:
         longrepr=phase.longrepr,
         entries=cast(list[LogEntryDict], phase.entries),
     )
-    _write_json(path, log)
+    _write_json(path, log, "phase")
+
+
+def param_entry(value: Any) -> ParamEntry:  # noqa: ANN401
+    """Return the ``parameters.json`` form of one parameter value."""
+    if isinstance(value, ParamValue):
+        return ParamEntry(type=value.type_name, value=value.text)
+    return ParamEntry(type=type(value).__name__, value=str(value))
 
 
 def write_parameters_json(path: Path, run_info: RunInfo) -> None:
     """Write parameters.json for a test run."""
-    params: dict[str, ParamEntry] = {}
-    for name, value in run_info.params.items():
-        params[name] = ParamEntry(
-            type=type(value).__name__,
-            value=str(value),
-        )
     data = ParametersJson(
+        test_id=run_info.base_nodeid,
         parametrize_id=run_info.parametrize_id,
-        params=params,
+        params={name: param_entry(value) for name, value in run_info.params.items()},
     )
-    _write_json(path, data)
+    _write_json(path, data, "parameters")
 
 
 def write_procedure_json(path: Path, procedure_data: dict[str, Any]) -> None:
     """Write procedure.json for a test run."""
-    _write_json(path, procedure_data)
+    _write_json(path, procedure_data, "procedure")
 
 
 def write_test_log_json(path: Path, aggregate: TestLogJson) -> None:
     """Write test.log.json aggregate for a test function."""
-    _write_json(path, aggregate)
+    _write_json(path, aggregate, "test_log")
 
 
 def write_session_log_json(
@@ -78,11 +180,11 @@ def write_session_log_json(
         duration_seconds=round(duration_seconds, 4),
         entries=cast(list[LogEntryDict], entries),
     )
-    _write_json(path, data)
+    _write_json(path, data, "session_log")
 
 
 def write_failure_log(path: Path, nodeid: str, longrepr: str) -> None:
     """Write an error log file to the failures directory."""
-    path.parent.mkdir(parents=True, exist_ok=True)
     content = f"Test: {nodeid}\n{'=' * 60}\n{longrepr}\n"
-    path.write_text(content, encoding="utf-8")
+    if not _journaled(path, "failure_log", content):
+        write_text_file(path, content)
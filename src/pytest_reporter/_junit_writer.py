@@ -2,14 +2,66 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from xml.etree.ElementTree import Element, ElementTree, SubElement
 
 if TYPE_CHECKING:
     from ._collector import DataCollector
 
 
+@dataclass(frozen=True)
+class JUnitCase:
+    """One ``<testcase>``: a test run and what its outcome element needs."""
+
+    file_path: str
+    nodeid: str
+    outcome: str
+    duration: float
+    retries: int = 0
+    original_outcome: str = ""
+    call_longrepr: str | None = None
+    setup_longrepr: str | None = None
+
+
+def _collector_cases(collector: DataCollector) -> Iterator[JUnitCase]:
+    for base_nodeid in collector.get_all_base_nodeids():
+        for nodeid in collector.get_function_nodeids(base_nodeid):
+            retry_data = collector.get_retry_data(nodeid)
+            call_phase = collector.get_phase(nodeid, "call")
+            setup_phase = collector.get_phase(nodeid, "setup")
+            yield JUnitCase(
+                file_path=collector.get_run_info(nodeid).file_path,
+                nodeid=nodeid,
+                outcome=collector.get_outcome(nodeid),
+                duration=collector.get_duration(nodeid),
+                retries=retry_data.attempts if retry_data else 0,
+                original_outcome=retry_data.original_outcome if retry_data else "",
+                call_longrepr=call_phase.longrepr if call_phase else None,
+                setup_longrepr=setup_phase.longrepr if setup_phase else None,
+            )
+
+
+def junit_cases_from_data(tests: Iterable[dict[str, Any]]) -> Iterator[JUnitCase]:
+    """Yield the JUnit cases of ``DATA.tests`` items with their run details merged in."""
+    for test in tests:
+        for run in test["runs"]:
+            phases = run.get("phases") or {}
+            retries = run.get("retries") or {}
+            yield JUnitCase(
+                file_path=test["aggregate"].get("file", ""),
+                nodeid=run.get("nodeid") or test["base_nodeid"],
+                outcome=run.get("outcome") or "error",
+                duration=run.get("duration") or 0.0,
+                retries=retries.get("attempts", 0),
+                original_outcome=retries.get("original_outcome", ""),
+                call_longrepr=(phases.get("call") or {}).get("longrepr"),
+                setup_longrepr=(phases.get("setup") or {}).get("longrepr"),
+            )
+
+
 def write_junit_xml(
     path: Path,
     collector: DataCollector,
@@ -18,81 +70,74 @@ def write_junit_xml(
     retries_enabled: bool = False,
 ) -> None:
     """Write a standard JUnit XML report."""
+    write_junit_cases(path, _collector_cases(collector), duration)
+
+
+def write_junit_cases(path: Path, cases: Iterable[JUnitCase], duration: float) -> None:
+    """Write a standard JUnit XML report for *cases*, in order."""
     testsuites = Element("testsuites")
     testsuite = SubElement(testsuites, "testsuite", name="pytest")
 
     total = passed = failed = errors = skipped = 0
 
-    for base_nodeid in collector.get_all_base_nodeids():
-        for nodeid in collector.get_function_nodeids(base_nodeid):
-            run_info = collector.get_run_info(nodeid)
-            outcome = collector.get_outcome(nodeid)
-            test_duration = collector.get_duration(nodeid)
-
-            # classname: file path with dots instead of slashes, without .py
-            classname = run_info.file_path.replace("/", ".").replace(".py", "")
-            name = nodeid.split("::", 1)[1] if "::" in nodeid else nodeid
-
-            tc = SubElement(
-                testsuite,
-                "testcase",
-                classname=classname,
-                name=name,
-                time=f"{test_duration:.4f}",
+    for case in cases:
+        nodeid = case.nodeid
+        # classname: file path with dots instead of slashes, without .py
+        classname = case.file_path.replace("/", ".").replace(".py", "")
+        name = nodeid.split("::", 1)[1] if "::" in nodeid else nodeid
+
+        tc = SubElement(
+            testsuite,
+            "testcase",
+            classname=classname,
+            name=name,
+            time=f"{case.duration:.4f}",
+        )
+
+        # Add retry properties if applicable
+        if case.retries > 0:
+            props = SubElement(tc, "properties")
+            SubElement(
+                props,
+                "property",
+                name="retries",
+                value=str(case.retries),
+            )
+            SubElement(
+                props,
+                "property",
+                name="original_outcome",
+                value=case.original_outcome,
             )
 
-            # Add retry properties if applicable
-            retry_data = collector.get_retry_data(nodeid)
-            if retry_data and retry_data.attempts > 0:
-                props = SubElement(tc, "properties")
-                SubElement(
-                    props,
-                    "property",
-                    name="retries",
-                    value=str(retry_data.attempts),
+        total += 1
+        if case.outcome == "passed":
+            passed += 1
+            # If passed after retries, include original failure in system-out
+            if case.retries > 0 and case.call_longrepr:
+                so = SubElement(tc, "system-out")
+                so.text = (
+                    f"Original failure (passed on retry {case.retries}):\n{case.call_longrepr}"
                 )
-                SubElement(
-                    props,
-                    "property",
-                    name="original_outcome",
-                    value=retry_data.original_outcome,
-                )
-
-            total += 1
-            if outcome == "passed":
-                passed += 1
-                # If passed after retries, include original failure in system-out
-                if retry_data and retry_data.attempts > 0:
-                    call_phase = collector.get_phase(nodeid, "call")
-                    if call_phase and call_phase.longrepr:
-                        so = SubElement(tc, "system-out")
-                        so.text = (
-                            f"Original failure (passed on retry {retry_data.attempts}):\n"
-                            f"{call_phase.longrepr}"
-                        )
-            elif outcome == "failed":
-                failed += 1
-                # For retried tests, get the last attempt's failure
-                call_phase = collector.get_phase(nodeid, "call")
-                longrepr = call_phase.longrepr if call_phase else ""
-                failure = SubElement(tc, "failure", message=f"{name} failed", type="AssertionError")
-                failure.text = longrepr or ""
-                # Include original failure in system-out for retried tests
-                if retry_data and retry_data.attempts > 0 and call_phase and call_phase.longrepr:
-                    so = SubElement(tc, "system-out")
-                    so.text = f"Original failure:\n{call_phase.longrepr}"
-            elif outcome == "skipped":
-                skipped += 1
-                setup_phase = collector.get_phase(nodeid, "setup")
-                reason = setup_phase.longrepr if setup_phase else "skipped"
-                skip_el = SubElement(tc, "skipped", message=str(reason))
-                skip_el.text = str(reason)
-            else:
-                errors += 1
-                setup_phase = collector.get_phase(nodeid, "setup")
-                longrepr = setup_phase.longrepr if setup_phase else ""
-                error_el = SubElement(tc, "error", message=f"{name} error", type="Error")
-                error_el.text = longrepr or ""
+        elif case.outcome == "failed":
+            failed += 1
+            # For retried tests, get the last attempt's failure
+            failure = SubElement(tc, "failure", message=f"{name} failed", type="AssertionError")
+            failure.text = case.call_longrepr or ""
+            # Include original failure in system-out for retried tests
+            if case.retries > 0 and case.call_longrepr:
+                so = SubElement(tc, "system-out")
+                so.text = f"Original failure:\n{case.call_longrepr}"
+        elif case.outcome == "skipped":
+            skipped += 1
+            # A skip during the call phase has no setup longrepr
+            reason = case.setup_longrepr or case.call_longrepr or "skipped"
+            skip_el = SubElement(tc, "skipped", message=str(reason))
+            skip_el.text = str(reason)
+        else:
+            errors += 1
+            error_el = SubElement(tc, "error", message=f"{name} error", type="Error")
+            error_el.text = case.setup_longrepr or ""
 
     testsuite.set("tests", str(total))
     testsuite.set("failures", str(failed))
@@ -1,46 +1,192 @@
-"""Structured tree-based logger for per-test and session logging."""
+"""Structured tree-based logger for per-test and session logging.
+
+The logging call is the hot path (measurement loops log millions of
+entries per session), so it only captures raw values: the wall clock as
+``time.time_ns()``, the logger's shared source tuple and the exception
+with its traceback at log time.  Timestamps, source lists and tracebacks
+are formatted when the entries are serialized at the end of each phase.
+
+A :class:`LogFilter` (``--report-log-level``) sets the minimum level each
+logger records.  It is resolved to a number once per logger, so a call
+below the threshold returns after a single comparison, before any entry is
+created.
+
+With a ``max_entries`` cap (``--report-log-max-entries``) the root keeps the
+first half of the cap in a list and the last half in a ring buffer.  Entries
+pushed out of the ring are only counted per level, and :meth:`Logger.serialize`
+reports them as one ``overflow`` record at the gap, so a logger holds at most
+``max_entries`` entries between resets however much a test logs.
+
+Consecutive calls with the same level, source and message and no data or
+exception (polling loops) are coalesced into the first entry, which counts
+the repeats and keeps the timestamp of the last one.
+"""
 
 from __future__ import annotations
 
+import sys
+import time
 import traceback
+from collections import deque
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from threading import Lock
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._table import TablePayload
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+CRITICAL = 50
+
+LEVELS = {"DEBUG": DEBUG, "INFO": INFO, "WARNING": WARNING, "ERROR": ERROR, "CRITICAL": CRITICAL}
+
+
+def parse_level_spec(spec: str) -> tuple[str | None, str]:
+    """Parse a ``LEVEL`` or ``PATTERN=LEVEL`` spec into ``(pattern, level)``.
+
+    Raises:
+        ValueError: If the level is not one of :data:`LEVELS` or the pattern is empty.
+    """
+    pattern, sep, level = spec.rpartition("=")
+    level = level.strip().upper()
+    if level not in LEVELS:
+        raise ValueError(f"unknown log level {level!r} (choose from {', '.join(LEVELS)})")
+    if sep and not pattern.strip():
+        raise ValueError(f"missing source pattern in {spec!r}")
+    return (pattern.strip() if sep else None), level
+
+
+def _source_matches(name: str, pattern: str) -> bool:
+    # "psu" and "psu.*" both cover the psu logger and all its children
+    base = pattern.removesuffix(".*")
+    return fnmatchcase(name, base) or fnmatchcase(name, f"{base}.*")
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Minimum level recorded per logger source.
+
+    Attributes:
+        level: Default minimum level name.
+        overrides: ``(pattern, level)`` pairs matched against the dotted
+            source of a logger (``"psu.ch1"``); the last match wins.
+    """
+
+    level: str = "DEBUG"
+    overrides: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def from_specs(cls, specs: list[tuple[str | None, str]]) -> LogFilter:
+        """Build a filter from :func:`parse_level_spec` results, in command-line order."""
+        level = "DEBUG"
+        overrides: list[tuple[str, str]] = []
+        for pattern, spec_level in specs:
+            if pattern is None:
+                level = spec_level
+            else:
+                overrides.append((pattern, spec_level))
+        return cls(level, tuple(overrides))
+
+    def threshold(self, source: tuple[str, ...]) -> int:
+        """Return the minimum level number for a logger with the given source path."""
+        name = ".".join(source)
+        level = self.level
+        for pattern, override in self.overrides:
+            if _source_matches(name, pattern):
+                level = override
+        return LEVELS[level]
+
+
+@lru_cache(maxsize=256)
+def _second_stamp(seconds: int) -> str:
+    # Entries of a phase share a handful of distinct seconds
+    return datetime.fromtimestamp(seconds, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def format_timestamp(t_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as ``YYYY-MM-DDTHH:MM:SS.ffffffZ`` (UTC)."""
+    seconds, ns = divmod(t_ns, 1_000_000_000)
+    return f"{_second_stamp(seconds)}.{ns // 1000:06d}Z"
+
+
+class CapturedException:
+    """An exception as it was when logged, formatted by :meth:`to_dict`.
+
+    The traceback and ``add_note()`` notes are snapshotted at log time, so a
+    later re-raise (which extends ``__traceback__``) or note does not leak
+    into the logged traceback.  Holding the traceback keeps the frames, and
+    their locals, alive until the entry is serialized and the logger reset
+    at the end of the phase.
+    """
+
+    __slots__ = ("exc", "tb", "notes")
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+        self.tb = exc.__traceback__
+        notes = getattr(exc, "__notes__", None)
+        self.notes = list(notes) if isinstance(notes, list) else None
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the ``exc`` dict (type, message, formatted traceback) of a log entry."""
+        exc = self.exc
+        formatted = traceback.TracebackException(type(exc), exc, self.tb)
+        formatted.__notes__ = self.notes
+        return {"type": type(exc).__name__, "msg": str(exc), "tb": "".join(formatted.format())}
 
 
 class LogEntry:
-    """A single log entry."""
+    """A single log entry, holding raw values until :meth:`to_dict`."""
 
-    __slots__ = ("seq", "t", "level", "source", "msg", "data", "exc")
+    __slots__ = ("seq", "t_ns", "level", "source", "msg", "data", "exc_info", "repeat", "last_t_ns")
 
     def __init__(
         self,
         seq: int,
-        t: str,
+        t_ns: int,
         level: str,
-        source: list[str],
+        source: tuple[str, ...],
         msg: str,
         data: dict[str, Any] | None = None,
-        exc: dict[str, str] | None = None,
+        exc_info: BaseException | None = None,
     ) -> None:
         self.seq = seq
-        self.t = t
+        self.t_ns = t_ns
         self.level = level
         self.source = source
         self.msg = msg
         self.data = data
-        self.exc = exc
+        # Formatted only at serialization, from its log-time traceback
+        self.exc_info = CapturedException(exc_info) if exc_info is not None else None
+        # Identical consecutive calls coalesced into this entry (including it)
+        self.repeat = 1
+        self.last_t_ns = t_ns
+
+    @property
+    def t(self) -> str:
+        """The entry's timestamp, formatted."""
+        return format_timestamp(self.t_ns)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        out = {
             "seq": self.seq,
             "t": self.t,
             "level": self.level,
-            "source": self.source,
+            "source": list(self.source),
             "msg": self.msg,
             "data": self.data,
-            "exc": self.exc,
+            "exc": self.exc_info.to_dict() if self.exc_info is not None else None,
         }
+        if self.repeat > 1:
+            out["repeat"] = self.repeat
+            out["last_t"] = format_timestamp(self.last_t_ns)
+        return out
 
 
 class Logger:
@@ -48,19 +194,38 @@ class Logger:
 
     The root logger owns the sequence counter and entry list.
     Child loggers delegate to the root for storage.
+
+    Args:
+        log_filter: Minimum level per source; ``None`` records every level.
+        max_entries: Most entries kept between resets (first and last halves);
+            ``0`` keeps all of them.
     """
 
     def __init__(
         self,
         *,
         _root: Logger | None = None,
-        _path: list[str] | None = None,
+        _path: tuple[str, ...] | None = None,
+        log_filter: LogFilter | None = None,
+        max_entries: int = 0,
     ) -> None:
         if _root is None:
             # This is the root logger
             self._root: Logger = self
+            self._filter = log_filter
             self._entries: list[LogEntry] = []
             self._seq: int = 0
+            # Entries with seq >= _head_size go to the _tail ring buffer
+            if max_entries < 0:
+                raise ValueError(f"max_entries must be 0 or more, got {max_entries}")
+            self._max_entries = max_entries
+            self._head_size = max_entries - max_entries // 2 if max_entries > 0 else sys.maxsize
+            self._tail: deque[LogEntry] = deque(maxlen=max_entries // 2)
+            # Entries pushed out of the ring: count per level, first timestamp
+            self._dropped: dict[str, int] = {}
+            self._dropped_t_ns = 0
+            # Most recent kept entry, the one a repeated call is coalesced into
+            self._last: LogEntry | None = None
             self._lock = Lock()
             self._table_payloads: dict[int, Any] = {}
             self._used_artifact_names: set[str] = set()
@@ -72,12 +237,16 @@ class Logger:
             self._lock = _root._lock
             self._table_payloads = _root._table_payloads
             self._used_artifact_names = _root._used_artifact_names
+            self._filter = _root._filter
 
-        self._path: list[str] = _path or []
+        # Shared by every entry of this logger (immutable)
+        self._path: tuple[str, ...] = _path or ()
+        # Calls below this level return before creating an entry
+        self._min_level = self._filter.threshold(self._path) if self._filter else DEBUG
 
     def child(self, name: str) -> Logger:
         """Create a child logger with the given name."""
-        return Logger(_root=self._root, _path=[*self._path, name])
+        return Logger(_root=self._root, _path=(*self._path, name))
 
     def _log(
         self,
@@ -85,59 +254,98 @@ class Logger:
         msg: str,
         data: dict[str, Any] | None = None,
         exc_info: BaseException | None = None,
+        table: TablePayload | None = None,
     ) -> None:
-        exc: dict[str, str] | None = None
-        if exc_info is not None:
-            exc = {
-                "type": type(exc_info).__name__,
-                "msg": str(exc_info),
-                "tb": "".join(
-                    traceback.format_exception(type(exc_info), exc_info, exc_info.__traceback__)
-                ),
-            }
-
-        t = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-        with self._root._lock:
-            seq = self._root._seq
-            self._root._seq += 1
-
-        entry = LogEntry(
-            seq=seq,
-            t=t,
-            level=level,
-            source=list(self._path),
-            msg=msg,
-            data=data,
-            exc=exc,
-        )
-        with self._root._lock:
-            self._root._entries.append(entry)
+        t_ns = time.time_ns()
+        source = self._path
+        root = self._root
+        with root._lock:
+            last = root._last
+            # Only data-less entries are coalesced: comparing arbitrary data
+            # could raise (array-likes) or merge a reused dict mutated in between
+            if (
+                last is not None
+                and data is None
+                and last.data is None
+                and exc_info is None
+                and last.exc_info is None
+                and table is None
+                and last.msg == msg
+                and last.level == level
+                and last.source == source
+            ):
+                last.repeat += 1
+                last.last_t_ns = t_ns
+                return
+            entry = LogEntry(root._seq, t_ns, level, source, msg, data, exc_info)
+            seq = root._seq
+            root._seq = seq + 1
+            if seq < root._head_size:
+                root._entries.append(entry)
+            elif not root._push_tail(entry):
+                root._last = None
+                return
+            root._last = entry
+            if table is not None:
+                root._table_payloads[seq] = table
+
+    def _push_tail(self, entry: LogEntry) -> bool:
+        # Root only, under the lock; returns whether *entry* was kept
+        tail = self._tail
+        if len(tail) == tail.maxlen:
+            dropped = tail[0] if tail else entry
+            if not self._dropped:
+                self._dropped_t_ns = dropped.t_ns
+            self._dropped[dropped.level] = self._dropped.get(dropped.level, 0) + dropped.repeat
+            self._table_payloads.pop(dropped.seq, None)
+            if dropped is entry:
+                return False
+        tail.append(entry)
+        return True
+
+    def _overflow_record(self) -> dict[str, Any]:
+        # Root only, under the lock: stands in for the dropped entries
+        total = sum(self._dropped.values())
+        noun = "entry" if total == 1 else "entries"
+        return {
+            "seq": self._head_size,
+            "t": format_timestamp(self._dropped_t_ns),
+            "level": "WARNING",
+            "source": [],
+            "msg": f"{total} log {noun} dropped (over the cap of {self._max_entries})",
+            "data": {"_type": "overflow", "dropped": dict(self._dropped), "total": total},
+            "exc": None,
+        }
 
     def debug(
         self, msg: str, data: dict[str, Any] | None = None, exc_info: BaseException | None = None
     ) -> None:
-        self._log("DEBUG", msg, data, exc_info)
+        if self._min_level <= DEBUG:
+            self._log("DEBUG", msg, data, exc_info)
 
     def info(
         self, msg: str, data: dict[str, Any] | None = None, exc_info: BaseException | None = None
     ) -> None:
-        self._log("INFO", msg, data, exc_info)
+        if self._min_level <= INFO:
+            self._log("INFO", msg, data, exc_info)
 
     def warning(
         self, msg: str, data: dict[str, Any] | None = None, exc_info: BaseException | None = None
     ) -> None:
-        self._log("WARNING", msg, data, exc_info)
+        if self._min_level <= WARNING:
+            self._log("WARNING", msg, data, exc_info)
 
     def error(
         self, msg: str, data: dict[str, Any] | None = None, exc_info: BaseException | None = None
     ) -> None:
-        self._log("ERROR", msg, data, exc_info)
+        if self._min_level <= ERROR:
+            self._log("ERROR", msg, data, exc_info)
 
     def critical(
         self, msg: str, data: dict[str, Any] | None = None, exc_info: BaseException | None = None
     ) -> None:
-        self._log("CRITICAL", msg, data, exc_info)
+        if self._min_level <= CRITICAL:
+            self._log("CRITICAL", msg, data, exc_info)
 
     def table(
         self,
@@ -155,8 +363,11 @@ class Logger:
             data: Table data -- pandas DataFrame (duck-typed), list of dicts,
                   or dict of lists.
             name: Display name for the table (also used for the artifact filename).
-            level: Log level for the entry (default ``"INFO"``).
+            level: Log level for the entry (default ``"INFO"``).  Below the
+                   logger's threshold the table is neither logged nor saved.
         """
+        if self._min_level > LEVELS.get(level, INFO):
+            return
         from ._table import (
             SERIALIZED_ROW_LIMIT,
             TablePayload,
@@ -190,17 +401,9 @@ class Logger:
             "artifact_name": artifact_name,
         }
 
-        self._log(level, f"Table: {name}", data=table_data)
-
-        # Store full payload for artifact generation
-        with self._root._lock:
-            seq = self._root._seq - 1  # seq of the entry we just created
-            self._root._table_payloads[seq] = TablePayload(
-                name=name,
-                columns=columns,
-                rows=rows,
-                artifact_name=artifact_name,
-            )
+        # The full payload is kept for artifact generation while the entry is
+        payload = TablePayload(name=name, columns=columns, rows=rows, artifact_name=artifact_name)
+        self._log(level, f"Table: {name}", data=table_data, table=payload)
 
     def get_table_payloads(self) -> dict[int, Any]:
         """Return table payloads for artifact writing (keyed by entry seq)."""
@@ -209,14 +412,22 @@ class Logger:
 
     def serialize(self) -> dict[str, Any]:
         """Serialize all entries to a dict with an 'entries' key."""
-        with self._root._lock:
-            return {"entries": [e.to_dict() for e in self._root._entries]}
+        root = self._root
+        with root._lock:
+            entries = [e.to_dict() for e in root._entries]
+            if root._dropped:
+                entries.append(root._overflow_record())
+            entries.extend(e.to_dict() for e in root._tail)
+            return {"entries": entries}
 
     def reset(self) -> None:
         """Clear all entries and reset the sequence counter."""
         with self._root._lock:
             self._root._entries.clear()
             self._root._seq = 0
+            self._root._tail.clear()
+            self._root._dropped.clear()
+            self._root._last = None
             self._root._table_payloads.clear()
             self._root._used_artifact_names.clear()
 
@@ -0,0 +1,154 @@
+"""Merge sharded runs — ``python -m pytest_reporter merge -o OUT RUN_DIR...``.
+
+Combines the run directories of a suite split across CI shards into one
+``report.html`` and ``junit.xml``.  The test index of every shard is read
+first (the test directories of all shards on one thread pool), then:
+
+- tests are unioned by base node ID and their runs by full node ID (with
+  the parametrize ID), since run IDs are only positions within one
+  session.  Shards are ordered by run directory name (the session
+  timestamp), then path; when the same run ran in several shards, the last
+  one wins, so a re-run shard replaces the earlier result;
+- a run a shard collected but never ran (deselected, or left to another
+  shard) has no files and is only a placeholder in its ``test.log.json``:
+  it never replaces a run that ran, and is dropped if any shard ran a run
+  of the same test under its run ID;
+- each merged test's counts and durations are recomputed from its runs;
+- session durations are summed and the session logs concatenated in
+  timestamp order.
+
+Only that merged index is held in memory: each run's details are streamed
+from the shard its run won in, as for ``rebuild`` (:mod:`._rebuild`).  The
+shard directories are only read, never modified.
+
+Linked artifacts (``--report-artifacts=link``) point from *OUT* back into
+the shard directories, which must therefore stay where they are.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from ._artifacts import ArtifactStore
+from ._rebuild import artifact_lister, read_ahead, read_index, write_reports
+from ._run_reader import RunReader, index_item, run_totals
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+    from pathlib import Path
+
+    from ._rebuild import TestSource
+
+    # One run of a merged test: its test.log.json entry, its index run and
+    # the source its details are read from.
+    _MergedRun = tuple[dict[str, Any], dict[str, Any], TestSource]
+
+
+def merge_tests(
+    sources: Iterable[TestSource], ran: Iterable[Collection[str]]
+) -> list[tuple[dict[str, Any], list[TestSource]]]:
+    """Union index items given in shard order, later items winning.
+
+    *ran* gives, per source, the IDs of the runs that left files in its test
+    directory (:meth:`~._run_reader.RunReader.run_ids`); the item's other
+    runs are placeholders.  Runs are ordered by run ID, and renumbered if
+    runs from different shards share one.
+
+    Returns the merged items sorted by node ID, each with the source of
+    every one of its runs: the shard directory and a one-run index item to
+    read the run's details from.
+    """
+    aggregates: dict[str, dict[str, Any]] = {}
+    # Per base node ID: the runs that ran, by node ID, and the placeholders,
+    # by run ID.
+    ran_runs: dict[str, dict[str, _MergedRun]] = {}
+    placeholders: dict[str, dict[str, _MergedRun]] = {}
+    for (reader, test_dir, test), ran_ids in zip(sources, ran):
+        base = test["base_nodeid"]
+        aggregates[base] = test["aggregate"]
+        log_runs = [run for run in test["aggregate"].get("runs", []) if isinstance(run, dict)]
+        for log_run, run in zip(log_runs, test["runs"]):
+            merged_run = (log_run, run, (reader, test_dir, {**test, "runs": [run]}))
+            if run["run_id"] in ran_ids:
+                ran_runs.setdefault(base, {})[run["nodeid"]] = merged_run
+            else:
+                placeholders.setdefault(base, {})[run["run_id"]] = merged_run
+
+    merged = []
+    for base in sorted(aggregates):
+        test_runs = list(ran_runs.get(base, {}).values())
+        taken = {run["run_id"] for _, run, _ in test_runs}
+        test_runs.extend(
+            merged_run
+            for run_id, merged_run in placeholders.get(base, {}).items()
+            if run_id not in taken
+        )
+        test_runs.sort(key=lambda merged_run: (merged_run[1]["run_id"], merged_run[1]["nodeid"]))
+        log_runs = [log_run for log_run, _, _ in test_runs]
+        runs = [run for _, run, _ in test_runs]
+        if len({run["run_id"] for run in runs}) < len(runs):
+            # The sources keep the original IDs: they name the run directories.
+            log_runs = [{**run, "run_id": f"{i:02d}"} for i, run in enumerate(log_runs, 1)]
+            runs = [{**run, "run_id": f"{i:02d}"} for i, run in enumerate(runs, 1)]
+        item = index_item({**aggregates[base], **run_totals(log_runs), "runs": log_runs})
+        item["runs"] = runs
+        merged.append((item, [source for _, _, source in test_runs]))
+    return merged
+
+
+def merge_session_logs(logs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Concatenate shard ``session.log.json`` records, entries in timestamp order."""
+    entries = [entry for log in logs for entry in log.get("entries", [])]
+    entries.sort(key=lambda entry: str(entry.get("t", "")) if isinstance(entry, dict) else "")
+    starts = [log["start_time"] for log in logs if log.get("start_time")]
+    ends = [log["end_time"] for log in logs if log.get("end_time")]
+    return {
+        "phase": "session",
+        "start_time": min(starts, default=None),
+        "end_time": max(ends, default=None),
+        "duration_seconds": round(sum(log.get("duration_seconds") or 0 for log in logs), 4),
+        "entries": entries,
+    }
+
+
+def merge(
+    run_dirs: list[Path],
+    out_dir: Path,
+    *,
+    artifact_mode: str = "embed",
+    compress: bool = False,
+    jobs: int | None = None,
+) -> int:
+    """Write the merged ``report.html`` and ``junit.xml`` into *out_dir*; return the test count."""
+    readers = [RunReader(d) for d in sorted(run_dirs, key=lambda d: (d.name, str(d)))]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        test_dirs = list(pool.map(RunReader.test_dirs, readers))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    store = ArtifactStore(link_duplicates=False)
+    artifacts_for = artifact_lister(artifact_mode, store, out_dir)
+    items = [(reader, d) for reader, dirs in zip(readers, test_dirs) for d in dirs]
+    # read_index keeps the input (shard) order that merge_tests resolves by.
+    sources = read_index(items, jobs)
+    ran = read_ahead(lambda source: set(source[0].run_ids(source[1])), sources, jobs)
+    merged = merge_tests(sources, ran)
+
+    def read_one(run_sources: list[TestSource]) -> list[dict[str, Any]]:
+        return [
+            detail
+            for reader, test_dir, test in run_sources
+            for detail in reader.read_runs(test_dir, test, artifacts_for)
+        ]
+
+    session_log = merge_session_logs([reader.session_log() for reader in readers])
+    write_reports(
+        out_dir,
+        [item for item, _ in merged],
+        lambda: read_ahead(read_one, [run_sources for _, run_sources in merged], jobs),
+        timestamp=readers[-1].run_dir.name if readers else out_dir.name,
+        duration=session_log["duration_seconds"],
+        session_log=session_log,
+        blobs=store.blobs,
+        compress=compress,
+    )
+    return len(merged)
@@ -1,4 +1,10 @@
-"""Phase log capture helpers — serialize, write tables, record, write phase files."""
+"""Phase log capture helpers — serialize, write tables, record, write phase files.
+
+With ``--report-log-retention=failed`` the phase logs of a run are written
+when the run finishes instead of after each phase, because whether its
+DEBUG/INFO entries are kept depends on how the whole run ends: they are
+dropped (from the files and the report) unless a phase failed.
+"""
 
 from __future__ import annotations
 
@@ -6,7 +12,13 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from ._context import sanitize_path_component
-from ._json_writer import write_failure_log, write_phase_log, write_procedure_json
+from ._json_writer import (
+    write_failure_log,
+    write_phase_log,
+    write_procedure_json,
+    write_text_file,
+)
+from ._logger import LEVELS, WARNING
 from ._table import build_table_artifact_html
 
 if TYPE_CHECKING:
@@ -73,6 +85,19 @@ def _strip_nested_check_children(checks: list[dict[str, Any]]) -> list[dict[str,
     return [c for c in checks if id(c) not in child_ids]
 
 
+def drop_verbose_entries(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return *entries* without their DEBUG/INFO entries.
+
+    Table entries are kept at any level: their artifacts are already written.
+    """
+    return [
+        e
+        for e in entries
+        if LEVELS.get(e.get("level", ""), WARNING) >= WARNING
+        or (isinstance(e.get("data"), dict) and e["data"].get("_type") == "table")
+    ]
+
+
 def flush_table_artifacts(logger: Logger, run_dir: Path) -> None:
     """Write any pending table HTML artifacts from the logger and reset it.
 
@@ -88,10 +113,9 @@ def flush_table_artifacts(logger: Logger, run_dir: Path) -> None:
     table_payloads = logger.get_table_payloads()
     if table_payloads:
         artifacts_dir = run_dir / "artifacts"
-        artifacts_dir.mkdir(parents=True, exist_ok=True)
         for _seq, payload in table_payloads.items():
             html = build_table_artifact_html(payload.name, payload.columns, payload.rows)
-            (artifacts_dir / payload.artifact_name).write_text(html, encoding="utf-8")
+            write_text_file(artifacts_dir / payload.artifact_name, html)
     logger.reset()
 
 
@@ -125,10 +149,14 @@ def capture_phase_logs(reporter: Reporter, report: pytest.TestReport) -> None:
 
     run_dir = reporter._get_run_dir(nodeid)
 
-    # Write phase log immediately
-    phase = reporter.collector.get_phase(nodeid, report.when)
-    if phase is not None:
-        write_phase_log(run_dir / f"{report.when}.log.json", phase)
+    if reporter.log_retention == "failed":
+        # Written by write_run_finish_files once the run's outcome is known
+        reporter._deferred_phases.setdefault(nodeid, []).append(report.when)
+    else:
+        # Write phase log immediately
+        phase = reporter.collector.get_phase(nodeid, report.when)
+        if phase is not None:
+            write_phase_log(run_dir / f"{report.when}.log.json", phase)
 
     # Write failure log (only for original failures, not retries)
     if (
@@ -155,6 +183,8 @@ def write_run_finish_files(
 ) -> None:
     """Write per-run finish files (procedure.json, parameters.json) and clean up.
 
+    Also writes the phase logs deferred by ``--report-log-retention=failed``.
+
     Gated on ``nodeid not in reporter._finished_runs``.  Also captures
     verification check results from pytest-verify and resets the active tracker.
 
@@ -174,6 +204,18 @@ def write_run_finish_files(
     run_info = reporter.collector.get_run_info(nodeid)
     run_dir = reporter._get_run_dir(nodeid)
 
+    # Write the phase logs deferred by --report-log-retention=failed
+    deferred = reporter._deferred_phases.pop(nodeid, [])
+    phases = reporter.collector.get_phases(nodeid)
+    keep_verbose = any(phase.outcome == "failed" for phase in phases.values())
+    for when in deferred:
+        phase = phases.get(when)
+        if phase is None:
+            continue
+        if not keep_verbose:
+            phase.entries = drop_verbose_entries(phase.entries)
+        write_phase_log(run_dir / f"{when}.log.json", phase)
+
     # Write procedure.json
     tracker = reporter._procedure_trackers.get(nodeid)
     procedure_data = tracker.serialize() if tracker else {"steps": []}
@@ -191,8 +233,10 @@ def write_run_finish_files(
             if checks:
                 reporter._check_results[nodeid] = _strip_nested_check_children(checks)
 
-    # Create artifacts directory
-    (run_dir / "artifacts").mkdir(parents=True, exist_ok=True)
+    # Create artifacts directory (the journal layout creates per-test
+    # directories only when a test actually saves an artifact)
+    if reporter.layout != "journal":
+        (run_dir / "artifacts").mkdir(parents=True, exist_ok=True)
 
     # Clean up the active tracker
     _set_tracker(None)
@@ -0,0 +1,203 @@
+"""Offline report regeneration — ``python -m pytest_reporter rebuild <run_dir>``.
+
+Rewrites ``report.html`` and ``junit.xml`` for a run directory from the files
+the session left on disk (see :mod:`._run_reader`), without running pytest:
+after a session was killed before it wrote them, or to pick up a newer
+dashboard.
+
+Only the index form of the tests is held in memory.  Run details (phase
+logs, procedures, artifacts, retry attempts) are streamed from disk twice,
+one test at a time: first for what the report's index needs up front (log
+search index, artifact blobs, JUnit cases), then again as the HTML writer
+reaches each test's shard.  Test directories are read ahead on a thread
+pool; the files are small and many, so the gain is in overlapping their I/O.
+
+Embedded artifacts go through one shared ``ArtifactStore``, deduplicated
+across the run as in the session, but without hard-linking files of the run
+directory being read.  The store is not thread-safe, so interning is
+serialised while listing and reading stay parallel.
+
+The building blocks here are shared with ``merge`` (:mod:`._merge`).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from ._artifacts import ArtifactStore
+from ._html_builder import write_html_report
+from ._junit_writer import JUnitCase, junit_cases_from_data, write_junit_cases
+from ._report_builder import collect_artifacts, link_artifacts
+from ._run_reader import RunReader, report_data
+from ._search_index import LogIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from ._artifacts import EmbeddedFile
+    from ._run_reader import ArtifactsFor
+
+# Results computed ahead of the consumer, per worker thread.
+_READ_AHEAD = 2
+
+# One test to read: its reader, its function directory and its index item.
+TestSource = tuple[RunReader, "Path", dict[str, Any]]
+
+
+def artifact_lister(mode: str, store: ArtifactStore, link_base: Path) -> ArtifactsFor:
+    """Return a thread-safe artifact lister for ``RunReader.read_runs``.
+
+    Embedded listings are kept after their first read, so a second pass over
+    the run details does not hash the files again.
+
+    Args:
+        mode: ``"embed"`` (interned into *store*) or ``"link"``.
+        store: Store for embedded artifacts.
+        link_base: Directory linked artifact ``href`` values are relative to
+            (where ``report.html`` is written).
+    """
+    lock = threading.Lock()
+    listed: dict[Path, list[dict[str, object]]] = {}
+
+    def artifacts_for(artifacts_dir: Path) -> list[dict[str, object]]:
+        if mode == "link":
+            return link_artifacts(artifacts_dir, link_base)
+        with lock:
+            if artifacts_dir in listed:
+                return listed[artifacts_dir]
+        artifacts = collect_artifacts(artifacts_dir)
+        with lock:
+            store.intern(artifacts_dir, artifacts)
+            listed[artifacts_dir] = artifacts
+        return artifacts
+
+    return artifacts_for
+
+
+def read_ahead(fn: Callable[[Any], Any], items: Iterable[Any], jobs: int | None) -> Iterator[Any]:
+    """Yield ``fn(item)`` for *items* in order, computed on a thread pool.
+
+    Unlike ``Executor.map``, only a few results per worker are computed ahead
+    of the consumer, so a slow consumer does not pile every result up in
+    memory.  *jobs* is the number of worker threads (``None`` lets the
+    executor choose).
+    """
+    workers = jobs or min(32, (os.cpu_count() or 1) + 4)  # the executor's default
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[Any]] = deque()
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= workers * _READ_AHEAD:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def read_index(items: list[tuple[RunReader, Path]], jobs: int | None = None) -> list[TestSource]:
+    """Read the index item of each ``(reader, test_dir)`` pair.
+
+    Items are returned in input order; unreadable test directories are
+    dropped.
+    """
+
+    def read_one(item: tuple[RunReader, Path]) -> dict[str, Any] | None:
+        reader, test_dir = item
+        return reader.read_test(test_dir)
+
+    return [
+        (reader, test_dir, test)
+        for (reader, test_dir), test in zip(items, read_ahead(read_one, items, jobs))
+        if test is not None
+    ]
+
+
+def read_details(
+    sources: Iterable[TestSource], artifacts_for: ArtifactsFor, jobs: int | None = None
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield, per source in order, the run details of its index item."""
+
+    def read_one(source: TestSource) -> list[dict[str, Any]]:
+        reader, test_dir, test = source
+        return reader.read_runs(test_dir, test, artifacts_for)
+
+    return read_ahead(read_one, sources, jobs)
+
+
+def _scan_details(
+    tests: list[dict[str, Any]], details: Iterable[list[dict[str, Any]]]
+) -> tuple[dict[str, object], list[JUnitCase]]:
+    """First pass of :func:`write_reports`: return the log index and JUnit cases."""
+    log_index = LogIndex()
+    cases: list[JUnitCase] = []
+    for test, runs in zip(tests, details):
+        detailed = {**test, "runs": [{**run, **d} for run, d in zip(test["runs"], runs)]}
+        log_index.add(detailed)
+        cases.extend(junit_cases_from_data([detailed]))
+    return log_index.to_dict(), cases
+
+
+def write_reports(
+    out_dir: Path,
+    tests: list[dict[str, Any]],
+    details: Callable[[], Iterable[list[dict[str, Any]]]],
+    *,
+    timestamp: str,
+    duration: float | None,
+    session_log: dict[str, Any],
+    blobs: dict[str, EmbeddedFile],
+    compress: bool = False,
+) -> None:
+    """Write ``report.html`` and ``junit.xml`` for index-form *tests* into *out_dir*.
+
+    *details* returns a fresh iterator over the tests' run details (per
+    test, in order, as from :meth:`~._run_reader.RunReader.read_runs`).  It is
+    called twice, and each test's details are dropped once used.  The first
+    pass builds the log index and JUnit cases and fills *blobs* (through the
+    artifact lister the details are read with); the second feeds the shards
+    block.  The other keyword arguments are those of
+    :func:`~._run_reader.report_data`.
+    """
+    log_search, cases = _scan_details(tests, details())
+    html_data = report_data(
+        tests,
+        timestamp=timestamp,
+        duration=duration,
+        session_log=session_log,
+        blobs=blobs,
+        log_search=log_search,
+        shards=details(),
+    )
+    write_html_report(out_dir / "report.html", html_data, compress=compress)
+    write_junit_cases(out_dir / "junit.xml", cases, html_data["duration"])
+
+
+def rebuild(
+    run_dir: Path,
+    *,
+    artifact_mode: str = "embed",
+    compress: bool = False,
+    jobs: int | None = None,
+) -> int:
+    """Write ``report.html`` and ``junit.xml`` into *run_dir*; return the test count."""
+    reader = RunReader(run_dir)
+    store = ArtifactStore(link_duplicates=False)
+    artifacts_for = artifact_lister(artifact_mode, store, run_dir)
+    sources = read_index([(reader, d) for d in reader.test_dirs()], jobs)
+    session_log = reader.session_log()
+    write_reports(
+        run_dir,
+        [test for _, _, test in sources],
+        lambda: read_details(sources, artifacts_for, jobs),
+        timestamp=run_dir.name,
+        duration=session_log.get("duration_seconds"),
+        session_log=session_log,
+        blobs=store.blobs,
+        compress=compress,
+    )
+    return len(sources)
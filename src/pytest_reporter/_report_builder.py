@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
-import base64
 import importlib.util
 import json
 import mimetypes
+import os
 import platform
 import sys
+import urllib.parse
 import warnings
+from collections.abc import Callable
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
+from ._artifacts import ArtifactStore, EmbeddedFile
 from ._dashboard_config import normalize_dashboard
+from ._journal import JournalReader
+from ._json_writer import param_entry
+from ._search_index import build_log_index, build_search_index
+from ._string_table import StringTable
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from .reporter import Reporter
 
 
@@ -64,40 +70,20 @@ def merge_metadata(
 
 MAX_EMBED_BYTES = 25 * 1024 * 1024  # 25 MB per-file embedding cap (REQ-6)
 
+_EMBEDDABLE_EXTS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".bmp", ".html", ".htm"}
+)
 
-def collect_artifacts(artifacts_dir: Path) -> list[dict[str, object]]:
-    """Read artifacts from disk and encode embeddable ones as data URIs.
-
-    Per-file I/O errors are caught and warned so a single locked or deleted
-    file does not prevent the rest of the artifact list from rendering (REQ-2A).
-    Files larger than ``MAX_EMBED_BYTES`` are included as metadata-only entries
-    without a ``data_uri``, avoiding MemoryError for large artifacts (REQ-6).
 
-    Args:
-        artifacts_dir: Path to the artifacts directory for a test run.
+def _artifact_files(artifacts_dir: Path) -> list[tuple[Path, int]]:
+    """Return ``(path, size)`` for every regular file in *artifacts_dir*, sorted by name.
 
-    Returns:
-        A list of artifact dicts, each containing at minimum ``name`` and ``size``.
-        Embeddable file types (images, HTML) additionally carry a ``data_uri``
-        with a base64-encoded ``data:`` URI.  Oversized or unreadable files
-        carry ``too_large: True`` or are skipped with a warning respectively.
+    Files that cannot be stat'ed are warned about and omitted (REQ-2A).
     """
     if not artifacts_dir.is_dir():
         return []
 
-    result: list[dict[str, object]] = []
-    embeddable = {
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".gif",
-        ".webp",
-        ".svg",
-        ".bmp",
-        ".html",
-        ".htm",
-    }
-
+    files: list[tuple[Path, int]] = []
     for path in sorted(artifacts_dir.iterdir()):
         if not path.is_file():
             continue
@@ -106,17 +92,44 @@ def collect_artifacts(artifacts_dir: Path) -> list[dict[str, object]]:
         except (OSError, ValueError) as err:
             warnings.warn(
                 f"pytest-reporter: artifact skipped (stat failed): {path}: {err}",
-                stacklevel=2,
+                stacklevel=3,
             )
             continue
+        files.append((path, size))
+    return files
+
+
+def collect_artifacts(artifacts_dir: Path) -> list[dict[str, object]]:
+    """List artifacts on disk and reference embeddable ones as lazy data URIs.
 
+    Per-file I/O errors are caught and warned so a single locked or deleted
+    file does not prevent the rest of the artifact list from rendering (REQ-2A).
+    Files larger than ``MAX_EMBED_BYTES`` are included as metadata-only entries
+    without a ``data_uri``, avoiding MemoryError for large artifacts (REQ-6).
+
+    No artifact content is read here: an embeddable file's ``data_uri`` is an
+    :class:`~pytest_reporter._artifacts.EmbeddedFile` that the HTML writer
+    base64-encodes in chunks straight into ``report.html``, so memory does not
+    grow with the total artifact volume of the run.
+
+    Args:
+        artifacts_dir: Path to the artifacts directory for a test run.
+
+    Returns:
+        A list of artifact dicts, each containing at minimum ``name`` and ``size``.
+        Embeddable file types (images, HTML) additionally carry a ``data_uri``
+        (an ``EmbeddedFile``).  Oversized files carry ``too_large: True``;
+        files that cannot be stat'ed are skipped with a warning.
+    """
+    result: list[dict[str, object]] = []
+    for path, size in _artifact_files(artifacts_dir):
         entry: dict[str, object] = {
             "name": path.name,
             "size": size,
         }
 
         ext = path.suffix.lower()
-        if ext in embeddable:
+        if ext in _EMBEDDABLE_EXTS:
             if size > MAX_EMBED_BYTES:
                 # File is too large to embed — metadata-only entry (REQ-6)
                 entry["too_large"] = True
@@ -125,25 +138,127 @@ def collect_artifacts(artifacts_dir: Path) -> list[dict[str, object]]:
                     stacklevel=2,
                 )
             else:
-                try:
-                    raw = path.read_bytes()
-                except (OSError, ValueError) as err:
-                    warnings.warn(
-                        f"pytest-reporter: artifact skipped (read failed): {path}: {err}",
-                        stacklevel=2,
-                    )
-                    result.append(entry)
-                    continue
                 mime = mimetypes.guess_type(path.name)[0] or (
                     "text/html" if ext in (".html", ".htm") else "application/octet-stream"
                 )
-                b64 = base64.b64encode(raw).decode("ascii")
-                entry["data_uri"] = f"data:{mime};base64,{b64}"
+                entry["data_uri"] = EmbeddedFile(path, mime)
 
         result.append(entry)
     return result
 
 
+def link_artifacts(artifacts_dir: Path, report_dir: Path) -> list[dict[str, object]]:
+    """List artifacts on disk as links relative to ``report.html`` (``--report-artifacts=link``).
+
+    Only directory listings and ``stat`` calls are made; no artifact content is
+    read, and there is no size cap because nothing is embedded.  The report is
+    then no longer self-contained: it must stay next to its ``tests/`` tree
+    (``01_latest/`` copies both together).
+
+    Args:
+        artifacts_dir: Path to the artifacts directory for a test run.
+        report_dir: Directory containing ``report.html`` (the run directory).
+
+    Returns:
+        A list of artifact dicts with ``name``, ``size`` and ``href`` (a
+        URL-quoted path relative to *report_dir*).
+    """
+    return [
+        {
+            "name": path.name,
+            "size": size,
+            "href": urllib.parse.quote(Path(os.path.relpath(path, report_dir)).as_posix()),
+        }
+        for path, size in _artifact_files(artifacts_dir)
+    ]
+
+
+def _retry_attempt_names(retries_base: Path, journal: JournalReader | None) -> list[str]:
+    """Return the sorted retry attempt names (``01``, ``02`` ...) recorded for a run."""
+    names: set[str] = set()
+    if retries_base.is_dir():
+        names.update(p.name for p in retries_base.iterdir() if p.is_dir())
+    if journal is not None:
+        rel_base = journal.relative_path(retries_base)
+        if rel_base is not None:
+            names.update(journal.children(rel_base))
+    return sorted(names)
+
+
+def _read_json_record(path: Path, journal: JournalReader | None) -> Any:  # noqa: ANN401
+    """Return the JSON stored for *path*, from the journal or the file itself.
+
+    Returns:
+        The parsed value, or ``None`` when neither holds a record for *path*.
+
+    Raises:
+        OSError: If the record exists but cannot be read.
+        ValueError: If the record exists but is not valid JSON.
+    """
+    if journal is not None:
+        rel_path = journal.relative_path(path)
+        if rel_path is not None and rel_path in journal:
+            return journal.get(rel_path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def read_retry_attempts(
+    run_dir: Path,
+    journal: JournalReader | None,
+    artifacts_for: Callable[[Path], list[dict[str, object]]],
+) -> list[dict[str, Any]]:
+    """Read the retry attempts recorded under ``<run_dir>/retries/`` (or the run journal).
+
+    Args:
+        run_dir: The run's directory (``.../<function>/<run_id>``).
+        journal: Reader for ``--report-layout=journal`` runs, else ``None``.
+        artifacts_for: Returns the artifact list for an ``artifacts`` directory.
+
+    Returns:
+        One dict per attempt with its ``phases`` (as logged), ``artifacts``
+        and, when recorded, ``procedure``.
+    """
+    retry_attempts: list[dict[str, Any]] = []
+    for attempt_name in _retry_attempt_names(run_dir / "retries", journal):
+        attempt_dir = run_dir / "retries" / attempt_name
+        attempt_data: dict[str, Any] = {
+            "attempt": attempt_name,
+            "phases": {},
+            "artifacts": artifacts_for(attempt_dir / "artifacts"),
+        }
+        # Read phase logs from retry dir — guarded per-file (REQ-2B).
+        # A corrupt or unreadable phase log is warned and omitted
+        # so the attempt entry is still present minus the bad phase.
+        for phase_name in ("setup", "call", "teardown"):
+            phase_file = attempt_dir / f"{phase_name}.log.json"
+            try:
+                phase_log = _read_json_record(phase_file, journal)
+            except (ValueError, OSError) as err:
+                warnings.warn(
+                    f"pytest-reporter: retry phase log skipped (unreadable): {phase_file}: {err}",
+                    stacklevel=2,
+                )
+                continue
+            if phase_log is not None:
+                attempt_data["phases"][phase_name] = phase_log
+        # Read procedure — guarded (REQ-2B)
+        proc_file = attempt_dir / "procedure.json"
+        try:
+            procedure_log = _read_json_record(proc_file, journal)
+        except (ValueError, OSError) as err:
+            warnings.warn(
+                f"pytest-reporter: retry procedure log skipped (unreadable): {proc_file}: {err}",
+                stacklevel=2,
+            )
+            procedure_log = None
+        if procedure_log is not None:
+            attempt_data["procedure"] = procedure_log
+        retry_attempts.append(attempt_data)
+    return retry_attempts
+
+
 def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dict:  # type: ignore[type-arg]
     """Build the data dict for the HTML report.
 
@@ -155,8 +270,22 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
     Returns:
         A dict ready to be passed to ``build_html_report()``.
     """
-    # Collect all test data
+    # Collect all test data.  Embedded artifacts go through a per-run content
+    # store so identical files across runs and retry attempts are embedded
+    # once; linked artifacts are only listed, never read.
+    link_mode = reporter.artifact_mode == "link"
+    journal = JournalReader(reporter.context.run_dir) if reporter.layout == "journal" else None
+    artifact_store = ArtifactStore()
+
+    def artifacts_for(artifacts_dir: Path) -> list[dict[str, object]]:
+        if link_mode:
+            return link_artifacts(artifacts_dir, reporter.context.run_dir)
+        artifacts = collect_artifacts(artifacts_dir)
+        artifact_store.intern(artifacts_dir, artifacts)
+        return artifacts
+
     tests: list[dict] = []  # type: ignore[type-arg]
+    search_fields: list[list[str | None]] = []
     for base_nodeid in reporter.collector.get_all_base_nodeids():
         aggregate = reporter.collector.get_function_aggregate(base_nodeid)
         runs: list[dict] = []  # type: ignore[type-arg]
@@ -182,11 +311,14 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
                 run_info.function_name,
                 run_info.run_id,
             )
-            artifacts = collect_artifacts(run_dir / "artifacts")
+            artifacts = artifacts_for(run_dir / "artifacts")
 
             # Collect procedure
             tracker = reporter._procedure_trackers.get(nodeid)
-            procedure = tracker.serialize() if tracker else {"steps": []}
+            if tracker is not None:
+                procedure = tracker.serialize()
+            else:
+                procedure = reporter._procedures.get(nodeid, {"steps": []})
 
             # Collect retry data
             retry_data = reporter.collector.get_retry_data(nodeid)
@@ -198,44 +330,8 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
                     "original_outcome": retry_data.original_outcome,
                     "history": retry_data.history,
                 }
-                # Collect retry attempt data from disk
-                retries_base = run_dir / "retries"
-                if retries_base.is_dir():
-                    for attempt_dir in sorted(retries_base.iterdir()):
-                        if attempt_dir.is_dir():
-                            attempt_data: dict[str, Any] = {
-                                "attempt": attempt_dir.name,
-                                "phases": {},
-                                "artifacts": collect_artifacts(attempt_dir / "artifacts"),
-                            }
-                            # Read phase logs from retry dir — guarded per-file (REQ-2B).
-                            # A corrupt or unreadable phase log is warned and omitted
-                            # so the attempt entry is still present minus the bad phase.
-                            for phase_name in ("setup", "call", "teardown"):
-                                phase_file = attempt_dir / f"{phase_name}.log.json"
-                                if phase_file.exists():
-                                    try:
-                                        attempt_data["phases"][phase_name] = json.loads(
-                                            phase_file.read_text()
-                                        )
-                                    except (json.JSONDecodeError, OSError) as err:
-                                        warnings.warn(
-                                            f"pytest-reporter: retry phase log skipped "
-                                            f"(unreadable): {phase_file}: {err}",
-                                            stacklevel=2,
-                                        )
-                            # Read procedure — guarded (REQ-2B)
-                            proc_file = attempt_dir / "procedure.json"
-                            if proc_file.exists():
-                                try:
-                                    attempt_data["procedure"] = json.loads(proc_file.read_text())
-                                except (json.JSONDecodeError, OSError) as err:
-                                    warnings.warn(
-                                        f"pytest-reporter: retry procedure log skipped "
-                                        f"(unreadable): {proc_file}: {err}",
-                                        stacklevel=2,
-                                    )
-                            retry_attempts.append(attempt_data)
+                # Collect retry attempt data from disk (or the run journal)
+                retry_attempts = read_retry_attempts(run_dir, journal, artifacts_for)
 
             # Collect verification check results from pytest-verify
             check_results = reporter._check_results.get(nodeid, [])
@@ -245,10 +341,7 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
                     "run_id": run_info.run_id,
                     "nodeid": nodeid,
                     "parametrize_id": run_info.parametrize_id,
-                    "params": {
-                        k: {"type": type(v).__name__, "value": str(v)}
-                        for k, v in run_info.params.items()
-                    },
+                    "params": {k: param_entry(v) for k, v in run_info.params.items()},
                     "outcome": reporter.collector.get_outcome(nodeid),
                     "duration": round(reporter.collector.get_duration(nodeid), 4),
                     "phases": phases,
@@ -259,13 +352,31 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
                     "check_results": check_results,
                 }
             )
+        # Retry counts are summed here once so the dashboard's tree aggregates
+        # never have to scan runs.
+        retried = [r["retries"]["attempts"] for r in runs if r["retries"]]
         tests.append(
             {
                 "base_nodeid": base_nodeid,
-                "aggregate": dict(aggregate),
+                "aggregate": {
+                    **aggregate,
+                    "retried_runs": len(retried),
+                    "retry_attempts": sum(retried),
+                },
                 "runs": runs,
             }
         )
+        first_run = reporter.collector.get_run_info(runs[0]["nodeid"]) if runs else None
+        search_fields.append(
+            [
+                base_nodeid,
+                aggregate["file"],
+                aggregate["function_name"],
+                aggregate["class_name"],
+                *(first_run.markers if first_run else ()),
+                *(run["parametrize_id"] for run in runs),
+            ]
+        )
 
     # Collect distributed plugins via pytest11 entry points.
     # Only distributions that explicitly advertise a pytest11 entry point are shown.
@@ -303,7 +414,7 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
     cmdline = reporter.config.invocation_params.args
 
     # Session log data
-    session_log_data = reporter.session_logger.serialize()
+    session_log_data = {"entries": reporter.session_entries()}
 
     # Collect and merge metadata from hook + fixture.
     # Broad except is intentional: pytest_reporter_metadata() is third-party
@@ -375,6 +486,9 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
 
     seed: str | None = str(seed_raw) if seed_raw is not None else None
 
+    search_index = build_search_index(search_fields)
+    log_index = build_log_index(tests)
+
     return {
         "timestamp": reporter.context.timestamp,
         "duration": round(duration, 2),
@@ -385,6 +499,11 @@ def build_html_data(reporter: Reporter, duration: float, exitstatus: int) -> dic
         "plugins": plugin_list,
         "cmdline": [str(a) for a in cmdline],
         "tests": tests,
+        "blobs": artifact_store.blobs,
+        "search": search_index,
+        "log_search": log_index,
+        # Filled test by test as the shards are written (PayloadWriter).
+        "strings": StringTable(),
         "session_log": session_log_data,
         "retries_enabled": reporter.max_retries > 0,
         "max_retries": reporter.max_retries,
@@ -7,8 +7,7 @@ from typing import TYPE_CHECKING, Any
 
 from ._context import sanitize_path_component
 from ._json_writer import write_failure_log, write_phase_log, write_procedure_json
-from ._logger import Logger
-from ._phase_capture import flush_table_artifacts
+from ._phase_capture import drop_verbose_entries, flush_table_artifacts
 from ._procedure import ProcedureTracker, _set_tracker
 from ._types import PhaseData, RetryData
 
@@ -72,6 +71,9 @@ def run_with_retries(
         all_entries = logger.serialize().get("entries", [])
         run_dir = reporter._get_run_dir(nodeid)
         flush_table_artifacts(logger, run_dir)
+    if reporter.log_retention == "failed" and not any(r.failed for r in reports):
+        # Failed runs are retried, and retried runs keep their verbose entries
+        all_entries = drop_verbose_entries(all_entries)
 
     for report in reports:
         entries = all_entries if report.when == "call" else []
@@ -141,7 +143,7 @@ def run_with_retries(
         reporter._retry_paths[nodeid] = retry_dir
 
         # Create fresh logger and procedure tracker for retry
-        logger = Logger()
+        logger = reporter.new_logger()
         reporter._test_loggers[nodeid] = logger
         item._reporter_logger = logger  # type: ignore[attr-defined]
 
@@ -157,14 +159,18 @@ def run_with_retries(
         # (nextitem=None, the old value, tore down everything incl. session.)
         retry_reports = runtestprotocol(item, nextitem=nextitem, log=False)
 
+        # pytest_runtest_setup installed a fresh logger and tracker for the
+        # attempt; as in the first run, its entries all belong to the call phase.
+        logger = reporter._test_loggers.get(nodeid)
+        tracker = reporter._procedure_trackers.get(nodeid, tracker)
+        attempt_entries: list[dict[str, Any]] = []
+        if logger is not None:
+            attempt_entries = logger.serialize().get("entries", [])
+            flush_table_artifacts(logger, retry_dir)
+
         # Write retry phase logs directly to disk (don't overwrite collector)
         for report in retry_reports:
-            retry_entries: list[dict[str, Any]] = []
-            if logger is not None:
-                serialized = logger.serialize()
-                retry_entries = serialized.get("entries", [])
-                flush_table_artifacts(logger, retry_dir)
-
+            retry_entries = attempt_entries if report.when == "call" else []
             end_time = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
             start_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00")) - timedelta(
                 seconds=report.duration
@@ -0,0 +1,406 @@
+"""Read a run directory back into HTML report data.
+
+The inverse of the per-test files written during a session: ``test.log.json``
+aggregates, per-run phase logs, ``procedure.json``, ``parameters.json``,
+retry attempts and artifacts — from the ``tests/`` tree or, for
+``--report-layout=journal`` runs, from ``run.jsonl``.
+
+:meth:`RunReader.index` returns the lightweight part of every
+``DATA.tests`` item (aggregate and per-run summaries) and
+:meth:`RunReader.read_runs` the per-run details, in the shape
+``build_html_data`` produces, so the dashboard can render either.
+
+A test whose ``test.log.json`` is missing (the session was killed before
+it ended) is rebuilt from its runs' files: outcome and duration from the
+phase logs, retries from ``retries/``, node ID from ``parameters.json``
+(falling back to the directory path for runs written before it recorded
+one).
+
+Unreadable records are warned about and skipped; the reporter never fails a
+whole read because of one bad file.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Callable, Iterable
+from pathlib import PurePath, PurePosixPath
+from typing import TYPE_CHECKING, Any
+
+from ._dashboard_config import normalize_dashboard
+from ._journal import JOURNAL_NAME, JournalReader
+from ._report_builder import _read_json_record, link_artifacts, read_retry_attempts
+from ._search_index import build_search_index
+from ._string_table import StringTable
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ._artifacts import EmbeddedFile
+
+ArtifactsFor = Callable[["Path"], list[dict[str, object]]]
+
+_PHASES = ("setup", "call", "teardown")
+
+# Files that mark a directory as one run of a test function.
+_RUN_FILES = frozenset({"parameters.json", *(f"{w}.log.json" for w in _PHASES)})
+
+
+def _phase_from_log(log: dict[str, Any]) -> dict[str, Any]:
+    """Convert a ``<phase>.log.json`` record to the report's phase shape."""
+    return {
+        "phase": log.get("phase"),
+        "outcome": log.get("outcome"),
+        "start_time": log.get("start_time"),
+        "end_time": log.get("end_time"),
+        "duration": log.get("duration_seconds", 0.0),
+        "longrepr": log.get("longrepr"),
+        "entries": log.get("entries", []),
+    }
+
+
+def _run_outcome(phases: dict[str, dict[str, Any]]) -> str:
+    """Derive a run's outcome from its phase logs, as ``DataCollector`` does."""
+    setup, call = phases.get("setup"), phases.get("call")
+    if setup and setup.get("outcome") == "skipped":
+        return "skipped"
+    if call is None:
+        return "error" if setup and setup.get("outcome") == "failed" else "skipped"
+    return str(call.get("outcome"))
+
+
+def run_totals(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Return the ``test.log.json`` counts and total duration of *runs*."""
+    totals: dict[str, Any] = {
+        "total_runs": len(runs),
+        "passed": 0,
+        "failed": 0,
+        "skipped": 0,
+        "errors": 0,
+    }
+    for run in runs:
+        outcome = run.get("outcome")
+        totals[outcome if outcome in ("passed", "failed", "skipped") else "errors"] += 1
+    totals["total_duration_seconds"] = round(
+        sum(float(run.get("duration_seconds") or 0) for run in runs), 4
+    )
+    return totals
+
+
+def index_item(aggregate: dict[str, Any]) -> dict[str, Any]:
+    """Return the index form of a ``DATA.tests`` item for a ``test.log.json`` aggregate.
+
+    Runs carry only their summary fields (``run_id``, ``outcome``,
+    ``duration``, ``retries``).
+    """
+    runs = [
+        {
+            "run_id": str(run.get("run_id")),
+            "outcome": run.get("outcome"),
+            "duration": run.get("duration_seconds", 0.0),
+            "retries": run.get("retries"),
+        }
+        for run in aggregate.get("runs", [])
+        if isinstance(run, dict)
+    ]
+    retried = [r["retries"]["attempts"] for r in runs if r["retries"]]
+    return {
+        "base_nodeid": aggregate["test_id"],
+        "aggregate": {
+            **aggregate,
+            "retried_runs": len(retried),
+            "retry_attempts": sum(retried),
+        },
+        "runs": runs,
+    }
+
+
+class RunReader:
+    """Random-access reader over one run directory (``runs/<timestamp>``)."""
+
+    def __init__(self, run_dir: Path) -> None:
+        self.run_dir = run_dir
+        self.journal = JournalReader(run_dir) if (run_dir / JOURNAL_NAME).exists() else None
+
+    def record(self, path: Path) -> Any:  # noqa: ANN401
+        """Return the JSON record for *path*, or ``None`` if absent or unreadable."""
+        try:
+            return _read_json_record(path, self.journal)
+        except (ValueError, OSError) as err:
+            warnings.warn(
+                f"pytest-reporter: record skipped (unreadable): {path}: {err}",
+                stacklevel=2,
+            )
+            return None
+
+    def _exists(self, path: Path) -> bool:
+        if self.journal is not None:
+            rel_path = self.journal.relative_path(path)
+            if rel_path is not None and rel_path in self.journal:
+                return True
+        return path.exists()
+
+    def _children(self, directory: Path) -> list[str]:
+        """Return the sorted entry names under *directory* in the tree or journal."""
+        names: set[str] = set()
+        if directory.is_dir():
+            names.update(p.name for p in directory.iterdir())
+        if self.journal is not None:
+            rel_dir = self.journal.relative_path(directory)
+            if rel_dir is not None:
+                names.update(self.journal.children(rel_dir))
+        return sorted(names)
+
+    def run_ids(self, test_dir: Path) -> list[str]:
+        """Return the IDs of the runs that left files (a phase log or ``parameters.json``).
+
+        ``test.log.json`` also lists runs that were collected but never run
+        (e.g. deselected); those have no directory of their own.
+        """
+        return [
+            name
+            for name in self._children(test_dir)
+            if any(self._exists(test_dir / name / f) for f in _RUN_FILES)
+        ]
+
+    def test_dirs(self) -> list[Path]:
+        """Return every test function directory of the run, sorted.
+
+        A directory counts when it holds a ``test.log.json`` or at least one
+        run (a subdirectory with a phase log or ``parameters.json``).
+        """
+        tests_dir = self.run_dir / "tests"
+        paths: list[PurePath] = [p.relative_to(self.run_dir) for p in tests_dir.rglob("*.json")]
+        if self.journal is not None:
+            paths.extend(PurePosixPath(p) for p in self.journal.paths() if p.startswith("tests/"))
+        found = set()
+        for path in paths:
+            if path.name == "test.log.json":
+                found.add(self.run_dir / path.parent)
+            elif path.name in _RUN_FILES and path.parent.parent.name != "retries":
+                found.add(self.run_dir / path.parent.parent)
+        return sorted(found)
+
+    def _derive_aggregate(self, test_dir: Path) -> dict[str, Any] | None:
+        """Rebuild ``test.log.json`` for *test_dir* from its runs' files."""
+        test_id = None
+        runs: list[dict[str, Any]] = []
+        for run_id in self.run_ids(test_dir):
+            run_path = test_dir / run_id
+            params = self.record(run_path / "parameters.json")
+            if isinstance(params, dict) and isinstance(params.get("test_id"), str):
+                test_id = params["test_id"]
+            phases = {}
+            for when in _PHASES:
+                log = self.record(run_path / f"{when}.log.json")
+                if isinstance(log, dict):
+                    phases[when] = log
+            outcome = _run_outcome(phases)
+            run: dict[str, Any] = {
+                "run_id": run_id,
+                "outcome": outcome,
+                "duration_seconds": round(
+                    sum(float(p.get("duration_seconds") or 0) for p in phases.values()), 4
+                ),
+            }
+            attempts = [
+                self.record(run_path / "retries" / name / "call.log.json")
+                for name in self._children(run_path / "retries")
+            ]
+            if attempts:
+                history = [outcome] + [
+                    str(a.get("outcome")) if isinstance(a, dict) else "error" for a in attempts
+                ]
+                run["outcome"] = history[-1]
+                run["retries"] = {
+                    "attempts": len(attempts),
+                    "original_outcome": outcome,
+                    "history": history,
+                }
+            runs.append(run)
+        if not runs:
+            return None
+        if test_id is None:
+            rel_dir = test_dir.relative_to(self.run_dir / "tests")
+            test_id = f"{rel_dir.parent.as_posix()}::{rel_dir.name}"
+        file_path, _, function_name = test_id.partition("::")
+        class_name, _, display_name = function_name.rpartition("::")
+        return {
+            "test_id": test_id,
+            "function_name": function_name,
+            "file": file_path,
+            **run_totals(runs),
+            "runs": runs,
+            "class_name": class_name or None,
+            "display_name": display_name,
+        }
+
+    def read_test(self, test_dir: Path) -> dict[str, Any] | None:
+        """Return the index form of one ``DATA.tests`` item, or ``None`` if unreadable.
+
+        Runs carry only their summary fields: those of :func:`index_item` and,
+        from ``parameters.json``, ``nodeid``, ``parametrize_id`` and
+        ``params`` (searched and shown by the Tests tab).  See
+        :meth:`read_runs` for the rest.
+        """
+        aggregate = self.record(test_dir / "test.log.json")
+        if not isinstance(aggregate, dict) or "test_id" not in aggregate:
+            aggregate = self._derive_aggregate(test_dir)
+            if aggregate is None:
+                return None
+        test = index_item(aggregate)
+        for run in test["runs"]:
+            run.update(self._run_parameters(test_dir / run["run_id"], test["base_nodeid"]))
+        return test
+
+    def _run_parameters(self, run_path: Path, base_nodeid: str) -> dict[str, Any]:
+        """Return a run's ``nodeid``, ``parametrize_id`` and ``params``."""
+        params = self.record(run_path / "parameters.json")
+        params = params if isinstance(params, dict) else {}
+        pid = params.get("parametrize_id")
+        return {
+            "nodeid": f"{base_nodeid}[{pid}]" if pid else base_nodeid,
+            "parametrize_id": pid,
+            "params": params.get("params", {}),
+        }
+
+    def index(self) -> list[tuple[Path, dict[str, Any]]]:
+        """Return ``(test_dir, index item)`` for every readable test of the run."""
+        items = []
+        for test_dir in self.test_dirs():
+            test = self.read_test(test_dir)
+            if test is not None:
+                items.append((test_dir, test))
+        return items
+
+    def read_runs(
+        self, test_dir: Path, test: dict[str, Any], artifacts_for: ArtifactsFor | None = None
+    ) -> list[dict[str, Any]]:
+        """Return, per run of *test*, the fields :meth:`read_test` leaves out.
+
+        Args:
+            test_dir: The test function directory.
+            test: The item returned by :meth:`read_test` for *test_dir*.
+            artifacts_for: Returns the artifact list for an ``artifacts``
+                directory; defaults to listing them as links relative to
+                the run directory.
+        """
+        if artifacts_for is None:
+
+            def artifacts_for(artifacts_dir: Path) -> list[dict[str, object]]:
+                return link_artifacts(artifacts_dir, self.run_dir)
+
+        details = []
+        for run in test["runs"]:
+            run_path = test_dir / run["run_id"]
+            phases = {}
+            for when in _PHASES:
+                log = self.record(run_path / f"{when}.log.json")
+                if isinstance(log, dict):
+                    phases[when] = _phase_from_log(log)
+            procedure = self.record(run_path / "procedure.json")
+            details.append(
+                {
+                    "phases": phases,
+                    "procedure": procedure if isinstance(procedure, dict) else {"steps": []},
+                    "artifacts": artifacts_for(run_path / "artifacts"),
+                    "retry_attempts": (
+                        read_retry_attempts(run_path, self.journal, artifacts_for)
+                        if run["retries"]
+                        else []
+                    ),
+                    # pytest-verify results live only in the session's memory.
+                    "check_results": [],
+                }
+            )
+        return details
+
+    def session_log(self) -> dict[str, Any]:
+        """Return ``session.log.json`` (``{"entries": []}`` when absent)."""
+        log = self.record(self.run_dir / "session.log.json")
+        return log if isinstance(log, dict) else {"entries": []}
+
+    def report_data(
+        self,
+        tests: list[dict[str, Any]],
+        *,
+        blobs: dict[str, EmbeddedFile] | None = None,
+    ) -> dict[str, Any]:
+        """Assemble REPORT_DATA for index-form *tests* of this run; see :func:`report_data`."""
+        session_log = self.session_log()
+        return report_data(
+            tests,
+            timestamp=self.run_dir.name,
+            duration=session_log.get("duration_seconds"),
+            session_log=session_log,
+            blobs=blobs,
+        )
+
+
+def report_data(
+    tests: list[dict[str, Any]],
+    *,
+    timestamp: str,
+    duration: float | None,
+    session_log: dict[str, Any],
+    blobs: dict[str, EmbeddedFile] | None = None,
+    log_search: dict[str, object] | None = None,
+    shards: Iterable[list[dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
+    """Assemble REPORT_DATA around *tests* read back from disk.
+
+    Fields only known to the live session (exit code, interpreter and plugin
+    versions, command line, metadata and dashboard hooks, ``pytest-verify``
+    checks) are left empty.
+
+    Args:
+        tests: ``DATA.tests`` items in index form (run details, if any, are
+            written as the tests' shards).
+        timestamp: The run's timestamp (its directory name).
+        duration: Session duration; ``None`` sums the tests' durations.
+        session_log: The ``session.log.json`` content.
+        blobs: Embedded artifact payloads referenced by the tests.
+        log_search: The log search index (its own report block), if built.
+        shards: Per test, in order, its runs' details as returned by
+            :meth:`RunReader.read_runs`.  Consumed once, by the HTML writer
+            as it writes the shards block, with repeated strings interned as
+            ``build_html_data`` does.
+    """
+    if duration is None:
+        duration = round(sum(t["aggregate"].get("total_duration_seconds", 0) for t in tests), 2)
+    search = build_search_index(
+        [
+            t["base_nodeid"],
+            t["aggregate"].get("file"),
+            t["aggregate"].get("function_name"),
+            t["aggregate"].get("class_name"),
+            *(run.get("parametrize_id") for run in t["runs"]),
+        ]
+        for t in tests
+    )
+    extra: dict[str, Any] = {}
+    if log_search is not None:
+        extra["log_search"] = log_search
+    if shards is not None:
+        extra["strings"] = StringTable()
+        extra["shards"] = shards
+    return {
+        "timestamp": timestamp,
+        "duration": duration,
+        "exit_code": None,
+        "python_version": None,
+        "pytest_version": None,
+        "platform": None,
+        "plugins": [],
+        "cmdline": [],
+        "tests": tests,
+        "blobs": blobs or {},
+        "search": search,
+        **extra,
+        "session_log": session_log,
+        "retries_enabled": any(t["aggregate"].get("retried_runs") for t in tests),
+        "max_retries": None,
+        "system_metadata": {},
+        "dashboard": normalize_dashboard([], []),
+        "seed": None,
+    }
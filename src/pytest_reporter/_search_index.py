@@ -0,0 +1,140 @@
+"""Search indexes — built once at report time, queried by the HTML report.
+
+Pure module: no pytest imports, no side effects, no I/O.
+
+Test filter (``DATA.search``): each test contributes a few searchable fields
+(node ID, file, function and class name, markers, parametrize IDs).  The
+index holds, per test, the lowercased fields joined by newlines (``text``),
+and for every trigram that occurs inside a field the ascending list of test
+indices containing it (``grams``).  A query of three or more characters
+intersects the posting lists of its trigrams and confirms each candidate
+with a substring check on ``text``, so the browser touches only tests that
+can match.
+
+Log search (``log_search``, the report's ``report-log-search`` block): an
+inverted index from word tokens of log messages, exception types/messages and
+failure tracebacks to the places they occur — one ``[test, run, phase,
+entry]`` location per log entry, with entry ``-1`` standing for the phase's
+``longrepr``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+GRAM = 3
+
+# Word tokens for the log index.  One-character tokens are too common to be
+# useful; very long ones (hex dumps, base64) are cut to a fixed prefix.
+_TOKEN_RE = re.compile(r"\w{2,}")
+_MAX_TOKEN_LEN = 40
+
+# Distinct (token, location) postings kept per test, so one test that logs a
+# megabyte of output cannot dominate the report size.  Tokens past the cap are
+# not searchable.
+MAX_TOKENS_PER_TEST = 5000
+
+
+def _grams(field: str) -> set[str]:
+    return {field[i : i + GRAM] for i in range(len(field) - GRAM + 1)}
+
+
+def build_search_index(tests: Iterable[Iterable[str | None]]) -> dict[str, object]:
+    """Build the search index embedded as ``DATA.search``.
+
+    Args:
+        tests: For each test, in ``DATA.tests`` order, the strings it should
+            be found by.  ``None`` and empty strings are ignored.
+
+    Returns:
+        ``{"gram": 3, "text": [...], "grams": {trigram: [test_index, ...]}}``.
+    """
+    text: list[str] = []
+    grams: dict[str, list[int]] = {}
+    for idx, fields in enumerate(tests):
+        seen: list[str] = []
+        for field in fields:
+            if field:
+                lowered = field.lower()
+                if lowered not in seen:
+                    seen.append(lowered)
+        text.append("\n".join(seen))
+        test_grams: set[str] = set()
+        for field in seen:
+            test_grams |= _grams(field)
+        for gram in test_grams:
+            grams.setdefault(gram, []).append(idx)
+    return {"gram": GRAM, "text": text, "grams": grams}
+
+
+def _tokens(text: str) -> list[str]:
+    """Return the distinct tokens of *text* in order of first occurrence."""
+    return list(dict.fromkeys(tok[:_MAX_TOKEN_LEN] for tok in _TOKEN_RE.findall(text.lower())))
+
+
+def _entry_text(entry: dict[str, Any]) -> str:
+    exc = entry.get("exc") or {}
+    return f"{entry.get('msg') or ''} {exc.get('type') or ''} {exc.get('msg') or ''}"
+
+
+class LogIndex:
+    """Incremental builder of the ``log_search`` index, fed one test at a time.
+
+    Lets a caller that streams tests from disk index each one and drop it;
+    :func:`build_log_index` is the one-shot form.
+    """
+
+    def __init__(self, max_tokens_per_test: int = MAX_TOKENS_PER_TEST) -> None:
+        self.max_tokens_per_test = max_tokens_per_test
+        self._tests = 0
+        self._locs: list[list[object]] = []
+        self._index: dict[str, list[int]] = {}
+
+    def add(self, test: dict[str, Any]) -> None:
+        """Index the phases of every run of the next ``DATA.tests`` item."""
+        t_idx = self._tests
+        self._tests += 1
+        budget = self.max_tokens_per_test
+        for r_idx, run in enumerate(test.get("runs", [])):
+            for when, phase in run.get("phases", {}).items():
+                texts = [
+                    (e_idx, _entry_text(e)) for e_idx, e in enumerate(phase.get("entries") or [])
+                ]
+                texts.append((-1, phase.get("longrepr") or ""))
+                for e_idx, text in texts:
+                    tokens = _tokens(text)[:budget]
+                    if not tokens:
+                        continue
+                    budget -= len(tokens)
+                    loc = len(self._locs)
+                    self._locs.append([t_idx, r_idx, when, e_idx])
+                    for tok in tokens:
+                        self._index.setdefault(tok, []).append(loc)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the index in the shape described in :func:`build_log_index`."""
+        terms = sorted(self._index)
+        return {"locs": self._locs, "terms": terms, "postings": [self._index[t] for t in terms]}
+
+
+def build_log_index(
+    tests: Iterable[dict[str, Any]], max_tokens_per_test: int = MAX_TOKENS_PER_TEST
+) -> dict[str, object]:
+    """Build the full-text log index embedded as the ``log_search`` block.
+
+    Args:
+        tests: The ``DATA.tests`` items; each run's ``phases`` are indexed.
+        max_tokens_per_test: Cap on ``(token, location)`` postings per test.
+
+    Returns:
+        ``{"locs": [[test, run, phase, entry], ...], "terms": [...],
+        "postings": [[loc, ...], ...]}`` where ``terms`` is sorted (for
+        prefix lookups) and ``postings[i]`` lists, ascending, the locations
+        containing ``terms[i]``.
+    """
+    index = LogIndex(max_tokens_per_test)
+    for test in tests:
+        index.add(test)
+    return index.to_dict()
@@ -0,0 +1,100 @@
+"""Local report server — ``python -m pytest_reporter serve <run_dir>``.
+
+Serves the regular dashboard for a run directory without building a
+``report.html``: the page embeds only the test index (aggregates and run
+summaries, read from every ``test.log.json``), and the dashboard fetches a
+test's phase logs, procedures, parameters and retry attempts from
+``/shards/<n>`` when the test is opened.  Decoded details are kept in an
+in-memory LRU.  Any other path is served as a static file from the run
+directory, which is where the artifact links point.
+
+Stdlib only (``http.server``); meant for local browsing, not for exposure on
+a network.
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import json
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+from ._html_builder import build_html_report
+from ._run_reader import RunReader
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SHARD_PATH = "/shards/"
+
+# Decoded per-test details kept in memory.
+DEFAULT_CACHE_SIZE = 512
+
+
+class RunServerState:
+    """The served run: its index page and an LRU of per-test details."""
+
+    def __init__(self, run_dir: Path, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.reader = RunReader(run_dir)
+        self._tests = self.reader.index()
+        self.details = functools.lru_cache(maxsize=cache_size)(self._read_details)
+        self._page: bytes | None = None
+
+    def __len__(self) -> int:
+        return len(self._tests)
+
+    def page(self) -> bytes:
+        """Return the dashboard page, built on first use."""
+        if self._page is None:
+            data = self.reader.report_data([test for _, test in self._tests])
+            self._page = build_html_report(data, shard_url=SHARD_PATH.lstrip("/")).encode()
+        return self._page
+
+    def _read_details(self, shard: int) -> list[dict[str, Any]]:
+        test_dir, test = self._tests[shard]
+        return self.reader.read_runs(test_dir, test)
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    state: RunServerState
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0]
+        if path in ("/", "/index.html"):
+            self._send(self.state.page(), "text/html; charset=utf-8")
+        elif path.startswith(SHARD_PATH):
+            shard = path[len(SHARD_PATH) :]
+            if not shard.isdigit() or int(shard) >= len(self.state):
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            body = json.dumps(self.state.details(int(shard)), default=str).encode()
+            self._send(body, "application/json")
+        else:
+            super().do_GET()
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body, compresslevel=5)
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_server(
+    run_dir: Path, host: str = "127.0.0.1", port: int = 8000, cache_size: int = DEFAULT_CACHE_SIZE
+) -> ThreadingHTTPServer:
+    """Return an HTTP server for *run_dir*, bound but not yet serving.
+
+    The test index is read here, before the first request.  Port ``0`` binds
+    a free port (see ``server.server_address``).
+    """
+    state = RunServerState(run_dir, cache_size)
+    handler = type("RunHandler", (_Handler,), {"state": state})
+    return ThreadingHTTPServer((host, port), functools.partial(handler, directory=str(run_dir)))
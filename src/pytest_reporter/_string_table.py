@@ -0,0 +1,105 @@
+"""String table for the HTML report payload.
+
+Pure module: no pytest imports, no side effects, no I/O.
+
+Log entries repeat the same level, source path and timestamp prefix, and
+failures often repeat the same ``longrepr``.  :class:`StringTable` replaces
+those values in the payload with integer references into the table, so the
+payload grows with unique content rather than with the number of entries:
+
+- entry ``level`` and ``source`` become a reference;
+- entry ``t`` (and ``last_t`` of a coalesced entry) becomes ``[ref, rest]``:
+  the timestamp up to the minute (``2026-01-01T12:34:``) is shared, the
+  seconds part stays inline;
+- phase ``longrepr`` becomes a reference.
+
+Phases are interned test by test as the shards block is written
+(``PayloadWriter.report_shards``), and the table is emitted as the block's
+last line, once every reference is known.  The report resolves references
+per phase when it is first shown.  Values of unexpected types (e.g. from a
+hand-edited retry log) are left as they are.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Length of the shared timestamp prefix: "YYYY-MM-DDTHH:MM:"
+_T_PREFIX = 17
+
+
+class StringTable:
+    """Interning table emitted as the string table trailer of the shards block."""
+
+    def __init__(self) -> None:
+        self.values: list[str | list[str]] = []
+        self._refs: dict[str | tuple[str, ...], int] = {}
+
+    def ref(self, value: str | list[str]) -> int:
+        """Return the table index for *value*, adding it on first use."""
+        key = tuple(value) if isinstance(value, list) else value
+        idx = self._refs.get(key)
+        if idx is None:
+            idx = self._refs[key] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def entry(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of a log entry with its repeated fields interned."""
+        out = dict(entry)
+        level = out.get("level")
+        if isinstance(level, str):
+            out["level"] = self.ref(level)
+        source = out.get("source")
+        if isinstance(source, list) and all(isinstance(s, str) for s in source):
+            out["source"] = self.ref(source)
+        for key in ("t", "last_t"):
+            t = out.get(key)
+            if isinstance(t, str) and len(t) > _T_PREFIX:
+                out[key] = [self.ref(t[:_T_PREFIX]), t[_T_PREFIX:]]
+        return out
+
+    def entries(self, entries: Any) -> Any:  # noqa: ANN401
+        """Return *entries* with every dict entry interned (other values unchanged)."""
+        if not isinstance(entries, list):
+            return entries
+        return [self.entry(e) if isinstance(e, dict) else e for e in entries]
+
+    def phase(self, phase: Any) -> Any:  # noqa: ANN401
+        """Return a copy of a phase dict with its longrepr and entries interned."""
+        if not isinstance(phase, dict):
+            return phase
+        out = dict(phase)
+        if isinstance(out.get("longrepr"), str):
+            out["longrepr"] = self.ref(out["longrepr"])
+        if "entries" in out:
+            out["entries"] = self.entries(out["entries"])
+        return out
+
+    def runs(self, runs: list[Any]) -> list[Any]:
+        """Return copies of a test's shard runs with every phase interned.
+
+        Covers the phases of each run and of its retry attempts.  Called per
+        test while the shards block is written, so each interned copy is
+        dropped once its line is out; the inputs are not modified.
+        """
+        out: list[Any] = []
+        for run in runs:
+            if not isinstance(run, dict):
+                out.append(run)
+                continue
+            run = self._phases(run)
+            attempts = run.get("retry_attempts")
+            if isinstance(attempts, list):
+                run["retry_attempts"] = [
+                    self._phases(a) if isinstance(a, dict) else a for a in attempts
+                ]
+            out.append(run)
+        return out
+
+    def _phases(self, holder: dict[str, Any]) -> dict[str, Any]:
+        out = dict(holder)
+        phases = out.get("phases")
+        if isinstance(phases, dict):
+            out["phases"] = {w: self.phase(p) for w, p in phases.items()}
+        return out
@@ -2,23 +2,71 @@
 
 from __future__ import annotations
 
+import os
 import shutil
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _remove(path: Path) -> None:
+    """Remove a directory tree, file, or (stale) symlink at *path* if present."""
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.is_dir():
+        shutil.rmtree(path)
+
+
+def _link_or_copy() -> Callable[[str, str], str]:
+    """Return a ``copytree`` copy function that hardlinks, copying only when it must.
+
+    Once a link fails (e.g. ``EXDEV`` across filesystems, or a filesystem
+    without hard links) every remaining file is copied without retrying the
+    link.  ``shutil.copy2`` uses the kernel's in-place copy paths where
+    available, which some filesystems serve as a reflink.
+    """
+    can_link = True
+
+    def copy(src: str, dst: str) -> str:
+        nonlocal can_link
+        if can_link:
+            try:
+                os.link(src, dst)
+            except OSError:
+                can_link = False
+            else:
+                return dst
+        return shutil.copy2(src, dst)
+
+    return copy
 
 
 def update_latest_copy(reports_dir: Path, run_dir: Path) -> None:
     """Replace ``reports_dir/01_latest/`` with a fresh copy of ``run_dir``.
 
+    The new tree is built next to the old one as ``.01_latest.tmp`` out of
+    hard links to the run's files, so the refresh costs one metadata
+    operation per file and no data is copied.  It is then renamed into place.
     The previous ``01_latest`` (whether a directory, file, or symlink left over
-    from older versions) is removed before the new copy is created.
+    from older versions) is first renamed aside and deleted only after the
+    swap, so readers never see a partially built or half-deleted tree.
+
+    Because the files are hard links, ``01_latest`` shares its content with
+    the run directory; edit neither in place.
     """
     latest = reports_dir / "01_latest"
+    staging = reports_dir / ".01_latest.tmp"
+    retired = reports_dir / ".01_latest.old"
+
+    # Leftovers from an interrupted refresh
+    _remove(staging)
+    _remove(retired)
 
-    # Clean up any previous latest entry (directory, file, or stale symlink)
-    if latest.is_symlink() or latest.is_file():
-        latest.unlink()
-    elif latest.is_dir():
-        shutil.rmtree(latest)
+    shutil.copytree(run_dir, staging, symlinks=False, copy_function=_link_or_copy())
 
-    # Copy the entire run directory (preserves nested structure and permissions)
-    shutil.copytree(run_dir, latest, symlinks=False)
+    if latest.is_symlink() or latest.exists():
+        latest.rename(retired)
+    staging.rename(latest)
+    _remove(retired)
@@ -32,6 +32,9 @@ class LogEntryDict(TypedDict, total=False):
     msg: str
     data: dict[str, Any] | None
     exc: dict[str, str] | None
+    # Only on coalesced entries: call count and timestamp of the last call
+    repeat: int
+    last_t: str
 
 
 class TableData(TypedDict, total=False):
@@ -134,6 +137,9 @@ class ParamEntry(TypedDict):
 
 
 class ParametersJson(TypedDict):
+    # Base node ID, so a run can be rebuilt without its test.log.json
+    # (which is only written at session end).
+    test_id: str
     parametrize_id: str | None
     params: dict[str, ParamEntry]
 
@@ -226,6 +232,17 @@ class RunInfo:
     display_name: str = ""  # bare method name; equals function_name for plain functions
 
 
+@dataclass(frozen=True)
+class ParamValue:
+    """A parameter value rendered by an xdist worker: its type name and ``str()``."""
+
+    type_name: str
+    text: str
+
+    def __str__(self) -> str:
+        return self.text
+
+
 @dataclass
 class PhaseData:
     """Collected data from one phase of a test run."""
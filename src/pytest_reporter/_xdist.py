@@ -0,0 +1,174 @@
+"""pytest-xdist support: worker-side capture, controller-side merge.
+
+Under ``-n N`` the tests run in worker processes the controller never sees.
+Each worker runs its own :class:`~pytest_reporter.reporter.Reporter` in the
+``"worker"`` role, joined to the controller's run directory (passed through
+``workerinput``): phase logs, tables, procedures, parameters, artifacts and
+retry attempts are written straight into ``tests/`` as in a local run.
+
+At the end of its session a worker ships a compact summary of the runs it
+executed through ``workeroutput``: run metadata, phase outcomes, timings and
+longreprs, retry data, procedure and pytest-verify check results, plus its
+session log entries and session fixture stores.  Phase log entries (the
+bulk) are not shipped; the controller reads them back from the phase logs
+the worker wrote.  The controller merges the summaries into its collector
+in collection order and then finishes the session as usual.
+
+A worker that dies before the end of its session ships nothing.  Its runs
+are missing from the report, but their files are on disk for
+``python -m pytest_reporter rebuild``.
+"""
+
+from __future__ import annotations
+
+import json
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._context import RunContext
+from ._json_writer import param_entry
+from ._report_builder import _read_json_record
+from ._types import ParamValue, PhaseData, RetryData, RunInfo
+
+if TYPE_CHECKING:
+    from pytest import Config
+
+    from .reporter import Reporter
+
+# workerinput / workeroutput key
+XDIST_KEY = "pytest_reporter"
+
+
+def is_distributed(config: Config) -> bool:
+    """Return whether this (controller) session hands its tests to xdist workers."""
+    return bool(config.pluginmanager.hasplugin("xdist")) and (
+        getattr(config.option, "dist", "no") != "no"
+    )
+
+
+def worker_input(context: RunContext) -> dict[str, str]:
+    """Return what a worker needs to join the controller's run directory."""
+    return {"reports_dir": str(context.reports_dir), "timestamp": context.timestamp}
+
+
+def worker_context(config: Config) -> RunContext | None:
+    """Return the controller's run context on an xdist worker, or ``None``."""
+    shared = getattr(config, "workerinput", {}).get(XDIST_KEY)
+    if not isinstance(shared, dict):
+        return None
+    return RunContext(Path(shared["reports_dir"]), timestamp=shared["timestamp"])
+
+
+def _run_summary(reporter: Reporter, nodeid: str, order: int) -> dict[str, Any]:
+    run_info = reporter.collector.get_run_info(nodeid)
+    retry = reporter.collector.get_retry_data(nodeid)
+    tracker = reporter._procedure_trackers.get(nodeid)
+    params = {}
+    for name, value in run_info.params.items():
+        entry = param_entry(value)
+        params[name] = [entry["type"], entry["value"]]
+    return {
+        "nodeid": nodeid,
+        "order": order,
+        "run_info": {**vars(run_info), "params": params},
+        "phases": [
+            {
+                "when": phase.when,
+                "outcome": phase.outcome,
+                "duration": phase.duration,
+                "longrepr": phase.longrepr,
+                "start_time": phase.start_time,
+                "end_time": phase.end_time,
+            }
+            for phase in reporter.collector.get_phases(nodeid).values()
+        ],
+        "retry": vars(retry) if retry else None,
+        "procedure": tracker.serialize() if tracker else None,
+        "check_results": reporter._check_results.get(nodeid, []),
+    }
+
+
+def worker_output(reporter: Reporter) -> str:
+    """Return the worker's summary for ``workeroutput`` (a JSON string).
+
+    Serialised here so values execnet cannot transfer (parameter objects,
+    arbitrary check or metadata values) arrive as their ``str()``.
+    """
+    order = {nodeid: i for i, nodeid in enumerate(reporter.collector.all_nodeids())}
+    payload = {
+        "runs": [_run_summary(reporter, nodeid, order[nodeid]) for nodeid in reporter._items],
+        "session_entries": reporter.session_logger.serialize().get("entries", []),
+        "metadata": reporter.metadata_store,
+        "dashboard": reporter.dashboard_store,
+        "seed": reporter.seed_store,
+    }
+    return json.dumps(payload, default=str)
+
+
+def receive_worker_output(reporter: Reporter, worker_id: str, output: object) -> None:
+    """Queue one worker's summary for :func:`merge_worker_outputs`."""
+    if not isinstance(output, str):
+        warnings.warn(
+            f"pytest-reporter: xdist worker {worker_id} sent no results; its tests are "
+            "missing from the report (python -m pytest_reporter rebuild can recover them)",
+            stacklevel=2,
+        )
+        return
+    reporter._worker_outputs.append(json.loads(output))
+
+
+def _phase_entries(path: Path) -> list[dict[str, Any]]:
+    try:
+        log = _read_json_record(path, None)
+    except (ValueError, OSError) as err:
+        warnings.warn(
+            f"pytest-reporter: phase log skipped (unreadable): {path}: {err}",
+            stacklevel=2,
+        )
+        return []
+    entries = log.get("entries") if isinstance(log, dict) else None
+    return entries if isinstance(entries, list) else []
+
+
+def merge_worker_outputs(reporter: Reporter) -> None:
+    """Merge the queued worker summaries into the controller's state.
+
+    Runs are registered in collection order, whichever worker ran them.
+    Controller-side fixture values win over worker ones; among workers the
+    first to finish wins.
+    """
+    outputs, reporter._worker_outputs = reporter._worker_outputs, []
+    runs = sorted((run for out in outputs for run in out["runs"]), key=lambda r: r["order"])
+    collector = reporter.collector
+    for run in runs:
+        nodeid = run["nodeid"]
+        if nodeid in collector._run_map:
+            continue
+        fields = run["run_info"]
+        params = {name: ParamValue(*entry) for name, entry in fields["params"].items()}
+        run_info = RunInfo(**{**fields, "params": params})
+        collector.add_run(nodeid, run_info)
+        run_dir = reporter.context.run_subdir(
+            run_info.file_path, run_info.function_name, run_info.run_id
+        )
+        for phase in run["phases"]:
+            entries = _phase_entries(run_dir / f"{phase['when']}.log.json")
+            collector.set_phase(nodeid, PhaseData(**phase, entries=entries))
+        if run["retry"]:
+            collector.set_retry_data(nodeid, RetryData(**run["retry"]))
+        if run["procedure"] is not None:
+            reporter._procedures[nodeid] = run["procedure"]
+        if run["check_results"]:
+            reporter._check_results[nodeid] = run["check_results"]
+
+    for out in outputs:
+        reporter._worker_session_entries.extend(out["session_entries"])
+        for section, values in out["metadata"].items():
+            store = reporter.metadata_store.setdefault(section, {})
+            for label, value in values.items():
+                store.setdefault(label, value)
+        if not reporter.dashboard_store:
+            reporter.dashboard_store.extend(out["dashboard"])
+        for key, value in out["seed"].items():
+            reporter.seed_store.setdefault(key, value)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import argparse
+import warnings
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -9,7 +11,8 @@ import pytest
 
 from . import _hookspecs
 from ._context import RunContext
-from ._logger import Logger
+from ._logger import LogFilter, Logger, parse_level_spec
+from ._xdist import is_distributed, worker_context
 from .reporter import Reporter
 
 if TYPE_CHECKING:
@@ -21,6 +24,23 @@ def pytest_addhooks(pluginmanager: pytest.PytestPluginManager) -> None:
     pluginmanager.add_hookspecs(_hookspecs.ReporterSpec)
 
 
+def _log_level_spec(spec: str) -> tuple[str | None, str]:
+    try:
+        return parse_level_spec(spec)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(str(err)) from None
+
+
+def _non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an integer: {value!r}") from None
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
 def pytest_addoption(parser: Parser) -> None:
     group = parser.getgroup("reporter", "Reporter options")
     group.addoption(
@@ -36,19 +56,116 @@ def pytest_addoption(parser: Parser) -> None:
         default=0,
         help="Maximum retry attempts per failed test (default: 0, disabled)",
     )
+    group.addoption(
+        "--report-artifacts",
+        dest="report_artifacts",
+        choices=("embed", "link"),
+        default="embed",
+        help="How report.html includes artifacts: 'embed' as data URIs (default, "
+        "self-contained) or 'link' as relative paths into tests/.../artifacts/",
+    )
+    group.addoption(
+        "--report-async-writes",
+        dest="report_async_writes",
+        action="store_true",
+        default=False,
+        help="Write per-test report files on a background thread so tests never "
+        "block on report I/O (useful on slow or network filesystems)",
+    )
+    group.addoption(
+        "--report-compress",
+        dest="report_compress",
+        action="store_true",
+        default=False,
+        help="Deflate the data embedded in report.html (inflated by the browser when "
+        "opened); makes archived reports several times smaller",
+    )
+    group.addoption(
+        "--report-layout",
+        dest="report_layout",
+        choices=("tree", "journal"),
+        default="tree",
+        help="Per-test record storage: 'tree' of JSON files under tests/ (default) "
+        "or 'journal', a single append-only run.jsonl plus offset index",
+    )
+    group.addoption(
+        "--report-log-level",
+        dest="report_log_level",
+        action="append",
+        type=_log_level_spec,
+        default=[],
+        metavar="[PATTERN=]LEVEL",
+        help="Minimum level of the log entries recorded (default: DEBUG). Repeat with "
+        "PATTERN=LEVEL to override it for child loggers by dotted source, e.g. "
+        "--report-log-level=INFO --report-log-level='psu.*=WARNING' (last match wins)",
+    )
+    group.addoption(
+        "--report-log-retention",
+        dest="report_log_retention",
+        choices=("all", "failed"),
+        default="all",
+        help="Which runs keep their DEBUG/INFO log entries: 'all' (default) or "
+        "'failed', only runs with a failed phase (including retried runs); "
+        "passing runs keep WARNING and above",
+    )
+    group.addoption(
+        "--report-log-max-entries",
+        dest="report_log_max_entries",
+        type=_non_negative_int,
+        default=0,
+        metavar="N",
+        help="Cap on the entries of each phase log (and of the session log): the "
+        "first N/2 and last N/2 are kept, the rest are counted per level in one "
+        "overflow entry (default: 0, no cap)",
+    )
 
 
 def pytest_configure(config: Config) -> None:
     report_dir: str | None = config.getoption("--report-dir", default=None)
     if report_dir:
-        # Only register on the controller, not xdist workers
-        if not hasattr(config, "workerinput"):
-            max_retries: int = config.getoption("--report-retries", default=0)
+        context: RunContext | None
+        if hasattr(config, "workerinput"):
+            # xdist worker: join the run directory the controller passed down
+            role = "worker"
+            context = worker_context(config)
+            if context is None:
+                return
+        else:
+            role = "controller" if is_distributed(config) else "local"
             context = RunContext(Path(report_dir))
-            config.pluginmanager.register(
-                Reporter(config, context, max_retries=max_retries),
-                "pytest_reporter",
-            )
+        max_retries: int = config.getoption("--report-retries", default=0)
+        artifact_mode: str = config.getoption("--report-artifacts", default="embed")
+        async_writes: bool = config.getoption("--report-async-writes", default=False)
+        layout: str = config.getoption("--report-layout", default="tree")
+        compress: bool = config.getoption("--report-compress", default=False)
+        log_filter = LogFilter.from_specs(config.getoption("--report-log-level", default=[]))
+        log_retention: str = config.getoption("--report-log-retention", default="all")
+        log_max_entries: int = config.getoption("--report-log-max-entries", default=0)
+        if layout == "journal" and role != "local":
+            # One run.jsonl cannot take appends from several processes.
+            if role == "controller":
+                warnings.warn(
+                    "pytest-reporter: --report-layout=journal is not supported with "
+                    "pytest-xdist; using the tree layout",
+                    stacklevel=2,
+                )
+            layout = "tree"
+        config.pluginmanager.register(
+            Reporter(
+                config,
+                context,
+                max_retries=max_retries,
+                artifact_mode=artifact_mode,
+                async_writes=async_writes,
+                layout=layout,
+                compress=compress,
+                role=role,
+                log_filter=log_filter,
+                log_retention=log_retention,
+                log_max_entries=log_max_entries,
+            ),
+            "pytest_reporter",
+        )
 
 
 @pytest.fixture
@@ -67,7 +184,7 @@ def log(request: pytest.FixtureRequest) -> Logger:
     item = request.node
     logger = getattr(item, "_reporter_logger", None)
     if logger is None:
-        logger = Logger()
+        logger = reporter.new_logger()
         item._reporter_logger = logger  # dynamic attribute on pytest.Item
     return logger
 
@@ -14,15 +14,29 @@ from ._collector import DataCollector
 from ._console_capture import TeeFile, finalize_capture, install_capture
 from ._context import RunContext
 from ._html_builder._degraded import build_degraded_report
-from ._json_writer import write_session_log_json, write_test_log_json
+from ._journal import RunJournal
+from ._json_writer import (
+    BackgroundWriter,
+    _set_journal,
+    _set_writer,
+    write_session_log_json,
+    write_test_log_json,
+)
 from ._junit_writer import write_junit_xml
-from ._logger import Logger
+from ._logger import LogFilter, Logger
 from ._phase_capture import capture_phase_logs, write_run_finish_files
 from ._procedure import ProcedureTracker, _set_tracker
 from ._report_builder import build_html_data
 from ._retry import run_with_retries
 from ._safety import guard, guard_void
 from ._symlinks import update_latest_copy
+from ._xdist import (
+    XDIST_KEY,
+    merge_worker_outputs,
+    receive_worker_output,
+    worker_input,
+    worker_output,
+)
 
 try:
     from pytest_verify import get_check_results
@@ -69,18 +83,60 @@ if TYPE_CHECKING:
 class Reporter:
     """Orchestrates data collection and report generation."""
 
-    def __init__(self, config: Config, context: RunContext, *, max_retries: int = 0) -> None:
+    def __init__(
+        self,
+        config: Config,
+        context: RunContext,
+        *,
+        max_retries: int = 0,
+        artifact_mode: str = "embed",
+        async_writes: bool = False,
+        layout: str = "tree",
+        compress: bool = False,
+        role: str = "local",
+        log_filter: LogFilter | None = None,
+        log_retention: str = "all",
+        log_max_entries: int = 0,
+    ) -> None:
         self.config = config
         self.context = context
         self.collector = DataCollector()
-        self.session_logger = Logger()
+        # Minimum level per logger source (--report-log-level)
+        self.log_filter = log_filter
+        # Entry cap per logger between resets (--report-log-max-entries, 0 = none)
+        self.log_max_entries = log_max_entries
+        # "all", or "failed": DEBUG/INFO entries are kept only for runs with a
+        # failed phase (phase logs are then written when the run finishes)
+        self.log_retention = log_retention
+        # Phases whose log is written at run finish: nodeid -> [when, ...]
+        self._deferred_phases: dict[str, list[str]] = {}
+        self.session_logger = self.new_logger()
         self.max_retries = max_retries
+        # "embed" (self-contained data URIs) or "link" (relative file references)
+        self.artifact_mode = artifact_mode
+        self.async_writes = async_writes
+        # Background writer for per-test files, live between sessionstart and
+        # the HTML build when async_writes is enabled
+        self._writer: BackgroundWriter | None = None
+        # "tree" (one file per record under tests/) or "journal" (run.jsonl)
+        self.layout = layout
+        self._journal: RunJournal | None = None
+        # Deflate the report.html payload (inflated by the browser on open)
+        self.compress = compress
+        # "local", or under pytest-xdist "controller" (merges what the workers
+        # ship, writes the session files) / "worker" (runs and captures tests)
+        self.role = role
+        # Worker summaries received by the controller, merged at session end
+        self._worker_outputs: list[dict[str, Any]] = []
+        self._worker_session_entries: list[dict[str, Any]] = []
         self._tee: TeeFile | None = None
         self._start_time: float = 0.0
         self._session_start_iso: str = ""
         self._finished_runs: set[str] = set()
         # Per-test procedure trackers: nodeid -> ProcedureTracker
         self._procedure_trackers: dict[str, ProcedureTracker] = {}
+        # Procedures shipped by xdist workers: nodeid -> serialized procedure
+        self._procedures: dict[str, dict[str, Any]] = {}
         # Per-test loggers: nodeid -> Logger
         self._test_loggers: dict[str, Logger] = {}
         # Current retry write paths: nodeid -> Path (for retry subfolder)
@@ -97,6 +153,10 @@ class Reporter:
         # Set report_seed["value"] = <int|str> to override auto-detected seed.
         self.seed_store: dict[str, object] = {}
 
+    def new_logger(self) -> Logger:
+        """Return a fresh root logger with the session's level filter and entry cap."""
+        return Logger(log_filter=self.log_filter, max_entries=self.log_max_entries)
+
     def get_current_run_dir(self, nodeid: str) -> Path | None:
         """Get the current write directory for a test (retry-aware)."""
         return self._retry_paths.get(nodeid)
@@ -109,6 +169,15 @@ class Reporter:
         run_info = self.collector.get_run_info(nodeid)
         return self.context.run_subdir(run_info.file_path, run_info.function_name, run_info.run_id)
 
+    def session_entries(self) -> list[dict[str, Any]]:
+        """Return the session log entries, with those of xdist workers in time order."""
+        entries: list[dict[str, Any]] = self.session_logger.serialize().get("entries", [])
+        if self._worker_session_entries:
+            entries = sorted(
+                [*entries, *self._worker_session_entries], key=lambda e: str(e.get("t", ""))
+            )
+        return entries
+
     # ------------------------------------------------------------------
     # Hook shells — thin wrappers that delegate to _do_* via guard/guard_void
     # ------------------------------------------------------------------
@@ -163,6 +232,26 @@ class Reporter:
         """Hook shell: crash-safe wrapper around _do_sessionfinish."""
         guard_void("pytest_sessionfinish", lambda: self._do_sessionfinish(session, exitstatus))
 
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node: Any) -> None:  # noqa: ANN401
+        """Hook shell (xdist controller): point a new worker at this run directory."""
+        guard_void(
+            "pytest_configure_node",
+            lambda: node.workerinput.__setitem__(XDIST_KEY, worker_input(self.context)),
+        )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: object) -> None:  # noqa: ANN401
+        """Hook shell (xdist controller): queue the summary a finished worker shipped."""
+        guard_void(
+            "pytest_testnodedown",
+            lambda: receive_worker_output(
+                self,
+                str(node.gateway.id),
+                getattr(node, "workeroutput", {}).get(XDIST_KEY),
+            ),
+        )
+
     def pytest_terminal_summary(
         self,
         terminalreporter: pytest.TerminalReporter,
@@ -184,12 +273,21 @@ class Reporter:
         self._start_time = time.time()
         self._session_start_iso = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         self.context.ensure_dirs()
-        self._tee = install_capture(self.config)
+        # Under xdist the controller owns the console log and session warnings.
+        worker = self.role == "worker"
+        if not worker:
+            self._tee = install_capture(self.config)
+        if self.async_writes:
+            self._writer = BackgroundWriter()
+            _set_writer(self._writer)
+        if self.layout == "journal":
+            self._journal = RunJournal(self.context.run_dir)
+            _set_journal(self._journal)
 
         # Surface the silent-loss case: pytest-verify present but too old to
         # expose get_check_results, so verification cards would never appear.
         msg = _verify_outdated_warning(get_check_results, verify_installed=_VERIFY_INSTALLED)
-        if msg is not None:
+        if msg is not None and not worker:
             warnings.warn(f"pytest-reporter: {msg}", stacklevel=2)
 
     def _do_collection_modifyitems(
@@ -211,7 +309,7 @@ class Reporter:
         self._items[nodeid] = item
 
         # Create fresh logger
-        logger = Logger()
+        logger = self.new_logger()
         self._test_loggers[nodeid] = logger
         item._reporter_logger = logger  # type: ignore[attr-defined]
 
@@ -249,45 +347,63 @@ class Reporter:
         and still refreshes 01_latest/. The outer guard (in the hook shell) acts as
         the last-resort net for any exception OUTSIDE this inner block.
         """
+        if self.role == "worker":
+            # Everything must be on disk before the controller reads it back.
+            self._close_writer()
+            self._close_journal()
+            self.config.workeroutput[XDIST_KEY] = worker_output(self)  # type: ignore[attr-defined]
+            return
+        if self.role == "controller":
+            merge_worker_outputs(self)
+
         duration = time.time() - self._start_time
         session_end_iso = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
-        # Write test.log.json aggregates
-        for base_nodeid in self.collector.get_all_base_nodeids():
-            aggregate = self.collector.get_function_aggregate(base_nodeid)
-            func_dir = self.context.test_function_dir(aggregate["file"], aggregate["function_name"])
-            write_test_log_json(func_dir / "test.log.json", aggregate)
-
-        # Write JUnit XML
-        write_junit_xml(
-            self.context.run_dir / "junit.xml",
-            self.collector,
-            duration,
-            retries_enabled=self.max_retries > 0,
-        )
+        try:
+            # Write test.log.json aggregates
+            for base_nodeid in self.collector.get_all_base_nodeids():
+                aggregate = self.collector.get_function_aggregate(base_nodeid)
+                func_dir = self.context.test_function_dir(
+                    aggregate["file"], aggregate["function_name"]
+                )
+                write_test_log_json(func_dir / "test.log.json", aggregate)
+
+            # Write JUnit XML
+            write_junit_xml(
+                self.context.run_dir / "junit.xml",
+                self.collector,
+                duration,
+                retries_enabled=self.max_retries > 0,
+            )
 
-        # Write session.log.json
-        session_entries = self.session_logger.serialize().get("entries", [])
-        write_session_log_json(
-            self.context.run_dir / "session.log.json",
-            self._session_start_iso,
-            session_end_iso,
-            duration,
-            session_entries,
-        )
+            # Write session.log.json
+            session_entries = self.session_entries()
+            write_session_log_json(
+                self.context.run_dir / "session.log.json",
+                self._session_start_iso,
+                session_end_iso,
+                duration,
+                session_entries,
+            )
 
-        # Finalize console capture
-        finalize_capture(self._tee, self.context.run_dir / "pytest.log")
+            # Finalize console capture
+            finalize_capture(self._tee, self.context.run_dir / "pytest.log")
+        finally:
+            # Everything below reads the run directory back from disk, so all
+            # queued background writes and journal records must have landed first.
+            self._close_writer()
+            self._close_journal()
 
         # Write HTML report — guarded so sessionfinish never raises (REQ-1).
         # Any exception in the build pipeline is caught, warned, and replaced
         # with a minimal degraded report.  01_latest/ is refreshed regardless.
-        from ._html_builder import build_html_report
+        from ._html_builder import write_html_report
 
         try:
             html_data = build_html_data(self, duration, exitstatus)
-            html = build_html_report(html_data)
-            (self.context.run_dir / "report.html").write_text(html, encoding="utf-8")
+            write_html_report(
+                self.context.run_dir / "report.html", html_data, compress=self.compress
+            )
         except Exception as exc:  # noqa: BLE001
             warnings.warn(
                 f"pytest-reporter: HTML report build failed, writing degraded report: {exc}",
@@ -300,6 +416,20 @@ class Reporter:
         # guarded write block above so it fires even when the build failed.
         update_latest_copy(self.context.reports_dir, self.context.run_dir)
 
+    def _close_writer(self) -> None:
+        """Drain and stop the background writer, reverting to synchronous writes."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            _set_writer(None)
+            writer.close()
+
+    def _close_journal(self) -> None:
+        """Flush the run journal and write its offset index."""
+        journal, self._journal = self._journal, None
+        if journal is not None:
+            _set_journal(None)
+            journal.close()
+
     def _do_terminal_summary(
         self,
         terminalreporter: pytest.TerminalReporter,
@@ -307,6 +437,8 @@ class Reporter:
         config: Config,  # noqa: ARG002
     ) -> None:
         """Real body of pytest_terminal_summary."""
+        if self.role == "worker":
+            return
         terminalreporter.write_sep("=", "Report")
         terminalreporter.write_line(f"  HTML:  {self.context.run_dir / 'report.html'}")
         terminalreporter.write_line(f"  JUnit: {self.context.run_dir / 'junit.xml'}")
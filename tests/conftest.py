@@ -1 +1,43 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
 pytest_plugins = ["pytester"]
+
+_REPORT_DOM = Path(__file__).with_name("report_dom.js")
+
+
+@pytest.fixture
+def report_js(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str, str], Any]:
+    """Run a report page's script under node and evaluate a probe against it.
+
+    ``report_js(html, probe)`` initialises the report in a minimal DOM
+    (tests/report_dom.js), evaluates the JS expression *probe* in the app's
+    scope and returns its JSON-decoded value.  Skips when node is missing.
+    """
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+    work = tmp_path_factory.mktemp("report_js")
+
+    def run(html: str, probe: str) -> Any:  # noqa: ANN401
+        (work / "report.html").write_text(html, encoding="utf-8")
+        (work / "probe.js").write_text(probe, encoding="utf-8")
+        proc = subprocess.run(
+            [node, str(_REPORT_DOM), str(work / "report.html"), str(work / "probe.js")],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if proc.returncode:
+            pytest.fail(f"report script failed:\n{proc.stderr}")
+        return json.loads(proc.stdout)
+
+    return run
@@ -0,0 +1,210 @@
+// Runs a report's app script under node against a minimal DOM, then evaluates
+// a probe expression in the same scope and prints its JSON value.  Used by the
+// `report_js` fixture (conftest.py):
+//
+//     node report_dom.js report.html probe.js
+//
+// Only the DOM surface the app touches is modelled.  Elements the static page
+// markup provides (#tab-tests, .header, ...) are created on first lookup while
+// the app initialises; afterwards lookups only see what the app rendered.
+// A compressed report is started by its own loader script (INFLATE_JS).  A
+// probe may evaluate to a promise; its resolved value is printed.
+const fs = require('fs');
+const vm = require('vm');
+
+function matches(node, sel) {
+  const m = /^([a-z0-9-]*)((?:[.#][\w-]+)*)((?:\[[^\]]+\])*)$/i.exec(sel.trim());
+  if (!m) return false;
+  if (m[1] && node.tagName !== m[1].toUpperCase()) return false;
+  for (const part of m[2].match(/[.#][\w-]+/g) || []) {
+    if (part[0] === '.' && !node.classList.contains(part.slice(1))) return false;
+    if (part[0] === '#' && node.id !== part.slice(1)) return false;
+  }
+  for (const attr of m[3].match(/\[[^\]]+\]/g) || []) {
+    const [, name, value] = /^\[([\w-]+)(?:="?([^"\]]*)"?)?\]$/.exec(attr);
+    const actual = node.getAttribute(name);
+    if (actual === null || (value !== undefined && actual !== value)) return false;
+  }
+  return true;
+}
+
+class ClassList {
+  constructor(node) { this.node = node; }
+  _get() { return this.node.className.split(/\s+/).filter(Boolean); }
+  contains(c) { return this._get().includes(c); }
+  add(...cs) { const s = new Set(this._get()); cs.forEach(c => s.add(c)); this.node.className = [...s].join(' '); }
+  remove(...cs) { this.node.className = this._get().filter(c => !cs.includes(c)).join(' '); }
+  toggle(c, force) {
+    const on = force === undefined ? !this.contains(c) : force;
+    on ? this.add(c) : this.remove(c);
+    return on;
+  }
+}
+
+class Node {
+  constructor(tag) {
+    this.tagName = tag.toUpperCase();
+    this.children = [];
+    this.parentNode = null;
+    this.className = '';
+    this.id = '';
+    this.style = {};
+    this.dataset = {};
+    this.attrs = {};
+    this.listeners = {};
+    this._text = '';
+    this.innerHTML = '';
+    this.classList = new ClassList(this);
+    this.scrollTop = 0;
+    this.clientHeight = 0;
+    this.value = '';
+  }
+  get textContent() { return this._text + this.children.map(c => c.textContent).join(''); }
+  set textContent(v) { this.children = []; this._text = String(v); }
+  get firstChild() { return this.children[0] || null; }
+  get lastChild() { return this.children[this.children.length - 1] || null; }
+  get childNodes() { return this.children; }
+  get firstElementChild() { return this.firstChild; }
+  get nextSibling() {
+    const sib = this.parentNode ? this.parentNode.children : [];
+    return sib[sib.indexOf(this) + 1] || null;
+  }
+  setAttribute(k, v) {
+    v = String(v);
+    if (k === 'class') this.className = v;
+    else if (k === 'id') this.id = v;
+    else this.attrs[k] = v;
+    if (k.startsWith('data-')) this.dataset[k.slice(5).replace(/-(\w)/g, (_, c) => c.toUpperCase())] = v;
+  }
+  getAttribute(k) {
+    if (k === 'class') return this.className;
+    if (k === 'id') return this.id || null;
+    return k in this.attrs ? this.attrs[k] : null;
+  }
+  hasAttribute(k) { return this.getAttribute(k) !== null; }
+  removeAttribute(k) { delete this.attrs[k]; }
+  _adopt(c) {
+    if (typeof c === 'string') { const t = new Node('#text'); t._text = c; c = t; }
+    if (c.parentNode) c.remove();
+    c.parentNode = this;
+    return c;
+  }
+  appendChild(c) { c = this._adopt(c); this.children.push(c); return c; }
+  append(...cs) { cs.forEach(c => this.appendChild(c)); }
+  prepend(...cs) { cs.reverse().forEach(c => this.insertBefore(c, this.firstChild)); }
+  insertBefore(c, ref) {
+    c = this._adopt(c);
+    const i = ref ? this.children.indexOf(ref) : -1;
+    if (i < 0) this.children.push(c); else this.children.splice(i, 0, c);
+    return c;
+  }
+  replaceChildren(...cs) { this.children.forEach(c => { c.parentNode = null; }); this.children = []; this._text = ''; this.append(...cs); }
+  replaceWith(c) { const p = this.parentNode; if (p) { p.insertBefore(c, this); this.remove(); } }
+  removeChild(c) { c.remove(); return c; }
+  remove() {
+    if (!this.parentNode) return;
+    const sib = this.parentNode.children;
+    sib.splice(sib.indexOf(this), 1);
+    this.parentNode = null;
+  }
+  contains(n) { for (; n; n = n.parentNode) if (n === this) return true; return false; }
+  closest(sel) { for (let n = this; n; n = n.parentNode) if (n.tagName && matches(n, sel)) return n; return null; }
+  querySelectorAll(sel) {
+    const out = [];
+    const parts = sel.split(',');
+    (function walk(n) {
+      n.children.forEach(c => { if (parts.some(p => matches(c, p.trim().split(/\s+/).pop()))) out.push(c); walk(c); });
+    })(this);
+    return out;
+  }
+  querySelector(sel) { return this.querySelectorAll(sel)[0] || null; }
+  addEventListener(type, fn) { (this.listeners[type] = this.listeners[type] || []).push(fn); }
+  removeEventListener() {}
+  dispatch(type, extra) {
+    const ev = Object.assign({type, target: this, preventDefault() {}, stopPropagation() {}}, extra);
+    (this.listeners[type] || []).forEach(fn => fn(ev));
+  }
+  click() { this.dispatch('click'); }
+  focus() {}
+  blur() {}
+  scrollIntoView() {}
+  getBoundingClientRect() { return {top: 0, left: 0, width: 0, height: 0, bottom: 0, right: 0}; }
+}
+
+function runReport(html) {
+  const blocks = {};
+  let app = null;
+  let loader = null;
+  for (const m of html.matchAll(/<script([^>]*)>([\s\S]*?)<\/script>/g)) {
+    const id = /id="([^"]+)"/.exec(m[1]);
+    if (id) blocks[id[1]] = m[2];
+    if (/type="application\/json"/.test(m[1])) continue;
+    if (m[2].includes('const DATA')) app = m[2];
+    else if (m[2].includes('DecompressionStream')) loader = m[2];
+  }
+  const body = new Node('body');
+  let context;
+  let appStarted;
+  const appReady = new Promise(resolve => { appStarted = resolve; });
+  // Scripts the loader appends are run, as a browser would.
+  const appendChild = body.appendChild.bind(body);
+  body.appendChild = c => {
+    appendChild(c);
+    if (c.tagName === 'SCRIPT') {
+      vm.runInContext(c.textContent, context, {filename: 'report.js'});
+      started = true;
+      appStarted();
+    }
+    return c;
+  };
+  const byId = {};
+  let started = false;
+  const document = {
+    body,
+    documentElement: new Node('html'),
+    createElement: tag => new Node(tag),
+    createElementNS: (_, tag) => new Node(tag),
+    createTextNode: text => { const t = new Node('#text'); t._text = String(text); return t; },
+    getElementById(id) {
+      if (id in blocks) { const b = new Node('script'); b._text = blocks[id]; return b; }
+      const found = body.querySelector('#' + id);
+      if (found || started) return found;
+      if (!byId[id]) { byId[id] = new Node('div'); byId[id].id = id; body.appendChild(byId[id]); }
+      return byId[id];
+    },
+    querySelector(sel) {
+      const found = body.querySelector(sel);
+      if (found || started || !/^\.[\w-]+$/.test(sel)) return found;
+      const n = new Node('div'); n.className = sel.slice(1); body.appendChild(n); return n;
+    },
+    querySelectorAll: sel => body.querySelectorAll(sel),
+    addEventListener() {},
+  };
+  const window = {addEventListener() {}, location: {hash: '', search: ''}, matchMedia: () => ({matches: false, addEventListener() {}})};
+  context = vm.createContext({
+    window, document, console, performance, setTimeout, clearTimeout,
+    atob, Blob, Response, DecompressionStream,
+    requestAnimationFrame: fn => setTimeout(fn, 0), cancelAnimationFrame: clearTimeout,
+    localStorage: {getItem: () => null, setItem() {}},
+    navigator: {clipboard: {writeText: async () => {}}},
+    getComputedStyle: () => ({getPropertyValue: () => ''}),
+  });
+  context.window = Object.assign(context.window, {document});
+  if (loader) {
+    vm.runInContext(loader, context, {filename: 'loader.js'});
+  } else {
+    const script = document.createElement('script');
+    script.textContent = app;
+    body.appendChild(script);
+  }
+  return appReady.then(() => context);
+}
+
+if (require.main === module) {
+  (async () => {
+    const html = fs.readFileSync(process.argv[2], 'utf8');
+    const context = await runReport(html);
+    const result = await vm.runInContext(fs.readFileSync(process.argv[3], 'utf8'), context, {filename: 'probe.js'});
+    process.stdout.write(JSON.stringify(result === undefined ? null : result));
+  })().catch(e => { console.error(e); process.exit(1); });
+}
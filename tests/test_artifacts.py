@@ -0,0 +1,94 @@
+"""Unit tests for content-addressed artifact deduplication."""
+
+from __future__ import annotations
+
+import urllib.parse
+from typing import TYPE_CHECKING
+
+from pytest_reporter._artifacts import ArtifactStore, EmbeddedFile, content_digest
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._report_builder import collect_artifacts
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+
+def _artifacts_dir(base: Path, name: str, files: dict[str, bytes]) -> Path:
+    d = base / name / "artifacts"
+    d.mkdir(parents=True)
+    for fname, content in files.items():
+        (d / fname).write_bytes(content)
+    return d
+
+
+def test_digest_matches_for_equal_content(tmp_path: Path) -> None:
+    (tmp_path / "a").write_bytes(b"same")
+    (tmp_path / "b").write_bytes(b"same")
+    (tmp_path / "c").write_bytes(b"")
+    assert content_digest(tmp_path / "a") == content_digest(tmp_path / "b")
+    assert content_digest(tmp_path / "c") != content_digest(tmp_path / "a")
+
+
+def test_identical_artifacts_share_one_blob(tmp_path: Path) -> None:
+    store = ArtifactStore()
+    lists = []
+    for run in ("01", "02"):
+        files = {"ref.png": b"\x89PNG-ref", f"own{run}.png": run.encode()}
+        d = _artifacts_dir(tmp_path, run, files)
+        entries = collect_artifacts(d)
+        store.intern(d, entries)
+        lists.append(entries)
+
+    blobs = [{e["name"]: e["blob"] for e in entries} for entries in lists]
+    assert blobs[0]["ref.png"] == blobs[1]["ref.png"]
+    assert blobs[0]["own01.png"] != blobs[1]["own02.png"]
+    assert len(store.blobs) == 3
+    assert all("data_uri" not in e for entries in lists for e in entries)
+    assert isinstance(store.blobs[blobs[0]["ref.png"]], EmbeddedFile)
+
+
+def test_duplicates_on_disk_become_hard_links(tmp_path: Path) -> None:
+    store = ArtifactStore()
+    for run in ("01", "02"):
+        d = _artifacts_dir(tmp_path, run, {"data.csv": b"a,b\n1,2\n", "x.csv": run.encode()})
+        store.intern(d, collect_artifacts(d))
+
+    first, second = tmp_path / "01/artifacts/data.csv", tmp_path / "02/artifacts/data.csv"
+    assert first.stat().st_ino == second.stat().st_ino
+    assert second.read_bytes() == b"a,b\n1,2\n"
+    assert (tmp_path / "01/artifacts/x.csv").stat().st_ino != (
+        tmp_path / "02/artifacts/x.csv"
+    ).stat().st_ino
+    assert sorted(p.name for p in (tmp_path / "02/artifacts").iterdir()) == ["data.csv", "x.csv"]
+
+
+def test_same_bytes_with_different_mime_get_distinct_blobs(tmp_path: Path) -> None:
+    d = _artifacts_dir(tmp_path, "01", {"a.png": b"<svg/>", "a.svg": b"<svg/>"})
+    store = ArtifactStore()
+    entries = collect_artifacts(d)
+    store.intern(d, entries)
+    assert entries[0]["blob"] != entries[1]["blob"]
+    assert {f.mime for f in store.blobs.values()} == {"image/png", "image/svg+xml"}
+
+
+def test_link_mode_references_artifacts_by_relative_path(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        def test_shot(report_artifacts):
+            (report_artifacts / "my shot.png").write_bytes(b"\\x89PNG" + b"X" * 64)
+            (report_artifacts / "data.csv").write_text("a,b")
+    """)
+    result = pytester.runpytest("--report-dir=reports", "--report-artifacts=link")
+    result.assert_outcomes(passed=1)
+
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    assert "data:image/png" not in html
+    artifacts = read_html_report(html)["tests"][0]["runs"][0]["artifacts"]
+    assert [a["name"] for a in artifacts] == ["data.csv", "my shot.png"]
+    for a in artifacts:
+        assert "data_uri" not in a and "blob" not in a
+        assert a["href"].startswith("tests/")
+        assert (run_dir / urllib.parse.unquote(a["href"])).is_file()
+    assert "my%20shot.png" in artifacts[1]["href"]
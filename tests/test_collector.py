@@ -0,0 +1,87 @@
+"""Unit tests for DataCollector's incremental outcome/duration accounting."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from pytest_reporter._collector import DataCollector
+from pytest_reporter._types import RetryData
+
+
+def _item(nodeid: str, params: dict[str, Any] | None = None) -> Any:  # noqa: ANN401
+    """Build a minimal stand-in for a collected pytest.Item."""
+    item = SimpleNamespace(nodeid=nodeid, iter_markers=lambda: [], function=None)
+    if params is not None:
+        item.callspec = SimpleNamespace(id="-".join(map(str, params.values())), params=params)
+    return item
+
+
+def _report(nodeid: str, when: str, outcome: str, duration: float = 0.5) -> Any:  # noqa: ANN401
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, outcome=outcome, duration=duration, longrepr=None
+    )
+
+
+def _collector(*nodeids: str) -> DataCollector:
+    collector = DataCollector()
+    items = [_item(n, {"x": i}) if "[" in n else _item(n) for i, n in enumerate(nodeids)]
+    collector.register_items(items)
+    return collector
+
+
+def test_unrun_tests_count_as_skipped() -> None:
+    collector = _collector("t.py::test_a")
+    assert collector.get_outcome("t.py::test_a") == "skipped"
+    assert collector.get_duration("t.py::test_a") == 0.0
+    agg = collector.get_function_aggregate("t.py::test_a")
+    assert (agg["passed"], agg["skipped"]) == (0, 1)
+
+
+def test_counters_follow_recorded_phases() -> None:
+    collector = _collector("t.py::test_p[1]", "t.py::test_p[2]")
+    for nid, outcome in (("t.py::test_p[1]", "passed"), ("t.py::test_p[2]", "failed")):
+        collector.record_phase(_report(nid, "setup", "passed", 0.25))
+        collector.record_phase(_report(nid, "call", outcome, 1.0))
+        collector.record_phase(_report(nid, "teardown", "passed", 0.25))
+
+    assert collector.get_outcome("t.py::test_p[2]") == "failed"
+    assert collector.get_duration("t.py::test_p[1]") == 1.5
+    agg = collector.get_function_aggregate("t.py::test_p")
+    assert (agg["passed"], agg["failed"], agg["skipped"], agg["errors"]) == (1, 1, 0, 0)
+    assert agg["total_duration_seconds"] == 3.0
+    assert [r["outcome"] for r in agg["runs"]] == ["passed", "failed"]
+
+
+def test_setup_failure_counts_as_error() -> None:
+    collector = _collector("t.py::test_e")
+    collector.record_phase(_report("t.py::test_e", "setup", "failed"))
+    agg = collector.get_function_aggregate("t.py::test_e")
+    assert (agg["errors"], agg["skipped"]) == (1, 0)
+
+
+def test_aggregate_is_cached_until_a_run_changes() -> None:
+    collector = _collector("t.py::test_a")
+    first = collector.get_function_aggregate("t.py::test_a")
+    assert collector.get_function_aggregate("t.py::test_a") is first
+
+    collector.record_phase(_report("t.py::test_a", "call", "failed"))
+    second = collector.get_function_aggregate("t.py::test_a")
+    assert second is not first
+    assert second["failed"] == 1
+
+
+def test_retry_data_moves_outcome_between_counters() -> None:
+    collector = _collector("t.py::test_flaky")
+    collector.record_phase(_report("t.py::test_flaky", "call", "failed"))
+    assert collector.get_function_aggregate("t.py::test_flaky")["failed"] == 1
+
+    collector.set_retry_data(
+        "t.py::test_flaky",
+        RetryData(
+            max_retries=2, attempts=1, original_outcome="failed", history=["failed", "passed"]
+        ),
+    )
+    agg = collector.get_function_aggregate("t.py::test_flaky")
+    assert (agg["passed"], agg["failed"]) == (1, 0)
+    assert agg["runs"][0]["retries"]["history"] == ["failed", "passed"]
@@ -21,8 +21,8 @@ if TYPE_CHECKING:
 
 def _extract_report_data(html: str) -> dict:  # type: ignore[type-arg]
     """Extract the embedded DATA dict from report.html."""
-    match = re.search(r"const DATA = (\{.*?\});\s*\n", html, re.DOTALL)
-    assert match, "Could not find 'const DATA = ...' in report.html"
+    match = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert match, "Could not find the report-data JSON block in report.html"
     raw = match.group(1).replace("<\\/", "</")
     return json.loads(raw)  # type: ignore[no-any-return]
 
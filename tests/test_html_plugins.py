@@ -39,8 +39,8 @@ def _report_html(pytester: Pytester) -> str:
 
 def _extract_data(html: str) -> dict:  # type: ignore[type-arg]
     """Extract the embedded DATA JSON from report.html."""
-    m = re.search(r"const DATA\s*=\s*(\{.*?\});\s*\n", html, re.DOTALL)
-    assert m, "Could not find 'const DATA = {...}' in report.html"
+    m = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert m, "Could not find the report-data JSON block in report.html"
     return json.loads(m.group(1))
 
 
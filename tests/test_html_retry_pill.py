@@ -9,6 +9,8 @@ JS is not executed by the suite, so these assert on the embedded render source.
 
 from __future__ import annotations
 
+import json
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -35,3 +37,25 @@ def test_tree_retry_pill_render_present(pytester: Pytester) -> None:
 def test_tree_retry_pill_css_defined(pytester: Pytester) -> None:
     html = _gen(pytester)
     assert ".tree-badge.retried" in html, "CSS must define .tree-badge.retried"
+
+
+def test_retry_counts_precomputed_in_aggregate(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        _calls = {}
+
+        @pytest.mark.parametrize("x", [1, 2, 3])
+        def test_flaky(x):
+            _calls[x] = _calls.get(x, 0) + 1
+            assert x == 1 or _calls[x] > x - 1
+    """)
+    pytester.runpytest("--report-dir=reports", "--report-retries=3")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    m = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert m
+    (test,) = json.loads(m.group(1))["tests"]
+    assert test["aggregate"]["retried_runs"] == 2
+    assert test["aggregate"]["retry_attempts"] == 3
+    assert "t.aggregate.retried_runs" in html, "nodeAgg must reuse the precomputed count"
@@ -83,6 +83,13 @@ def _get_script_blocks(html_content: str) -> list[str]:
     return extractor._blocks
 
 
+def _get_data_block(html_content: str) -> str:
+    """Return the text of the ``report-data`` JSON <script> block."""
+    start = html_content.find('<script type="application/json" id="report-data">')
+    assert start >= 0, "report-data JSON block not found"
+    return _get_script_blocks(html_content[start:])[0]
+
+
 # ---------------------------------------------------------------------------
 # Phase 1: Golden byte-equivalence (happy-path guard)
 # ---------------------------------------------------------------------------
@@ -489,8 +496,8 @@ def test_m1_marker_in_log_data(pytester: Pytester) -> None:
     corrupting the REPORT_DATA JSON blob (inserts sys_json content mid-string).
     The single-pass re.sub approach avoids this.
 
-    We detect corruption by extracting the first <script> block, finding the
-    const DATA = ... assignment, and verifying it is valid JSON.
+    We detect corruption by extracting the report-data JSON <script> block
+    and verifying it is valid JSON.
 
     Warning capture: N/A (correctness test).
     """
@@ -510,22 +517,16 @@ def test_m1_marker_in_log_data(pytester: Pytester) -> None:
     html_content = html_path.read_text(encoding="utf-8")
     _assert_valid_html(html_content)
 
-    # Extract the DATA assignment from the script block and verify it is valid JSON.
+    # Extract the DATA JSON from its script block and verify it is valid JSON.
     # With double-substitution (chained str.replace), sys_json gets spliced into
     # the DATA string, making json.loads fail with "Extra data".
     #
-    # The DATA assignment is "const DATA = {...};" — we find the JSON object by
-    # scanning for matching braces rather than greedy regex.
+    # We find the JSON object by scanning for matching braces rather than
+    # greedy regex.
     import json  # noqa: PLC0415
 
-    script_blocks = _get_script_blocks(html_content)
-    data_block = next((b for b in script_blocks if "const DATA" in b), None)
-    assert data_block is not None, "const DATA script block not found"
-
-    # Find the start of the JSON object after "const DATA = "
-    idx = data_block.find("const DATA = ")
-    assert idx >= 0, "Could not find 'const DATA = ' in script block"
-    json_start = data_block.index("{", idx)
+    data_block = _get_data_block(html_content)
+    json_start = data_block.index("{")
 
     # Walk matching braces to find the end of the JSON object
     depth = 0
@@ -556,13 +557,13 @@ def test_m1_marker_in_log_data(pytester: Pytester) -> None:
         parsed = json.loads(json_candidate)
     except json.JSONDecodeError as exc:
         raise AssertionError(
-            f"const DATA is not valid JSON after marker injection — "
+            f"DATA is not valid JSON after marker injection — "
             f"double-substitution likely corrupted the payload: {exc}\n"
             f"JSON candidate (first 200 chars): {json_candidate[:200]!r}"
         ) from exc
 
-    assert isinstance(parsed, dict), "const DATA must be a JSON object"
-    assert "tests" in parsed, "const DATA must contain 'tests' key"
+    assert isinstance(parsed, dict), "DATA must be a JSON object"
+    assert "tests" in parsed, "DATA must contain 'tests' key"
 
 
 # ---------------------------------------------------------------------------
@@ -759,37 +760,10 @@ def test_summary_tab_unchanged_after_compaction(pytester: Pytester) -> None:
 
 
 def _extract_data_json(html_content: str) -> dict:  # type: ignore[type-arg]
-    """Extract and parse the ``const DATA = {...}`` JSON object from the HTML report."""
-    import json as _json  # noqa: PLC0415
+    """Extract and parse the DATA JSON object (with its shards) from the HTML report."""
+    from pytest_reporter._html_builder import read_html_report  # noqa: PLC0415
 
-    js_blocks = _get_script_blocks(html_content)
-    data_block = next((b for b in js_blocks if "const DATA" in b), None)
-    assert data_block is not None, "const DATA block not found"
-
-    idx = data_block.find("const DATA = ")
-    json_start = data_block.index("{", idx)
-    depth = 0
-    in_string = False
-    escape = False
-    json_end = json_start
-    for i, ch in enumerate(data_block[json_start:], json_start):
-        if escape:
-            escape = False
-            continue
-        if ch == "\\" and in_string:
-            escape = True
-            continue
-        if ch == '"' and not escape:
-            in_string = not in_string
-        if not in_string:
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    json_end = i
-                    break
-    return _json.loads(data_block[json_start : json_end + 1])
+    return read_html_report(html_content)
 
 
 def test_mono_step_renders_span(pytester: Pytester) -> None:
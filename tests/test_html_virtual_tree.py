@@ -0,0 +1,103 @@
+"""Virtualized Tests-tab tree: only viewport rows are rendered.
+
+The tree is flattened into visible rows and windowed by a fixed row height,
+so opening the Tests tab costs the same for 50 or 50k tests.  The
+behavioural tests run the report script under node (``report_js``).
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from pytest import Pytester
+
+
+def _gen(pytester: Pytester) -> str:
+    pytester.makepyfile("""
+        def test_simple():
+            assert True
+    """)
+    pytester.runpytest("--report-dir=reports")
+    runs = sorted((pytester.path / "reports" / "runs").iterdir())
+    assert len(runs) == 1
+    return (runs[0] / "report.html").read_text(encoding="utf-8")
+
+
+def test_row_height_matches_css(pytester: Pytester) -> None:
+    html = _gen(pytester)
+    js_height = re.search(r"const TREE_ROW_H = (\d+);", html)
+    assert js_height, "JS must declare the fixed TREE_ROW_H"
+    css_row = re.search(r"\.tree-row \{[^}]*?height: (\d+)px;", html)
+    assert css_row, "CSS must give .tree-row a fixed height"
+    assert js_height.group(1) == css_row.group(1)
+
+
+def test_tree_renders_through_window(pytester: Pytester) -> None:
+    html = _gen(pytester)
+    assert "function flattenTree()" in html
+    assert "function renderTreeWindow()" in html
+    assert "tree-window" in html and "tree-spacer" in html
+    # Group rows no longer pre-render their subtree.
+    assert "tree-children" not in html
+
+
+_TREE_PROBE = """
+const rowName = r => r.test ? r.test.aggregate.function_name : r.name;
+const out = {collapsed: treeView.rows.map(rowName), collapsedDom: treeView.win.children.length};
+setTreeExpanded(treeView.root, true);
+treeView.content.clientHeight = 10 * TREE_ROW_H;
+refreshTree();
+treeView.content.scrollTop = 300 * TREE_ROW_H;
+renderTreeWindow();
+out.rows = treeView.rows.length;
+out.spacer = treeView.spacer.style.height;
+out.transform = treeView.win.style.transform;
+out.rendered = treeView.win.children.map(row => row.textContent);
+out.expected = treeView.rows.slice(288, 322).map(rowName);
+filterTree('beta_01');
+out.searched = treeView.rows.map(rowName);
+filterTree('');
+toggleFilter('passed', document.querySelector('.filter-btn.passed'));
+out.failed = treeView.rows.map(rowName);
+out
+"""
+
+
+def test_tree_renders_only_the_viewport(
+    pytester: Pytester, report_js: Callable[[str, str], Any]
+) -> None:
+    for name in ("alpha", "beta"):
+        pytester.makepyfile(
+            **{
+                f"test_{name}": "".join(
+                    f"def test_{name}_{i:03d}():\n    assert {i % 50 != 7}\n" for i in range(200)
+                )
+            }
+        )
+    pytester.runpytest("--report-dir=reports")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    out = report_js((run_dir / "report.html").read_text(encoding="utf-8"), _TREE_PROBE)
+
+    # Collapsed, only the two file groups exist as rows and in the DOM.
+    assert out["collapsed"] == ["test_alpha.py", "test_beta.py"]
+    assert out["collapsedDom"] == 2
+    # Expanded: 2 groups + 400 tests, but only the 10 viewport rows plus 12
+    # overscan rows on each side are rendered, offset to their position.
+    assert out["rows"] == 402
+    assert out["spacer"] == f"{402 * 28}px"
+    assert out["transform"] == f"translateY({288 * 28}px)"
+    assert len(out["rendered"]) == 34
+    assert out["rendered"] == out["expected"]
+    assert out["expected"][0] == "test_beta_086"
+    # Search and status filters keep the groups holding a match.
+    assert out["searched"] == ["test_beta.py"] + [f"test_beta_01{i}" for i in range(10)]
+    failing = [f"{i:03d}" for i in range(7, 200, 50)]
+    assert out["failed"] == ["test_alpha.py", *(f"test_alpha_{i}" for i in failing)] + [
+        "test_beta.py",
+        *(f"test_beta_{i}" for i in failing),
+    ]
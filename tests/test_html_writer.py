@@ -0,0 +1,206 @@
+"""Unit tests for the streaming REPORT_DATA writer."""
+
+from __future__ import annotations
+
+import base64
+import json
+import re
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pytest_reporter._artifacts import EmbeddedFile
+from pytest_reporter._html_builder import build_html_report, read_html_report, write_html_report
+from pytest_reporter._html_builder._payload import index_test
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+def _data_literal(html: str, block: str = "report-data") -> str:
+    m = re.search(f'id="{block}">(.*?)</script>', html, re.DOTALL)
+    assert m, f"Could not find the {block} JSON block in report"
+    return m.group(1)
+
+
+def _sample_data() -> dict[str, Any]:
+    return {
+        "timestamp": "2026_01_01_00_00_00",
+        "tests": [
+            {
+                "base_nodeid": "t.py::test_a",
+                "aggregate": {"passed": 1},
+                "runs": [
+                    {"run_id": "01", "msg": "</script>", "phases": {"call": {"entries": []}}},
+                    {},
+                ],
+            },
+            {"base_nodeid": "t.py::test_b", "aggregate": {}, "runs": []},
+        ],
+        "session_log": {"entries": []},
+        "system_metadata": {},
+    }
+
+
+def test_streamed_payload_matches_one_shot_dump() -> None:
+    data = _sample_data()
+    index = {**data, "tests": [index_test(t, i) for i, t in enumerate(data["tests"])]}
+    expected = json.dumps(index, ensure_ascii=True).replace("</", "<\\/")
+    assert _data_literal(build_html_report(data)) == expected
+
+
+def test_run_details_are_split_into_per_test_shards() -> None:
+    data = _sample_data()
+    html = build_html_report(data)
+    index = json.loads(_data_literal(html))
+    assert [t["shard"] for t in index["tests"]] == [0, 1]
+    assert index["tests"][0]["runs"][0] == {"run_id": "01", "msg": "</script>"}
+    shards = _data_literal(html, "report-shards").split("\n")
+    assert [json.loads(line) for line in shards] == [
+        [{"phases": {"call": {"entries": []}}}, {}],
+        [],
+    ]
+    assert read_html_report(html) == data
+    assert "function loadShard(test, onLoaded)" in html
+
+
+def test_payload_is_a_json_block_parsed_at_load() -> None:
+    html = build_html_report(_sample_data())
+    assert '<script type="application/json" id="report-data">{' in html
+    assert "const DATA = {" not in html, "DATA must not be a JS object literal"
+    assert "JSON.parse(text)" in html
+    assert "report-load-time" in html
+
+
+def test_file_and_string_output_are_identical(tmp_path: Path) -> None:
+    data = _sample_data()
+    path = tmp_path / "report.html"
+    write_html_report(path, data)
+    assert path.read_text(encoding="utf-8") == build_html_report(data)
+
+
+def test_unserializable_payload_is_replaced_by_fallback(tmp_path: Path) -> None:
+    data: dict[str, Any] = {"tests": [{"runs": []}]}
+    data["tests"][0]["runs"].append(data)  # circular reference mid-stream
+
+    path = tmp_path / "report.html"
+    with pytest.warns(UserWarning, match="minimal fallback"):
+        write_html_report(path, data)
+    html = path.read_text(encoding="utf-8")
+    payload = json.loads(_data_literal(html))
+    assert payload == {"error": "report data not serializable", "tests": []}
+    assert _data_literal(html, "report-shards") == ""
+
+
+def test_embedded_file_is_streamed_as_data_uri(tmp_path: Path) -> None:
+    blob = bytes(range(256)) * 2000  # spans several encoder chunks
+    (tmp_path / "shot.png").write_bytes(blob)
+    data = _sample_data()
+    data["tests"][0]["runs"][0]["artifacts"] = [
+        {"name": "shot.png", "data_uri": EmbeddedFile(tmp_path / "shot.png", "image/png")},
+        {"name": "gone.png", "data_uri": EmbeddedFile(tmp_path / "gone.png", "image/png")},
+    ]
+
+    with pytest.warns(UserWarning, match="read failed"):
+        payload = read_html_report(build_html_report(data))
+    shot, gone = payload["tests"][0]["runs"][0]["artifacts"]
+    assert shot["data_uri"] == "data:image/png;base64," + base64.b64encode(blob).decode()
+    assert gone["data_uri"] is None
+
+
+def test_compressed_payload_round_trips() -> None:
+    data = _sample_data()
+    html = build_html_report(data, compress=True)
+    for block in ("report-data", "report-shards"):
+        zlib.decompress(base64.b64decode(json.loads(_data_literal(html, block))))
+    assert read_html_report(html) == data
+    assert '<script type="text/plain" id="report-app">' in html
+    assert "new DecompressionStream('deflate')" in html
+    assert "<script>\n" not in html.split('id="report-app">', 1)[0], (
+        "no script may run before the loader"
+    )
+
+
+def test_compressed_payload_streams_embedded_files(tmp_path: Path) -> None:
+    blob = bytes(range(256)) * 2000
+    (tmp_path / "shot.png").write_bytes(blob)
+    data = _sample_data()
+    data["tests"][0]["runs"][0]["artifacts"] = [
+        {"name": "shot.png", "data_uri": EmbeddedFile(tmp_path / "shot.png", "image/png")},
+    ]
+    path = tmp_path / "report.html"
+    write_html_report(path, data, compress=True)
+    html = path.read_text(encoding="utf-8")
+    (shot,) = read_html_report(html)["tests"][0]["runs"][0]["artifacts"]
+    assert shot["data_uri"] == "data:image/png;base64," + base64.b64encode(blob).decode()
+    assert len(html) < len(build_html_report({**data, "tests": []})) + len(blob)
+
+
+def test_compressed_fallback_is_compressed(tmp_path: Path) -> None:
+    data: dict[str, Any] = {"tests": [{"runs": []}]}
+    data["tests"][0]["runs"].append(data)
+
+    path = tmp_path / "report.html"
+    with pytest.warns(UserWarning, match="minimal fallback"):
+        write_html_report(path, data, compress=True)
+    payload = read_html_report(path.read_text(encoding="utf-8"))
+    assert payload == {"error": "report data not serializable", "tests": []}
+
+
+def test_report_compress_option(pytester: pytest.Pytester) -> None:
+    pytester.makepyfile("""
+        def test_logs(log):
+            for i in range(200):
+                log.info(f"repetitive message {i}")
+    """)
+    pytester.runpytest("--report-dir=reports", "--report-compress")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    data = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    (test,) = data["tests"]
+    assert len(test["runs"][0]["phases"]["call"]["entries"]) == 200
+
+
+_LAZY_SHARDS_PROBE = """
+(async () => {
+  const test = DATA.tests[0];
+  const atStart = Object.keys(_blocks);
+  const mergedAtOnce = loadShard(test);
+  await new Promise(resolve => loadShard(test, resolve));
+  return {atStart, mergedAtOnce, inflated: Object.keys(_blocks),
+          msg: test.runs[0].phases.call.entries[0].msg};
+})()
+"""
+
+_LOG_SNIPPET_PROBE = """
+(async () => {
+  const input = document.querySelector('.log-search').querySelector('.search-input');
+  input.value = 'first';
+  input.dispatch('input');
+  await new Promise(resolve => setTimeout(resolve, 200));
+  return document.querySelector('.log-search-hit-text').textContent;
+})()
+"""
+
+
+def test_compressed_report_inflates_shards_on_first_open(
+    pytester: pytest.Pytester, report_js: Callable[[str, str], Any]
+) -> None:
+    pytester.makepyfile("""
+        def test_logs(log):
+            log.info("first message")
+    """)
+    pytester.runpytest("--report-dir=reports", "--report-compress")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    # Only the index is inflated before the app starts; the shards block is
+    # inflated, once, when a test is first opened.
+    assert report_js(html, _LAZY_SHARDS_PROBE) == {
+        "atStart": [],
+        "mergedAtOnce": False,
+        "inflated": ["report-shards"],
+        "msg": "first message",
+    }
+    # Log search results wait for the shards to show their snippets.
+    assert report_js(html, _LOG_SNIPPET_PROBE) == "first message"
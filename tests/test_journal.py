@@ -0,0 +1,84 @@
+"""Tests for the ``--report-layout=journal`` run journal."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._journal import INDEX_NAME, JOURNAL_NAME, JournalReader, RunJournal
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+
+def test_reader_seeks_latest_record_via_index(tmp_path: Path) -> None:
+    journal = RunJournal(tmp_path)
+    journal.append("phase", "tests/a/01/call.log.json", {"outcome": "failed"})
+    journal.append("phase", "tests/a/retries/01/call.log.json", {"outcome": "passed"})
+    journal.append("phase", "tests/a/01/call.log.json", {"outcome": "passed"})
+    journal.close()
+
+    reader = JournalReader(tmp_path)
+    assert reader.get("tests/a/01/call.log.json") == {"outcome": "passed"}
+    assert reader.children("tests/a") == ["01", "retries"]
+    assert reader.children("tests/a/retries") == ["01"]
+    assert "tests/b/01/call.log.json" not in reader
+
+
+def test_reader_scans_journal_without_index(tmp_path: Path) -> None:
+    journal = RunJournal(tmp_path)
+    journal.append("procedure", "x/procedure.json", {"steps": []})
+    journal.close()
+    (tmp_path / INDEX_NAME).unlink()
+    with (tmp_path / JOURNAL_NAME).open("a", encoding="utf-8") as fh:
+        fh.write("{truncated\n")
+
+    with pytest.warns(UserWarning, match="journal record skipped"):
+        reader = JournalReader(tmp_path)
+    assert reader.get("x/procedure.json") == {"steps": []}
+
+
+def test_journal_layout_replaces_per_test_files(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        _attempts = []
+
+        @pytest.mark.parametrize("x", [1, 2])
+        def test_p(x, log):
+            log.info(f"value {x}")
+
+        def test_flaky():
+            _attempts.append(1)
+            assert len(_attempts) > 1
+    """)
+    result = pytester.runpytest(
+        "--report-dir=reports", "--report-layout=journal", "--report-retries=1"
+    )
+    result.assert_outcomes(passed=3)
+
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    assert not list(run_dir.rglob("*.log.json"))
+    assert not list(run_dir.rglob("procedure.json"))
+
+    reader = JournalReader(run_dir)
+    kinds = {
+        json.loads(line)["type"]
+        for line in (run_dir / JOURNAL_NAME).read_text(encoding="utf-8").splitlines()
+    }
+    assert kinds >= {"phase", "procedure", "parameters", "test_log", "session_log"}
+    func = "tests/test_journal_layout_replaces_per_test_files.py/test_p"
+    assert reader.get(f"{func}/02/call.log.json")["entries"][0]["msg"] == "value 2"
+
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    data = read_html_report(html)
+    flaky = next(t for t in data["tests"] if t["base_nodeid"].endswith("test_flaky"))
+    (attempt,) = flaky["runs"][0]["retry_attempts"]
+    assert attempt["phases"]["call"]["outcome"] == "passed"
+    assert "steps" in attempt["procedure"]
+    assert (pytester.path / "reports" / "01_latest" / JOURNAL_NAME).is_file()
@@ -0,0 +1,63 @@
+"""Tests for the optional background writer behind ``--report-async-writes``."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pytest_reporter._json_writer import BackgroundWriter, _set_writer, write_text_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+
+def test_background_writes_land_in_order_after_close(tmp_path: Path) -> None:
+    writer = BackgroundWriter(max_pending=2)
+    _set_writer(writer)
+    try:
+        for i in range(20):
+            write_text_file(tmp_path / "deep" / "dir" / "f.txt", str(i))
+            write_text_file(tmp_path / f"{i}.txt", str(i))
+    finally:
+        _set_writer(None)
+        writer.close()
+
+    assert (tmp_path / "deep" / "dir" / "f.txt").read_text(encoding="utf-8") == "19"
+    assert all((tmp_path / f"{i}.txt").read_text(encoding="utf-8") == str(i) for i in range(20))
+
+
+def test_background_write_failure_is_warned_on_close(tmp_path: Path) -> None:
+    (tmp_path / "blocker").write_text("not a directory")
+    writer = BackgroundWriter()
+    writer.submit(tmp_path / "blocker" / "x.json", "{}")
+    writer.submit(tmp_path / "ok.json", "{}")
+    with pytest.warns(UserWarning, match="background write failed"):
+        writer.close()
+    assert (tmp_path / "ok.json").exists()
+
+
+def test_async_writes_produce_the_same_run_files(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.parametrize("x", [1, 2])
+        def test_p(x, log):
+            log.info(f"value {x}")
+            assert x == 1
+    """)
+    result = pytester.runpytest("--report-dir=reports", "--report-async-writes")
+    result.assert_outcomes(passed=1, failed=1)
+
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    func_dir = run_dir / "tests" / "test_async_writes_produce_the_same_run_files.py" / "test_p"
+    for run_id in ("01", "02"):
+        for name in ("setup.log.json", "call.log.json", "teardown.log.json", "procedure.json"):
+            assert (func_dir / run_id / name).is_file()
+    call = json.loads((func_dir / "02" / "call.log.json").read_text(encoding="utf-8"))
+    assert call["outcome"] == "failed"
+    assert list((run_dir / "failures").iterdir())
+    assert "value 2" in (run_dir / "report.html").read_text(encoding="utf-8")
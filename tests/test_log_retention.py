@@ -0,0 +1,109 @@
+"""Tests for --report-log-retention (verbose entries kept only for failing runs)."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._phase_capture import drop_verbose_entries
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+_SUITE = """
+    import pytest
+
+    _attempts = []
+
+    @pytest.fixture
+    def rig(log):
+        log.debug("setup debug")
+        yield
+        log.info("teardown info")
+
+    def test_pass(rig, log):
+        log.info("pass info")
+        log.warning("pass warning")
+        log.table([{"v": 1}], name="readings")
+
+    def test_fail(rig, log):
+        log.debug("fail debug")
+        assert False
+
+    @pytest.fixture
+    def broken_teardown(log):
+        yield
+        log.info("teardown info")
+        raise RuntimeError("teardown")
+
+    def test_teardown_error(broken_teardown, log):
+        log.info("body info")
+
+    def test_flaky(log):
+        _attempts.append(1)
+        log.info(f"attempt {len(_attempts)}")
+        assert len(_attempts) > 1
+"""
+
+
+def _run(pytester: Pytester, *args: str) -> Path:
+    pytester.makepyfile(_SUITE)
+    pytester.runpytest("--report-dir=reports", "--report-log-retention=failed", *args)
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    return run_dir
+
+
+def _msgs(run_dir: Path, test: str, when: str, attempt: str = "") -> list[str]:
+    func_dir = next((run_dir / "tests").iterdir()) / test / "default"
+    if attempt:
+        func_dir = func_dir / "retries" / attempt
+    log = json.loads((func_dir / f"{when}.log.json").read_text(encoding="utf-8"))
+    return [e["msg"] for e in log["entries"]]
+
+
+def test_passing_runs_keep_only_warnings_and_tables(pytester: Pytester) -> None:
+    run_dir = _run(pytester)
+    assert _msgs(run_dir, "test_pass", "setup") == []
+    assert _msgs(run_dir, "test_pass", "call") == ["pass warning", "Table: readings"]
+    assert _msgs(run_dir, "test_pass", "teardown") == []
+
+    data = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    runs: dict[str, Any] = {
+        run["nodeid"].split("::")[-1]: run for t in data["tests"] for run in t["runs"]
+    }
+    assert [e["msg"] for e in runs["test_pass"]["phases"]["call"]["entries"]] == [
+        "pass warning",
+        "Table: readings",
+    ]
+    assert [e["msg"] for e in runs["test_fail"]["phases"]["call"]["entries"]] == ["fail debug"]
+
+
+def test_failing_runs_keep_every_phase(pytester: Pytester) -> None:
+    run_dir = _run(pytester)
+    assert _msgs(run_dir, "test_fail", "setup") == ["setup debug"]
+    assert _msgs(run_dir, "test_fail", "call") == ["fail debug"]
+    assert _msgs(run_dir, "test_fail", "teardown") == ["teardown info"]
+    # A teardown error keeps the entries of the phases before it too.
+    assert _msgs(run_dir, "test_teardown_error", "call") == ["body info"]
+    assert _msgs(run_dir, "test_teardown_error", "teardown") == ["teardown info"]
+
+
+def test_retried_runs_keep_every_attempt(pytester: Pytester) -> None:
+    run_dir = _run(pytester, "--report-retries=1")
+    assert _msgs(run_dir, "test_flaky", "call") == ["attempt 1"]
+    assert _msgs(run_dir, "test_flaky", "call", attempt="01") == ["attempt 2"]
+    assert _msgs(run_dir, "test_pass", "call") == ["pass warning", "Table: readings"]
+
+
+def test_drop_verbose_entries() -> None:
+    entries = [
+        {"level": "DEBUG", "msg": "d"},
+        {"level": "INFO", "msg": "i", "data": {"_type": "table"}},
+        {"level": "INFO", "msg": "i2", "data": {"k": 1}},
+        {"level": "WARNING", "msg": "w"},
+        {"level": "CRITICAL", "msg": "c"},
+    ]
+    assert [e["msg"] for e in drop_verbose_entries(entries)] == ["i", "w", "c"]
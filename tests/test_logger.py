@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import TYPE_CHECKING
 
+import pytest
+
+from pytest_reporter._logger import LogFilter, Logger, format_timestamp, parse_level_spec
+
 if TYPE_CHECKING:
     from pytest import Pytester
 
@@ -149,3 +154,238 @@ def test_log_exception_capture(pytester: Pytester) -> None:
     assert entries[0]["exc"]["type"] == "ValueError"
     assert entries[0]["exc"]["msg"] == "bad value"
     assert "Traceback" in entries[0]["exc"]["tb"]
+
+
+def test_logger_defers_formatting_to_serialize() -> None:
+    log = Logger().child("dmm").child("ch1")
+    log.info("a")
+    log.info("b")
+    first, second = log._root._entries
+    assert first.source is second.source is log._path
+
+    try:
+        raise ValueError("bad reading")
+    except ValueError as err:
+        log.error("failed", exc_info=err)
+        captured = log._root._entries[-1].exc_info
+        assert captured is not None
+        assert captured.exc is err
+
+    entries = log.serialize()["entries"]
+    assert [e["seq"] for e in entries] == [0, 1, 2]
+    assert entries[0]["source"] == ["dmm", "ch1"]
+    assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}Z", entries[0]["t"])
+    exc = entries[2]["exc"]
+    assert (exc["type"], exc["msg"]) == ("ValueError", "bad reading")
+    assert "raise ValueError" in exc["tb"]
+
+
+def test_format_timestamp() -> None:
+    assert format_timestamp(1_767_225_600_123_456_789) == "2026-01-01T00:00:00.123456Z"
+
+
+def test_log_level_option_filters_by_source(pytester: Pytester) -> None:
+    pytester.makeconftest("""
+        import pytest
+
+        @pytest.fixture(scope="session", autouse=True)
+        def bench(session_log):
+            session_log.debug("session debug")
+            session_log.info("session info")
+    """)
+    pytester.makepyfile("""
+        def test_levels(log):
+            log.debug("root debug")
+            log.info("root info")
+            psu = log.child("psu")
+            psu.info("psu info")
+            psu.child("ch1").warning("ch1 warning")
+            psu.table([{"v": 1}], name="hidden")
+            log.child("dmm").debug("dmm debug")
+    """)
+    result = pytester.runpytest(
+        "--report-dir=reports",
+        "--report-log-level=info",
+        "--report-log-level=psu.*=WARNING",
+        "--report-log-level=dmm=DEBUG",
+    )
+    result.assert_outcomes(passed=1)
+
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    test_dir = run_dir / "tests" / "test_log_level_option_filters_by_source.py" / "test_levels"
+    call_log = json.loads((test_dir / "default" / "call.log.json").read_text())
+    assert [e["msg"] for e in call_log["entries"]] == ["root info", "ch1 warning", "dmm debug"]
+    assert not (test_dir / "default" / "artifacts" / "hidden.html").exists()
+    session_log = json.loads((run_dir / "session.log.json").read_text())
+    assert [e["msg"] for e in session_log["entries"]] == ["session info"]
+
+
+def test_log_level_option_rejects_unknown_levels(pytester: Pytester) -> None:
+    pytester.makepyfile("def test_a():\n    pass\n")
+    result = pytester.runpytest("--report-dir=reports", "--report-log-level=psu=LOUD")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*unknown log level 'LOUD'*"])
+
+
+def test_log_filter_thresholds() -> None:
+    log_filter = LogFilter.from_specs(
+        [parse_level_spec(s) for s in ["WARNING", "psu.*=info", "psu.ch2=ERROR", "*.ch9=DEBUG"]]
+    )
+    assert log_filter.threshold(()) == 30
+    assert log_filter.threshold(("dmm",)) == 30
+    assert log_filter.threshold(("psu",)) == 20
+    assert log_filter.threshold(("psu", "ch1")) == 20
+    assert log_filter.threshold(("psu", "ch2", "sense")) == 40
+    assert log_filter.threshold(("psu", "ch9")) == 10
+    with pytest.raises(ValueError, match="missing source pattern"):
+        parse_level_spec("=INFO")
+
+
+def test_max_entries_keeps_first_and_last_half() -> None:
+    log = Logger(max_entries=4)
+    child = log.child("loop")
+    for i in range(10):
+        (child.debug if i % 2 else child.info)(f"m{i}")
+    log.table([{"v": 1}], name="late")
+
+    entries = log.serialize()["entries"]
+    assert [e["msg"] for e in entries] == [
+        "m0",
+        "m1",
+        "7 log entries dropped (over the cap of 4)",
+        "m9",
+        "Table: late",
+    ]
+    overflow = entries[2]
+    assert overflow["seq"] == 2
+    assert overflow["level"] == "WARNING"
+    assert overflow["data"] == {"_type": "overflow", "dropped": {"INFO": 4, "DEBUG": 3}, "total": 7}
+    assert list(log.get_table_payloads()) == [10]
+
+    log.reset()
+    log.info("fresh")
+    assert [e["msg"] for e in log.serialize()["entries"]] == ["fresh"]
+
+
+def test_max_entries_drops_table_payloads_with_their_entries() -> None:
+    log = Logger(max_entries=1)
+    log.info("first")
+    log.table([{"v": 1}], name="dropped")
+    assert log.get_table_payloads() == {}
+    assert [e["msg"] for e in log.serialize()["entries"]][1:] == [
+        "1 log entry dropped (over the cap of 1)"
+    ]
+
+
+def test_log_max_entries_option(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        def test_runaway(log):
+            for i in range(1000):
+                log.debug(f"tick {i}")
+    """)
+    result = pytester.runpytest("--report-dir=reports", "--report-log-max-entries=10")
+    result.assert_outcomes(passed=1)
+
+    (call_log,) = (pytester.path / "reports" / "runs").glob("*/tests/*/*/*/call.log.json")
+    entries = json.loads(call_log.read_text())["entries"]
+    assert len(entries) == 11
+    assert entries[5]["data"]["dropped"] == {"DEBUG": 990}
+    assert entries[-1]["msg"] == "tick 999"
+
+
+def test_repeated_messages_are_coalesced() -> None:
+    log = Logger()
+    poll = log.child("psu")
+    for _ in range(3):
+        poll.info("waiting for lock")
+    log.child("psu").info("waiting for lock")  # same source, another child
+    poll.info("waiting for lock", data={"v": 1})
+    poll.info("waiting for lock", data={"v": 1})
+    poll.debug("waiting for lock")
+    poll.info("waiting for lock")
+    try:
+        raise TimeoutError("lock")
+    except TimeoutError as err:
+        poll.error("lock lost", exc_info=err)
+        poll.error("lock lost", exc_info=err)
+
+    entries = log.serialize()["entries"]
+    assert [(e["seq"], e["level"], e["data"], e.get("repeat", 1)) for e in entries] == [
+        (0, "INFO", None, 4),
+        (1, "INFO", {"v": 1}, 1),
+        (2, "INFO", {"v": 1}, 1),
+        (3, "DEBUG", None, 1),
+        (4, "INFO", None, 1),
+        (5, "ERROR", None, 1),
+        (6, "ERROR", None, 1),
+    ]
+    assert entries[0]["t"] <= entries[0]["last_t"] <= entries[1]["t"]
+    assert "last_t" not in entries[3]
+
+
+def test_entries_with_data_are_never_compared() -> None:
+    class ArrayLike:
+        def __eq__(self, other: object) -> ArrayLike:  # type: ignore[override]
+            return self  # element-wise, like numpy: no truth value
+
+        def __bool__(self) -> bool:
+            raise ValueError("truth value of an array is ambiguous")
+
+    log = Logger()
+    log.info("sample", data={"v": ArrayLike()})
+    log.info("sample", data={"v": ArrayLike()})
+    shared = {"v": 1}
+    log.info("poll", data=shared)
+    shared["v"] = 2
+    log.info("poll", data=shared)
+
+    entries = log.serialize()["entries"]
+    assert [e.get("repeat", 1) for e in entries] == [1, 1, 1, 1]
+
+
+def test_coalesced_repeats_count_in_the_overflow_record() -> None:
+    log = Logger(max_entries=2)
+    for i in range(3):
+        log.info(f"m{i}")
+    for _ in range(5):
+        log.info("tick")
+    log.info("end")
+    entries = log.serialize()["entries"]
+    assert [e["msg"] for e in entries] == [
+        "m0",
+        "7 log entries dropped (over the cap of 2)",
+        "end",
+    ]
+
+
+def test_logged_traceback_is_the_one_at_log_time() -> None:
+    log = Logger()
+
+    def fail() -> None:
+        raise ValueError("bad reading")
+
+    def reraise() -> None:
+        try:
+            fail()
+        except ValueError as err:
+            err.add_note("before logging")
+            log.error("failed", exc_info=err)
+            err.add_note("after logging")
+            raise
+
+    with pytest.raises(ValueError):
+        reraise()
+
+    (entry,) = log.serialize()["entries"]
+    tb = entry["exc"]["tb"]
+    assert "in reraise" in tb
+    assert "before logging" in tb
+    assert "after logging" not in tb
+    assert "in test_logged_traceback_is_the_one_at_log_time" not in tb
+
+
+def test_log_max_entries_option_rejects_negative_values(pytester: Pytester) -> None:
+    pytester.makepyfile("def test_a():\n    pass\n")
+    result = pytester.runpytest("--report-dir=reports", "--report-log-max-entries=-5")
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(["*--report-log-max-entries*must be 0 or more, got -5*"])
@@ -0,0 +1,199 @@
+"""Tests for ``python -m pytest_reporter merge``."""
+
+from __future__ import annotations
+
+import json
+import urllib.parse
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree
+
+import pytest
+
+from pytest_reporter._cli import main
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._merge import merge_session_logs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+_SHARED = """
+    import os
+
+    def test_shared(log):
+        log.info("shard " + os.environ["SHARD"])
+        assert os.environ["SHARD"] == "b"
+"""
+
+
+def _shard(pytester: Pytester, monkeypatch: pytest.MonkeyPatch, name: str, body: str) -> Path:
+    monkeypatch.setenv("SHARD", name)
+    pytester.makepyfile(**{f"test_{name}": body})
+    pytester.runpytest(f"test_{name}.py", "test_shared.py", f"--report-dir=reports_{name}")
+    (run_dir,) = (pytester.path / f"reports_{name}" / "runs").iterdir()
+    return run_dir
+
+
+@pytest.fixture
+def shards(pytester: Pytester, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    pytester.makepyfile(test_shared=_SHARED)
+    a = _shard(
+        pytester,
+        monkeypatch,
+        "a",
+        """
+        import pytest
+
+        @pytest.mark.parametrize("x", [1, 2])
+        def test_a(x, report_artifacts):
+            (report_artifacts / "a.txt").write_text(str(x))
+        """,
+    )
+    b = _shard(pytester, monkeypatch, "b", "def test_b():\n    assert False\n")
+    return [b, a]
+
+
+def test_merge_unions_shards(pytester: Pytester, shards: list[Path]) -> None:
+    out = pytester.path / "merged"
+    assert main(["merge", *map(str, shards), "-o", str(out), "--report-artifacts=link"]) == 0
+
+    data = read_html_report((out / "report.html").read_text(encoding="utf-8"))
+    tests = {t["base_nodeid"]: t for t in data["tests"]}
+    assert list(tests) == ["test_a.py::test_a", "test_b.py::test_b", "test_shared.py::test_shared"]
+    assert tests["test_a.py::test_a"]["aggregate"]["total_runs"] == 2
+
+    # test_shared ran in both shards; the later shard (b) wins.
+    (shared,) = tests["test_shared.py::test_shared"]["runs"]
+    assert shared["outcome"] == "passed"
+    assert tests["test_shared.py::test_shared"]["aggregate"]["failed"] == 0
+    assert [e["msg"] for e in shared["phases"]["call"]["entries"]] == ["shard b"]
+
+    artifact = tests["test_a.py::test_a"]["runs"][1]["artifacts"][0]
+    assert (out / urllib.parse.unquote(artifact["href"])).read_text() == "2"
+
+    logs = [json.loads((d / "session.log.json").read_text(encoding="utf-8")) for d in shards]
+    assert data["duration"] == pytest.approx(sum(log["duration_seconds"] for log in logs))
+    assert len(data["session_log"]["entries"]) == sum(len(log["entries"]) for log in logs)
+
+    root = ElementTree.parse(out / "junit.xml").getroot()
+    suite = root.find("testsuite")
+    assert suite is not None
+    assert (suite.get("tests"), suite.get("failures")) == ("4", "1")
+
+
+def test_merge_leaves_the_shards_untouched(pytester: Pytester, shards: list[Path]) -> None:
+    b, a = shards
+    original = sorted(a.rglob("a.txt"))[0]
+    (b_run,) = [p.parent for p in b.rglob("call.log.json") if "test_b" in p.parts]
+    copy = b_run / "artifacts" / "copy.txt"
+    copy.parent.mkdir(exist_ok=True)
+    copy.write_bytes(original.read_bytes())
+    inodes = {p: p.stat().st_ino for p in (original, copy)}
+
+    out = pytester.path / "merged"
+    assert main(["merge", *map(str, shards), "-o", str(out)]) == 0
+
+    assert {p: p.stat().st_ino for p in (original, copy)} == inodes
+    data = read_html_report((out / "report.html").read_text(encoding="utf-8"))
+    tests = {t["base_nodeid"]: t for t in data["tests"]}
+    (b_run_data,) = tests["test_b.py::test_b"]["runs"]
+    assert [a["name"] for a in b_run_data["artifacts"]] == ["copy.txt"]
+
+
+def _run_shard(pytester: Pytester, index: int, *args: str) -> Path:
+    pytester.runpytest(*args, f"--report-dir=reports_{index}")
+    (run_dir,) = (pytester.path / f"reports_{index}" / "runs").iterdir()
+    return run_dir
+
+
+def _merged_runs(pytester: Pytester, shards: list[Path]) -> tuple[list[dict[str, Any]], str]:
+    """Merge *shards*; return the runs of their one test and the junit.xml test count."""
+    out = pytester.path / "merged"
+    assert main(["merge", *map(str, shards), "-o", str(out)]) == 0
+    (test,) = read_html_report((out / "report.html").read_text(encoding="utf-8"))["tests"]
+    suite = ElementTree.parse(out / "junit.xml").getroot().find("testsuite")
+    assert suite is not None
+    return test["runs"], str(suite.get("tests"))
+
+
+def test_merge_keeps_different_parametrizations(
+    pytester: Pytester, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytester.makepyfile(
+        test_p="""
+        import os
+        import pytest
+
+        @pytest.mark.parametrize("v", [os.environ["PARAM"]])
+        def test_p(v):
+            pass
+        """
+    )
+    shards = []
+    for i, param in enumerate(["a", "b"]):
+        monkeypatch.setenv("PARAM", param)
+        shards.append(_run_shard(pytester, i))
+    # Both shards number their only run 01: it is the node ID that tells
+    # them apart, and the merged runs are renumbered.
+    runs, junit_tests = _merged_runs(pytester, shards)
+    assert [(r["run_id"], r["nodeid"], r["outcome"]) for r in runs] == [
+        ("01", "test_p.py::test_p[a]", "passed"),
+        ("02", "test_p.py::test_p[b]", "passed"),
+    ]
+    # Their details are still read from each shard's own run directory.
+    assert [r["phases"]["call"]["outcome"] for r in runs] == ["passed", "passed"]
+    assert junit_tests == "2"
+
+
+def test_merge_ignores_runs_a_shard_deselected(pytester: Pytester) -> None:
+    pytester.makepyfile(
+        test_p="""
+        import pytest
+
+        @pytest.mark.parametrize("v", ["alpha", "beta"])
+        def test_p(v):
+            pass
+        """
+    )
+    shards = [_run_shard(pytester, 0, "-k", "alpha"), _run_shard(pytester, 1, "-k", "beta")]
+    # Each shard's test.log.json lists the run it deselected as skipped.
+    runs, junit_tests = _merged_runs(pytester, shards)
+    assert [(r["run_id"], r["nodeid"], r["outcome"]) for r in runs] == [
+        ("01", "test_p.py::test_p[alpha]", "passed"),
+        ("02", "test_p.py::test_p[beta]", "passed"),
+    ]
+    assert junit_tests == "2"
+
+
+def test_session_logs_are_merged_in_timestamp_order() -> None:
+    merged = merge_session_logs(
+        [
+            {
+                "start_time": "2026-01-01T10:00:00Z",
+                "end_time": "2026-01-01T10:05:00Z",
+                "duration_seconds": 300.0,
+                "entries": [
+                    {"t": "2026-01-01T10:00:01Z", "msg": "a1"},
+                    {"t": "2026-01-01T10:04:00Z", "msg": "a2"},
+                ],
+            },
+            {
+                "start_time": "2026-01-01T09:59:00Z",
+                "end_time": "2026-01-01T10:02:00Z",
+                "duration_seconds": 180.0,
+                "entries": [{"t": "2026-01-01T10:01:00Z", "msg": "b1"}],
+            },
+        ]
+    )
+    assert [e["msg"] for e in merged["entries"]] == ["a1", "b1", "a2"]
+    assert merged["start_time"] == "2026-01-01T09:59:00Z"
+    assert merged["end_time"] == "2026-01-01T10:05:00Z"
+    assert merged["duration_seconds"] == 480.0
+
+
+def test_merge_requires_an_output(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(["merge", str(tmp_path)])
+    assert exc_info.value.code == 2
+    assert "--output" in capsys.readouterr().err
@@ -21,13 +21,13 @@ if TYPE_CHECKING:
 def _extract_report_data(html: str) -> dict:  # type: ignore[type-arg]
     """Extract the embedded DATA dict from a report.html.
 
-    The embed uses ``/*__REPORT_DATA__*/`` injection: the placeholder is
-    replaced with ``const DATA = {...};``.  The JSON was produced with
+    The embed uses ``/*__REPORT_DATA__*/`` injection: the placeholder in the
+    ``report-data`` JSON script block is replaced with the JSON object.  The JSON was produced with
     ``json.dumps(default=str)`` and has ``</`` escaped as ``<\\/``.
     Un-escape before parsing.
     """
-    match = re.search(r"const DATA = (\{.*?\});\s*\n", html, re.DOTALL)
-    assert match, "Could not find 'const DATA = ...' in report.html"
+    match = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert match, "Could not find the report-data JSON block in report.html"
     raw = match.group(1).replace("<\\/", "</")
     return json.loads(raw)  # type: ignore[no-any-return]
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 from typing import TYPE_CHECKING
+from xml.etree import ElementTree
 
 if TYPE_CHECKING:
     from pytest import Pytester
@@ -203,6 +204,30 @@ def test_junit_xml(pytester: Pytester) -> None:
     assert 'failures="1"' in xml_content
 
 
+def test_junit_xml_skip_reasons(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.skip(reason="no rig")
+        def test_setup_skip():
+            pass
+
+        def test_call_skip():
+            pytest.skip("lock lost")
+    """)
+    result = pytester.runpytest("--report-dir=reports")
+    result.assert_outcomes(skipped=2)
+
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    root = ElementTree.parse(run_dir / "junit.xml").getroot()
+    messages = {
+        tc.get("name"): tc.find("skipped").get("message")  # type: ignore[union-attr]
+        for tc in root.iter("testcase")
+    }
+    assert "no rig" in messages["test_setup_skip"]
+    assert "lock lost" in messages["test_call_skip"]
+
+
 def test_terminal_summary(pytester: Pytester) -> None:
     pytester.makepyfile("""
         def test_pass():
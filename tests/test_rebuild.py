@@ -0,0 +1,151 @@
+"""Tests for ``python -m pytest_reporter rebuild``."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree
+
+import pytest
+
+from pytest_reporter._cli import main
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._rebuild import read_ahead
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+_SUITE = """
+    import pytest
+
+    _attempts = []
+
+    @pytest.mark.parametrize("x", [1, 2])
+    def test_p(x, log, report_artifacts):
+        log.info(f"value {x}")
+        (report_artifacts / "out.svg").write_text(f"<svg>{x}</svg>")
+
+    def test_flaky():
+        _attempts.append(1)
+        assert len(_attempts) > 1
+
+    def test_fail(log):
+        log.warning("about to fail")
+        assert 1 == 2
+
+    @pytest.mark.skip(reason="not today")
+    def test_skip():
+        pass
+"""
+
+
+def _run(pytester: Pytester, *args: str) -> Path:
+    pytester.makepyfile(_SUITE)
+    pytester.runpytest("--report-dir=reports", "--report-retries=1", *args)
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    return run_dir
+
+
+def _runs(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    return {run["nodeid"]: run for test in data["tests"] for run in test["runs"]}
+
+
+def _junit(run_dir: Path) -> dict[str, tuple[str, ...]]:
+    root = ElementTree.parse(run_dir / "junit.xml").getroot()
+    return {tc.get("name", ""): tuple(child.tag for child in tc) for tc in root.iter("testcase")}
+
+
+def _assert_same_runs(got: dict[str, Any], expected: dict[str, Any]) -> None:
+    ours, theirs = _runs(got), _runs(expected)
+    assert ours.keys() == theirs.keys()
+    for nodeid, run in theirs.items():
+        for key in ("outcome", "params", "parametrize_id", "retries"):
+            assert ours[nodeid][key] == run[key], (nodeid, key)
+        assert ours[nodeid]["phases"].keys() == run["phases"].keys()
+        assert len(ours[nodeid]["retry_attempts"]) == len(run["retry_attempts"])
+
+
+@pytest.mark.parametrize("layout", ["tree", "journal"])
+def test_rebuild_matches_the_session_report(pytester: Pytester, layout: str) -> None:
+    run_dir = _run(pytester, f"--report-layout={layout}")
+    expected = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    expected_junit = _junit(run_dir)
+    (run_dir / "report.html").unlink()
+    (run_dir / "junit.xml").unlink()
+
+    assert main(["rebuild", str(run_dir), "--jobs=4"]) == 0
+
+    got = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    _assert_same_runs(got, expected)
+    assert len(got["session_log"]["entries"]) == len(expected["session_log"]["entries"])
+    assert len(got["blobs"]) == len(expected["blobs"]) == 2
+    assert _junit(run_dir) == expected_junit
+
+
+def test_rebuild_after_a_killed_session(pytester: Pytester) -> None:
+    run_dir = _run(pytester, "--report-artifacts=link", "--report-compress")
+    expected = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    expected_junit = _junit(run_dir)
+    # Everything written only at session end is gone.
+    for name in ("report.html", "junit.xml", "session.log.json"):
+        (run_dir / name).unlink()
+    for path in (run_dir / "tests").rglob("test.log.json"):
+        path.unlink()
+
+    assert main(["rebuild", str(run_dir), "--report-artifacts=link", "--report-compress"]) == 0
+
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    got = read_html_report(html)
+    _assert_same_runs(got, expected)
+    by_name = {t["aggregate"]["function_name"]: t["aggregate"] for t in got["tests"]}
+    assert by_name["test_p"]["passed"] == 2
+    assert by_name["test_flaky"]["retried_runs"] == 1
+    assert by_name["test_fail"]["failed"] == 1
+    assert by_name["test_skip"]["skipped"] == 1
+    assert got["session_log"]["entries"] == []
+    assert _junit(run_dir) == expected_junit
+    assert expected_junit["test_fail"] == ("properties", "failure", "system-out")
+
+
+def test_rebuild_leaves_the_run_directory_untouched(pytester: Pytester) -> None:
+    run_dir = _run(pytester)
+    first, second = sorted((run_dir / "tests").rglob("out.svg"))
+    # A byte-identical copy, as from a session that did not link duplicates.
+    second.write_bytes(first.read_bytes())
+    inodes = {p: p.stat().st_ino for p in (first, second)}
+
+    assert main(["rebuild", str(run_dir)]) == 0
+
+    assert {p: p.stat().st_ino for p in (first, second)} == inodes
+    data = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    assert len(data["blobs"]) == 1, "the copies are still embedded once"
+    assert data["log_search"]["terms"] and data["strings"]
+
+
+def test_read_ahead_stays_ahead_by_a_few_items() -> None:
+    started: list[int] = []
+
+    def work(i: int) -> int:
+        started.append(i)
+        return i * 2
+
+    results = read_ahead(work, range(1000), jobs=2)
+    assert next(results) == 0
+    assert len(started) <= 4, "items are read only a few ahead of the consumer"
+    assert list(results) == [i * 2 for i in range(1, 1000)]
+
+
+def test_parameters_json_records_the_test_id(pytester: Pytester) -> None:
+    run_dir = _run(pytester)
+    (params_path,) = (run_dir / "tests").rglob("test_flaky/*/parameters.json")
+    params = json.loads(params_path.read_text(encoding="utf-8"))
+    assert params["test_id"] == "test_parameters_json_records_the_test_id.py::test_flaky"
+
+
+def test_rebuild_requires_a_directory(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(["rebuild", str(tmp_path / "missing")])
+    assert exc_info.value.code == 2
+    assert "not a directory" in capsys.readouterr().err
@@ -145,6 +145,34 @@ def test_retry_procedure_per_attempt(pytester: Pytester) -> None:
     assert (test_dir / "retries" / "01" / "procedure.json").exists()
 
 
+def test_retry_attempt_keeps_its_logs_and_steps(pytester: Pytester) -> None:
+    """pytest_runtest_setup replaces the attempt's logger and tracker; both are captured."""
+    pytester.makepyfile("""
+        from pytest_reporter import step
+
+        _counter = 0
+
+        def test_flaky(log):
+            global _counter
+            _counter += 1
+            with step(f"Attempt {_counter}"):
+                log.info(f"attempt {_counter}")
+            assert _counter >= 2
+    """)
+    result = pytester.runpytest("--report-dir=reports", "--report-retries=1")
+    result.assert_outcomes(passed=1)
+
+    runs = list((pytester.path / "reports" / "runs").iterdir())
+    test_dir = runs[0] / "tests" / "test_retry_attempt_keeps_its_logs_and_steps.py" / "test_flaky"
+    retry_dir = test_dir / "default" / "retries" / "01"
+    call_log = json.loads((retry_dir / "call.log.json").read_text())
+    assert [e["msg"] for e in call_log["entries"]] == ["attempt 2"]
+    setup_log = json.loads((retry_dir / "setup.log.json").read_text())
+    assert setup_log["entries"] == []
+    procedure = json.loads((retry_dir / "procedure.json").read_text())
+    assert [s["description"] for s in procedure["steps"]] == ["Attempt 2"]
+
+
 def test_retry_skipped_not_retried(pytester: Pytester) -> None:
     pytester.makepyfile("""
         import pytest
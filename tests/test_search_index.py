@@ -0,0 +1,246 @@
+"""Prebuilt indexes behind the Tests-tab filter and the global log search."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING
+
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._search_index import build_log_index, build_search_index
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from pytest import Pytester
+
+
+def _lookup(index: dict, query: str) -> list[int]:  # type: ignore[type-arg]
+    """Mirror of the report's searchTests() for queries of 3+ characters."""
+    q = query.lower()
+    postings = [set(index["grams"].get(q[i : i + 3], ())) for i in range(len(q) - 2)]
+    candidates = set.intersection(*postings)
+    return sorted(i for i in candidates if q in index["text"][i])
+
+
+def test_index_lowercases_and_dedupes_fields() -> None:
+    index = build_search_index([["a.py::TestX::test_Y", "a.py", None, "a.py", ""]])
+    assert index["gram"] == 3
+    assert index["text"] == ["a.py::testx::test_y\na.py"]
+
+
+def test_postings_are_ascending_test_indices() -> None:
+    index = build_search_index([["alpha"], ["beta"], ["alphabet"]])
+    assert index["grams"]["alp"] == [0, 2]
+    assert index["grams"]["bet"] == [1, 2]
+    assert _lookup(index, "phab") == [2]
+    assert _lookup(index, "ALPHA") == [0, 2]
+
+
+def test_grams_do_not_span_fields() -> None:
+    index = build_search_index([["ab", "cd"]])
+    assert "b\nc" not in index["grams"]
+    assert _lookup(index, "abc") == []
+
+
+def test_report_embeds_markers_and_param_ids(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        class TestGroup:
+            @pytest.mark.slow
+            @pytest.mark.parametrize("mode", ["fast-path", "cold-cache"])
+            def test_load(self, mode):
+                pass
+
+        def test_other():
+            pass
+    """)
+    pytester.runpytest("--report-dir=reports")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    m = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert m
+    data = json.loads(m.group(1))
+    index = data["search"]
+    assert len(index["text"]) == len(data["tests"])
+    names = [t["aggregate"]["function_name"] for t in data["tests"]]
+    load = names.index("TestGroup::test_load")
+    assert _lookup(index, "slow") == [load]
+    assert _lookup(index, "cold-cache") == [load]
+    assert _lookup(index, "testgroup") == [load]
+    assert _lookup(index, "test_other") == [names.index("test_other")]
+    assert "function searchTests(q)" in html
+
+
+_SEARCH_PROBE = """
+// Type each query a key at a time, as the filter box does, and record what
+// the trigram index returns next to a full substring scan of the same text.
+const name = i => DATA.tests[i].aggregate.function_name;
+const out = {};
+QUERIES.forEach(query => {
+  for (let n = 1; n <= query.length; n++) {
+    const q = query.slice(0, n).toLowerCase();
+    const scan = SEARCH.text.flatMap((text, i) => text.includes(q) ? [name(i)] : []);
+    out[q] = {index: searchTests(q).map(name), scan};
+  }
+});
+_lastSearch = null;
+out.candidates = searchCandidates('start').map(name);
+searchTests('cold-cache');
+out.backspaced = searchTests('cold').map(name);
+filterTree('Cold-Cache');
+out.tree = treeView.rows.map(r => r.test ? r.test.aggregate.function_name : r.name);
+out
+"""
+
+
+def test_report_search_matches_a_substring_scan(
+    pytester: Pytester, report_js: Callable[[str, str], Any]
+) -> None:
+    pytester.makepyfile(
+        test_search="""
+        import pytest
+
+        class TestGroup:
+            @pytest.mark.slow
+            @pytest.mark.parametrize("mode", ["fast-path", "cold-cache"])
+            def test_load(self, mode):
+                pass
+
+        def test_cold_start():
+            pass
+
+        def test_other():
+            pass
+    """
+    )
+    pytester.runpytest("--report-dir=reports")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    # Each keystroke of "cold-cache" narrows the previous result; the other
+    # queries start over.
+    queries = ["cold-cache", "slow", "cold", "test_", "other", "zzz"]
+    out = report_js(html, f"const QUERIES = {json.dumps(queries)};" + _SEARCH_PROBE)
+
+    tree, backspaced, candidates = out.pop("tree"), out.pop("backspaced"), out.pop("candidates")
+    for q, result in out.items():
+        assert result["index"] == result["scan"], q
+    assert out["cold-cache"]["index"] == ["TestGroup::test_load"]
+    assert out["cold"]["index"] == ["TestGroup::test_load", "test_cold_start"]
+    assert out["slow"]["index"] == ["TestGroup::test_load"]
+    assert out["zzz"]["index"] == []
+    assert len(out["test_"]["index"]) == 3
+    # The trigram postings, not a scan, produce the candidates.
+    assert candidates == ["test_cold_start"]
+    # Deleting characters widens the result again.
+    assert backspaced == out["cold"]["index"]
+    # The tree shows the match under its class (the lone file is compacted away).
+    assert tree == ["TestGroup", "TestGroup::test_load"]
+
+
+def _log_lookup(index: dict, *words: str) -> list[list[object]]:  # type: ignore[type-arg]
+    """Mirror of the report's searchLogs() for whole words."""
+    postings = [set(index["postings"][index["terms"].index(w)]) for w in words]
+    return [index["locs"][loc] for loc in sorted(set.intersection(*postings))]
+
+
+def _phase(entries: list[dict], longrepr: str | None = None) -> dict:  # type: ignore[type-arg]
+    return {"entries": entries, "longrepr": longrepr}
+
+
+def test_log_index_locates_entries_and_tracebacks() -> None:
+    tests = [
+        {
+            "runs": [
+                {
+                    "phases": {
+                        "setup": _phase([{"msg": "power on"}]),
+                        "call": _phase(
+                            [
+                                {"msg": "PSU overcurrent on rail 3"},
+                                {"msg": "retrying", "exc": {"type": "TimeoutError", "msg": "psu"}},
+                            ],
+                            longrepr="E   AssertionError: rail collapsed",
+                        ),
+                    }
+                }
+            ]
+        },
+        {"runs": [{"phases": {"call": _phase([{"msg": "PSU nominal"}])}}]},
+    ]
+    index = build_log_index(tests)
+    assert index["terms"] == sorted(index["terms"])
+    assert _log_lookup(index, "psu") == [[0, 0, "call", 0], [0, 0, "call", 1], [1, 0, "call", 0]]
+    assert _log_lookup(index, "psu", "overcurrent") == [[0, 0, "call", 0]]
+    assert _log_lookup(index, "timeouterror") == [[0, 0, "call", 1]]
+    assert _log_lookup(index, "collapsed") == [[0, 0, "call", -1]]
+    assert "3" not in index["terms"], "single characters are not indexed"
+
+
+def test_log_index_caps_tokens_per_test() -> None:
+    words = " ".join(f"word{i}" for i in range(20))
+    tests = [
+        {"runs": [{"phases": {"call": _phase([{"msg": words}, {"msg": "late"}])}}]},
+        {"runs": [{"phases": {"call": _phase([{"msg": "late"}])}}]},
+    ]
+    index = build_log_index(tests, max_tokens_per_test=5)
+    assert [t for t in index["terms"] if t.startswith("word")] == sorted(
+        f"word{i}" for i in range(5)
+    )
+    assert _log_lookup(index, "late") == [[1, 0, "call", 0]]
+
+
+def test_report_embeds_log_index(pytester: Pytester) -> None:
+    pytester.makepyfile("""
+        def test_psu(log):
+            log.info("PSU overcurrent on rail 3")
+            assert False, "rail collapsed"
+
+        def test_ok(log):
+            log.info("all nominal")
+    """)
+    pytester.runpytest("--report-dir=reports")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    data = read_html_report(html)
+    # The log entry, then the traceback (which quotes the test source)
+    hit, in_traceback = _log_lookup(data["log_search"], "overcurrent")
+    assert in_traceback[3] == -1
+    test = data["tests"][hit[0]]
+    assert test["aggregate"]["function_name"] == "test_psu"
+    assert test["runs"][hit[1]]["phases"][hit[2]]["entries"][hit[3]]["msg"].startswith("PSU")
+    assert "function revealLogHit(loc)" in html
+    index_block = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert index_block
+    assert "log_search" not in json.loads(index_block.group(1)), "parsed before first paint"
+
+
+_LAZY_LOG_SEARCH_PROBE = """
+(async () => {
+  const atStart = {index: LOG_SEARCH, blocks: Object.keys(_blocks)};
+  const input = document.querySelector('.log-search').querySelector('.search-input');
+  input.value = 'overcurr';
+  input.dispatch('input');
+  await new Promise(resolve => setTimeout(resolve, 200));
+  return {atStart, blocks: Object.keys(_blocks).sort(),
+          count: document.querySelector('.log-search-count').textContent};
+})()
+"""
+
+
+def test_log_index_is_read_on_first_search(
+    pytester: Pytester, report_js: Callable[[str, str], Any]
+) -> None:
+    pytester.makepyfile("""
+        def test_psu(log):
+            log.info("PSU overcurrent on rail 3")
+    """)
+    pytester.runpytest("--report-dir=reports", "--report-compress")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    out = report_js((run_dir / "report.html").read_text(encoding="utf-8"), _LAZY_LOG_SEARCH_PROBE)
+    # Neither inflated nor parsed before the log search is used.
+    assert out["atStart"] == {"index": None, "blocks": []}
+    assert out["blocks"] == ["report-log-search", "report-shards"]
+    assert out["count"] == "1 match in 1 test"
@@ -0,0 +1,168 @@
+"""Tests for ``python -m pytest_reporter serve`` and the run directory reader."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import re
+import threading
+import urllib.error
+import urllib.request
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pytest_reporter._cli import main
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._run_reader import RunReader
+from pytest_reporter._server import make_server
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+    from pytest import Pytester
+
+_SUITE = """
+    import pytest
+
+    _attempts = []
+
+    @pytest.mark.parametrize("x", [1, 2])
+    def test_p(x, log, report_artifacts):
+        log.info(f"value {x}")
+        (report_artifacts / "out.txt").write_text(f"x={x}")
+
+    def test_flaky():
+        _attempts.append(1)
+        assert len(_attempts) > 1
+"""
+
+
+def _run(pytester: Pytester, *args: str) -> Path:
+    pytester.makepyfile(_SUITE)
+    pytester.runpytest("--report-dir=reports", "--report-retries=1", *args)
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    return run_dir
+
+
+def _by_nodeid(tests: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    return {run["nodeid"]: run for test in tests for run in test["runs"]}
+
+
+@pytest.mark.parametrize("layout", ["tree", "journal"])
+def test_reader_matches_the_session_report(pytester: Pytester, layout: str) -> None:
+    run_dir = _run(pytester, f"--report-layout={layout}", "--report-artifacts=link")
+    reader = RunReader(run_dir)
+    tests = []
+    for test_dir, test in reader.index():
+        for run, detail in zip(test["runs"], reader.read_runs(test_dir, test)):
+            run.update(detail)
+        tests.append(test)
+
+    expected = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    assert [t["base_nodeid"] for t in tests] == sorted(t["base_nodeid"] for t in expected["tests"])
+    ours, theirs = _by_nodeid(tests), _by_nodeid(expected["tests"])
+    assert ours.keys() == theirs.keys()
+    keys = ("outcome", "params", "parametrize_id", "procedure", "artifacts", "retry_attempts")
+    for nodeid, run in theirs.items():
+        for key in (*keys, "retries"):
+            assert ours[nodeid][key] == run[key], (nodeid, key)
+        for when, phase in run["phases"].items():
+            got = ours[nodeid]["phases"][when]
+            assert got["outcome"] == phase["outcome"]
+            assert [e["msg"] for e in got["entries"]] == [e["msg"] for e in phase["entries"]]
+    (flaky,) = [r for r in ours.values() if r["nodeid"].endswith("test_flaky")]
+    assert len(flaky["retry_attempts"]) == 1
+
+
+@contextlib.contextmanager
+def _serving(run_dir: Path) -> Iterator[str]:
+    server = make_server(run_dir, port=0, cache_size=2)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def served(pytester: Pytester) -> Iterator[tuple[str, Path]]:
+    run_dir = _run(pytester)
+    with _serving(run_dir) as base:
+        yield base, run_dir
+
+
+def _get(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=10) as resp:
+        return resp.read()  # type: ignore[no-any-return]
+
+
+def test_server_embeds_only_the_index(served: tuple[str, Path]) -> None:
+    base, _ = served
+    html = _get(base + "/").decode()
+    m = re.search(r'id="report-data">(.*?)</script>', html, re.DOTALL)
+    assert m
+    data = json.loads(m.group(1))
+    assert data["shard_url"] == "shards/"
+    assert 'id="report-shards"></script>' in html
+    assert all("phases" not in run for t in data["tests"] for run in t["runs"])
+
+    names = [t["aggregate"]["function_name"] for t in data["tests"]]
+    p = data["tests"][names.index("test_p")]
+    details = json.loads(_get(f"{base}/shards/{p['shard']}"))
+    assert [d["phases"]["call"]["entries"][0]["msg"] for d in details] == ["value 1", "value 2"]
+    artifact = details[1]["artifacts"][0]
+    assert _get(f"{base}/{artifact['href']}") == b"x=2"
+
+
+def test_served_page_has_no_log_search(
+    served: tuple[str, Path], report_js: Callable[[str, str], Any]
+) -> None:
+    base, run_dir = served
+    probe = """({
+      index: !!document.getElementById('report-log-search').textContent,
+      box: !!document.querySelector('.log-search'),
+    })"""
+    # The served page has no log index, so it must not offer a search box that
+    # answers every query with "No matches".
+    assert report_js(_get(base + "/").decode(), probe) == {"index": False, "box": False}
+    session_page = (run_dir / "report.html").read_text(encoding="utf-8")
+    assert report_js(session_page, probe) == {"index": True, "box": True}
+
+
+def test_served_page_finds_tests_by_parametrize_id(
+    pytester: Pytester, report_js: Callable[[str, str], Any]
+) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.parametrize("rail", ["rail-alpha", "rail-beta"])
+        def test_psu(rail):
+            pass
+
+        def test_other():
+            pass
+    """)
+    pytester.runpytest("--report-dir=reports")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    probe = "searchTests('alpha').map(i => DATA.tests[i].aggregate.function_name)"
+    with _serving(run_dir) as base:
+        assert report_js(_get(base + "/").decode(), probe) == ["test_psu"]
+
+
+def test_server_rejects_unknown_shards_and_paths(served: tuple[str, Path]) -> None:
+    base, _ = served
+    for path in ("/shards/99", "/shards/x", "/tests/../../../../etc/passwd"):
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            _get(base + path)
+        assert exc_info.value.code == 404
+
+
+def test_serve_requires_a_directory(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(["serve", str(tmp_path / "missing")])
+    assert exc_info.value.code == 2
+    assert "not a directory" in capsys.readouterr().err
@@ -0,0 +1,132 @@
+"""Payload string table: repeated log fields and tracebacks stored once."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._html_builder._payload import PayloadWriter
+from pytest_reporter._string_table import StringTable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest import Pytester
+
+
+def _resolve(strings: list[object], entry: dict) -> dict:  # type: ignore[type-arg]
+    """Mirror of the report's resolveEntry()."""
+    out = dict(entry)
+    for key in ("level", "source"):
+        if isinstance(out.get(key), int):
+            out[key] = strings[out[key]]
+    for key in ("t", "last_t"):
+        if isinstance(out.get(key), list):
+            out[key] = strings[out[key][0]] + out[key][1]
+    return out
+
+
+def test_entries_share_refs_and_round_trip() -> None:
+    table = StringTable()
+    entries = [
+        {"t": "2026-01-01T12:34:56.000001Z", "level": "INFO", "source": ["a", "b"], "msg": "x"},
+        {"t": "2026-01-01T12:34:57.500000Z", "level": "INFO", "source": ["a", "b"], "msg": "y"},
+        {"t": "2026-01-01T12:35:00.000000Z", "level": "ERROR", "source": [], "msg": "z"},
+        {
+            "t": "2026-01-01T12:35:01.000000Z",
+            "last_t": "2026-01-01T12:35:09.000000Z",
+            "repeat": 9,
+            "level": "INFO",
+            "source": [],
+            "msg": "waiting",
+        },
+    ]
+    interned = table.entries(entries)
+    assert interned[0]["level"] == interned[1]["level"]
+    assert interned[0]["source"] == interned[1]["source"]
+    assert interned[0]["t"][0] == interned[1]["t"][0] != interned[2]["t"][0]
+    assert interned[3]["last_t"][0] == interned[2]["t"][0]
+    assert [_resolve(table.values, e) for e in interned] == entries
+    assert entries[0]["level"] == "INFO", "input entries are not modified"
+
+
+def test_unexpected_values_are_left_alone() -> None:
+    table = StringTable()
+    entry = {"level": None, "source": ["a", 1], "t": "short", "msg": "m"}
+    assert table.entry(entry) == entry
+    assert table.entries(None) is None
+    assert table.phase("garbage") == "garbage"
+    assert table.values == []
+
+
+def test_identical_tracebacks_are_stored_once() -> None:
+    table = StringTable()
+    call = {"longrepr": "E   boom", "entries": []}
+    run = {"phases": {"call": call}}
+    attempt = {"phases": {"call": {"longrepr": "E   boom", "entries": []}}}
+    (first,) = table.runs([{**run, "retry_attempts": [attempt]}])
+    (second,) = table.runs([run])
+    assert table.values == ["E   boom"]
+    assert first["retry_attempts"][0]["phases"]["call"]["longrepr"] == 0
+    assert second["phases"]["call"]["longrepr"] == 0
+    assert call["longrepr"] == "E   boom", "phase dicts are copied"
+    assert run["phases"]["call"] is call, "runs are copied"
+    assert table.runs([None, {"phases": "x"}]) == [None, {"phases": "x"}]
+
+
+def test_shards_are_interned_as_they_are_written() -> None:
+    phase = {"longrepr": "E   boom", "entries": [{"level": "INFO", "msg": "m"}]}
+    tests = [{"runs": [{"outcome": "failed", "phases": {"call": phase}}]} for _ in range(2)]
+    data = {"tests": tests, "strings": StringTable()}
+    out: list[str] = []
+    PayloadWriter(out.append).report_shards(data)
+    *lines, trailer = "".join(out).split("\n")
+    assert json.loads(trailer) == {"strings": ["E   boom", "INFO"]}
+    assert [json.loads(line) for line in lines] == [
+        [{"phases": {"call": {"longrepr": 0, "entries": [{"level": 1, "msg": "m"}]}}}]
+    ] * 2
+    assert tests[0]["runs"][0]["phases"]["call"] is phase, "the collected data is not copied"
+    assert phase["longrepr"] == "E   boom"
+
+    index: list[str] = []
+    PayloadWriter(index.append).report_index(data)
+    assert "strings" not in json.loads("".join(index))
+
+
+_RESOLVE_PROBE = """
+(async () => {
+  const test = DATA.tests.find(t => t.aggregate.function_name === 'test_same_failure');
+  await new Promise(resolve => loadShard(test, resolve) && resolve());
+  const phase = resolvePhase(test.runs[0].phases.call);
+  return {level: phase.entries[0].level, t: phase.entries[0].t, longrepr: phase.longrepr};
+})()
+"""
+
+
+def test_report_payload_is_interned(
+    pytester: Pytester, report_js: Callable[[str, str], Any]
+) -> None:
+    pytester.makepyfile("""
+        import pytest
+
+        @pytest.mark.parametrize("i", range(3))
+        def test_same_failure(log, i):
+            log.info("probing")
+            assert False
+    """)
+    pytester.runpytest("--report-dir=reports", "--report-compress")
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    html = (run_dir / "report.html").read_text(encoding="utf-8")
+    data = read_html_report(html)
+    strings = data["strings"]
+    phases = [t["runs"][0]["phases"]["call"] for t in data["tests"]]
+    (entry,) = phases[0]["entries"]
+    assert strings[entry["level"]] == "INFO"
+    assert _resolve(strings, entry)["t"].endswith("Z")
+    assert all(isinstance(p["longrepr"], int) for p in phases)
+
+    resolved = report_js(html, _RESOLVE_PROBE)
+    assert resolved["level"] == "INFO"
+    assert resolved["t"] == _resolve(strings, entry)["t"]
+    assert "AssertionError" in resolved["longrepr"]
@@ -0,0 +1,50 @@
+"""Tests for the ``01_latest`` refresh."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pytest_reporter._symlinks import update_latest_copy
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _make_run(reports: Path, name: str, content: str) -> Path:
+    run_dir = reports / "runs" / name
+    (run_dir / "tests" / "t").mkdir(parents=True)
+    (run_dir / "report.html").write_text(content, encoding="utf-8")
+    (run_dir / "tests" / "t" / "call.log.json").write_text("{}", encoding="utf-8")
+    return run_dir
+
+
+def test_latest_is_hardlinked_to_run(tmp_path: Path) -> None:
+    run_dir = _make_run(tmp_path, "r1", "one")
+    update_latest_copy(tmp_path, run_dir)
+
+    latest = tmp_path / "01_latest"
+    assert (latest / "report.html").read_text(encoding="utf-8") == "one"
+    assert (latest / "report.html").stat().st_ino == (run_dir / "report.html").stat().st_ino
+    assert (latest / "tests" / "t" / "call.log.json").is_file()
+
+
+def test_latest_is_swapped_and_leftovers_cleaned(tmp_path: Path) -> None:
+    update_latest_copy(tmp_path, _make_run(tmp_path, "r1", "one"))
+    (tmp_path / ".01_latest.tmp").mkdir()  # simulate an interrupted refresh
+    (tmp_path / "01_latest" / "stale.txt").write_text("x", encoding="utf-8")
+
+    update_latest_copy(tmp_path, _make_run(tmp_path, "r2", "two"))
+
+    latest = tmp_path / "01_latest"
+    assert (latest / "report.html").read_text(encoding="utf-8") == "two"
+    assert not (latest / "stale.txt").exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["01_latest", "runs"]
+    assert (tmp_path / "runs" / "r1" / "report.html").read_text(encoding="utf-8") == "one"
+
+
+def test_legacy_symlink_latest_is_replaced(tmp_path: Path) -> None:
+    run_dir = _make_run(tmp_path, "r1", "one")
+    (tmp_path / "01_latest").symlink_to(run_dir)
+    update_latest_copy(tmp_path, run_dir)
+    assert not (tmp_path / "01_latest").is_symlink()
+    assert (tmp_path / "01_latest" / "report.html").is_file()
@@ -0,0 +1,128 @@
+"""Tests for pytest-xdist support (worker capture, controller merge)."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pytest_reporter._html_builder import read_html_report
+from pytest_reporter._xdist import receive_worker_output
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import Pytester
+
+_CONFTEST = """
+    import pytest
+
+    @pytest.fixture(scope="session", autouse=True)
+    def bench(session_log, report_metadata):
+        session_log.info("bench up")
+        report_metadata.setdefault("Bench", {})["rig"] = "A"
+"""
+
+_SUITE = """
+    import enum
+
+    import pytest
+
+    from pytest_reporter import step
+
+    class Mode(enum.Enum):
+        FAST = 1
+
+    _attempts = []
+
+    @pytest.mark.parametrize("mode", [Mode.FAST, 2])
+    def test_p(mode, log, report_artifacts):
+        with step("measure"):
+            log.info(f"mode {mode}")
+        log.table([{"a": 1}], name="readings")
+        (report_artifacts / "out.txt").write_text(str(mode))
+
+    def test_flaky(log):
+        _attempts.append(1)
+        log.warning(f"attempt {len(_attempts)}")
+        assert len(_attempts) > 1
+
+    def test_fail():
+        assert False
+"""
+
+
+def _xdist_run(pytester: Pytester, *args: str) -> tuple[pytest.RunResult, Path]:
+    pytest.importorskip("xdist")
+    pytester.makeconftest(_CONFTEST)
+    pytester.makepyfile(_SUITE)
+    result = pytester.runpytest_subprocess(
+        "-n", "2", "-p", "no:cacheprovider", "--report-dir=reports", *args
+    )
+    (run_dir,) = (pytester.path / "reports" / "runs").iterdir()
+    return result, run_dir
+
+
+def _runs(run_dir: Path) -> dict[str, dict[str, Any]]:
+    data = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    return {run["nodeid"].split("::")[-1]: run for t in data["tests"] for run in t["runs"]}
+
+
+def test_worker_results_reach_the_report(pytester: Pytester) -> None:
+    result, run_dir = _xdist_run(pytester, "--report-retries=1")
+    result.assert_outcomes(passed=3, failed=1)
+
+    runs = _runs(run_dir)
+    assert list(runs) == ["test_p[Mode.FAST]", "test_p[2]", "test_flaky", "test_fail"]
+    fast = runs["test_p[Mode.FAST]"]
+    assert fast["params"] == {"mode": {"type": "Mode", "value": "Mode.FAST"}}
+    assert [e["msg"] for e in fast["phases"]["call"]["entries"]] == [
+        "mode Mode.FAST",
+        "Table: readings",
+    ]
+    assert [s["description"] for s in fast["procedure"]["steps"]] == ["measure"]
+    assert sorted(a["name"] for a in fast["artifacts"]) == ["out.txt", "readings.html"]
+
+    flaky = runs["test_flaky"]
+    assert flaky["outcome"] == "passed"
+    assert flaky["retries"]["history"] == ["failed", "passed"]
+    assert len(flaky["retry_attempts"]) == 1
+    assert runs["test_fail"]["outcome"] == "failed"
+
+    aggregate = json.loads(
+        (
+            run_dir
+            / "tests"
+            / "test_worker_results_reach_the_report.py"
+            / "test_p"
+            / "test.log.json"
+        ).read_text(encoding="utf-8")
+    )
+    assert (aggregate["total_runs"], aggregate["passed"]) == (2, 2)
+    assert 'tests="4" failures="1"' in (run_dir / "junit.xml").read_text(encoding="utf-8")
+
+
+def test_worker_session_state_is_merged(pytester: Pytester) -> None:
+    _, run_dir = _xdist_run(pytester)
+    data = read_html_report((run_dir / "report.html").read_text(encoding="utf-8"))
+    assert data["system_metadata"] == {"Bench": {"rig": "A"}}
+    session_log = json.loads((run_dir / "session.log.json").read_text(encoding="utf-8"))
+    # The session fixture ran once per worker.
+    assert [e["msg"] for e in session_log["entries"]] == ["bench up", "bench up"]
+
+
+def test_journal_layout_falls_back_to_tree(pytester: Pytester) -> None:
+    result, run_dir = _xdist_run(pytester, "--report-layout=journal")
+    result.stderr.fnmatch_lines(["*--report-layout=journal is not supported with pytest-xdist*"])
+    assert not (run_dir / "run.jsonl").exists()
+    assert len(_runs(run_dir)) == 4
+
+
+def test_missing_worker_output_is_warned() -> None:
+    class _Reporter:
+        _worker_outputs: list[dict[str, Any]] = []
+
+    with pytest.warns(UserWarning, match="xdist worker gw1 sent no results"):
+        receive_worker_output(_Reporter(), "gw1", None)  # type: ignore[arg-type]
+    assert _Reporter._worker_outputs == []